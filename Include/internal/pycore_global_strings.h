@@ -352,6 +352,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(co_stacksize)
         STRUCT_FOR_ID(co_varnames)
         STRUCT_FOR_ID(code)
+        STRUCT_FOR_ID(columnar)
         STRUCT_FOR_ID(command)
         STRUCT_FOR_ID(comment_factory)
         STRUCT_FOR_ID(compile_mode)
@@ -556,6 +557,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(maxvalue)
         STRUCT_FOR_ID(memLevel)
         STRUCT_FOR_ID(memlimit)
+        STRUCT_FOR_ID(memo)
         STRUCT_FOR_ID(message)
         STRUCT_FOR_ID(metaclass)
         STRUCT_FOR_ID(metadata)
@@ -751,6 +753,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(txt)
         STRUCT_FOR_ID(type)
         STRUCT_FOR_ID(type_params)
+        STRUCT_FOR_ID(types)
         STRUCT_FOR_ID(tz)
         STRUCT_FOR_ID(tzinfo)
         STRUCT_FOR_ID(tzname)
@@ -861,6 +861,7 @@ extern "C" {
     INIT_ID(co_stacksize), \
     INIT_ID(co_varnames), \
     INIT_ID(code), \
+    INIT_ID(columnar), \
     INIT_ID(command), \
     INIT_ID(comment_factory), \
     INIT_ID(compile_mode), \
@@ -1065,6 +1066,7 @@ extern "C" {
     INIT_ID(maxvalue), \
     INIT_ID(memLevel), \
     INIT_ID(memlimit), \
+    INIT_ID(memo), \
     INIT_ID(message), \
     INIT_ID(metaclass), \
     INIT_ID(metadata), \
@@ -1260,6 +1262,7 @@ extern "C" {
     INIT_ID(txt), \
     INIT_ID(type), \
     INIT_ID(type_params), \
+    INIT_ID(types), \
     INIT_ID(tz), \
     INIT_ID(tzinfo), \
     INIT_ID(tzname), \
@@ -20,6 +20,7 @@
 import functools
 import heapq
 import itertools
+import math
 import os
 import socket
 import stat
@@ -45,6 +46,7 @@
 from . import sslproto
 from . import staggered
 from . import tasks
+from . import timerwheel
 from . import timeouts
 from . import transports
 from . import trsock
@@ -423,6 +425,7 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_wheel = None
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -498,6 +501,52 @@ def get_task_factory(self):
         """Return a task factory, or None if the default one is in use."""
         return self._task_factory
 
+    def set_timer_wheel(self, resolution):
+        """Set how loop.call_at() and loop.call_later() schedule callbacks.
+
+        If resolution is None, callbacks are kept in a binary heap (the
+        default).  Otherwise, they are scheduled in a hierarchical timer
+        wheel in which scheduling and cancelling a callback take
+        constant time: callbacks may then be called up to resolution
+        seconds late.
+
+        Callbacks which are already scheduled are moved to the new
+        schedule.
+        """
+        if resolution is not None:
+            if not (math.isfinite(resolution) and resolution > 0):
+                raise ValueError('resolution must be a positive finite '
+                                 'number or None')
+            wheel = timerwheel.TimerWheel(resolution, self.time())
+        else:
+            wheel = None
+
+        if self._timer_wheel is not None:
+            handles = self._timer_wheel.handles()
+        else:
+            handles = []
+            for handle in self._scheduled:
+                if handle._cancelled:
+                    handle._scheduled = False
+                else:
+                    handles.append(handle)
+        self._timer_cancelled_count = 0
+        self._timer_wheel = wheel
+        if wheel is not None:
+            self._scheduled = []
+            for handle in handles:
+                wheel.insert(handle)
+        else:
+            heapq.heapify(handles)
+            self._scheduled = handles
+
+    def get_timer_wheel(self):
+        """Return the resolution of the timer wheel, or None if it is
+        not in use."""
+        if self._timer_wheel is None:
+            return None
+        return self._timer_wheel.resolution
+
     def _make_socket_transport(self, sock, protocol, waiter=None, *,
                                extra=None, server=None):
         """Create socket transport."""
@@ -745,6 +794,8 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.clear()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -812,7 +863,10 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is None:
+            heapq.heappush(self._scheduled, timer)
+        else:
+            self._timer_wheel.insert(timer)
         timer._scheduled = True
         return timer
 
@@ -1943,7 +1997,11 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if self._timer_wheel is None:
+                self._timer_cancelled_count += 1
+            else:
+                self._timer_wheel.remove(handle)
+                handle._scheduled = False
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1986,6 +2044,9 @@ def _run_once(self):
                 timeout = MAXIMUM_SELECT_TIMEOUT
             elif timeout < 0:
                 timeout = 0
+        elif self._timer_wheel:
+            timeout = min(self._timer_wheel.timeout(self.time()),
+                          MAXIMUM_SELECT_TIMEOUT)
 
         event_list = self._selector.select(timeout)
         self._process_events(event_list)
@@ -2001,6 +2062,10 @@ def _run_once(self):
             handle = heapq.heappop(self._scheduled)
             handle._scheduled = False
             self._ready.append(handle)
+        if self._timer_wheel:
+            for handle in self._timer_wheel.expire(end_time):
+                handle._scheduled = False
+                self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
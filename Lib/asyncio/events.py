@@ -606,6 +606,14 @@ def set_task_factory(self, factory):
     def get_task_factory(self):
         raise NotImplementedError
 
+    # Timer scheduling.
+
+    def set_timer_wheel(self, resolution):
+        raise NotImplementedError
+
+    def get_timer_wheel(self):
+        raise NotImplementedError
+
     # Error handlers.
 
     def get_exception_handler(self):
@@ -177,6 +177,10 @@ def get_write_buffer_size(self):
             size += len(self._buffer)
         return size
 
+    def get_write_buffer_count(self):
+        # The pending write and the buffer which backs up behind it
+        return bool(self._pending_write) + bool(self._buffer)
+
 
 class _ProactorReadPipeTransport(_ProactorBasePipeTransport,
                                  transports.ReadTransport):
@@ -479,6 +483,9 @@ def _set_extra(self, sock):
     def get_write_buffer_size(self):
         return self._buffer_size
 
+    def get_write_buffer_count(self):
+        return len(self._buffer)
+
     def abort(self):
         self._force_close(None)
 
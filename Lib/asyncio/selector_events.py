@@ -786,6 +786,7 @@ def __init__(self, loop, sock, protocol, extra=None, server=None):
 
         self._server = server
         self._buffer = collections.deque()
+        self._buffer_size = 0
         self._conn_lost = 0  # Set when call to connection_lost scheduled.
         self._closing = False  # Set when close() called.
         self._paused = False  # Set when pause_reading() called
@@ -890,6 +891,7 @@ def _force_close(self, exc):
             return
         if self._buffer:
             self._buffer.clear()
+            self._buffer_size = 0
             self._loop._remove_writer(self._sock_fd)
         if not self._closing:
             self._closing = True
@@ -912,7 +914,10 @@ def _call_connection_lost(self, exc):
                 self._server = None
 
     def get_write_buffer_size(self):
-        return sum(map(len, self._buffer))
+        return self._buffer_size
+
+    def get_write_buffer_count(self):
+        return len(self._buffer)
 
     def _add_reader(self, fd, callback, *args):
         if not self.is_reading():
@@ -1061,6 +1066,10 @@ def write(self, data):
             self._conn_lost += 1
             return
 
+        if isinstance(data, memoryview):
+            # The buffer size and sendmsg() count bytes, not items.
+            data = data.cast('B')
+
         if not self._buffer:
             # Optimization: try to send now.
             try:
@@ -1081,6 +1090,7 @@ def write(self, data):
 
         # Add it to the buffer.
         self._buffer.append(data)
+        self._buffer_size += len(data)
         self._maybe_pause_protocol()
 
     def _get_sendmsg_buffer(self):
@@ -1100,6 +1110,7 @@ def _write_sendmsg(self):
         except BaseException as exc:
             self._loop._remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
@@ -1116,6 +1127,7 @@ def _write_sendmsg(self):
 
     def _adjust_leftover_buffer(self, nbytes: int) -> None:
         buffer = self._buffer
+        self._buffer_size -= nbytes
         while nbytes:
             b = buffer.popleft()
             b_len = len(b)
@@ -1129,19 +1141,21 @@ def _write_send(self):
         assert self._buffer, 'Data should not be empty'
         if self._conn_lost:
             return
+        buffer = self._buffer.popleft()
         try:
-            buffer = self._buffer.popleft()
             n = self._sock.send(buffer)
             if n != len(buffer):
                 # Not all data was written
                 self._buffer.appendleft(buffer[n:])
+            self._buffer_size -= n
         except (BlockingIOError, InterruptedError):
-            pass
+            self._buffer.appendleft(buffer)
         except (SystemExit, KeyboardInterrupt):
             raise
         except BaseException as exc:
             self._loop._remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
@@ -1170,11 +1184,14 @@ def writelines(self, list_of_data):
             raise RuntimeError('unable to writelines; sendfile is in progress')
         if not list_of_data:
             return
-        self._buffer.extend([memoryview(data) for data in list_of_data])
+        buffers = [memoryview(data).cast('B') for data in list_of_data]
+        self._buffer.extend(buffers)
+        self._buffer_size += sum(map(len, buffers))
         self._write_ready()
         # If the entire buffer couldn't be written, register a write handler
         if self._buffer:
             self._loop._add_writer(self._sock_fd, self._write_ready)
+            self._maybe_pause_protocol()
 
     def can_write_eof(self):
         return True
@@ -1210,7 +1227,6 @@ def __init__(self, loop, sock, protocol, address=None,
                  waiter=None, extra=None):
         super().__init__(loop, sock, protocol, extra)
         self._address = address
-        self._buffer_size = 0
         self._loop.call_soon(self._protocol.connection_made, self)
         # only start reading when connection_made() has been called
         self._loop.call_soon(self._add_reader,
@@ -1220,9 +1236,6 @@ def __init__(self, loop, sock, protocol, address=None,
             self._loop.call_soon(futures._set_result_unless_cancelled,
                                  waiter, None)
 
-    def get_write_buffer_size(self):
-        return self._buffer_size
-
     def _read_ready(self):
         if self._conn_lost:
             return
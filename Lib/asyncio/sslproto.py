@@ -173,6 +173,10 @@ def get_write_buffer_size(self):
         """Return the current size of the write buffers."""
         return self._ssl_protocol._get_write_buffer_size()
 
+    def get_write_buffer_count(self):
+        """Return the number of buffers in the write buffers."""
+        return self._ssl_protocol._get_write_buffer_count()
+
     def set_read_buffer_limits(self, high=None, low=None):
         """Set the high- and low-water limits for read flow control.
 
@@ -849,6 +853,10 @@ def _control_app_writing(self):
     def _get_write_buffer_size(self):
         return self._outgoing.pending + self._write_buffer_size
 
+    def _get_write_buffer_count(self):
+        # Encrypted data waiting in the outgoing BIO counts as one buffer
+        return bool(self._outgoing.pending) + len(self._write_backlog)
+
     def _set_write_buffer_limits(self, high=None, low=None):
         high, low = add_flowcontrol_defaults(
             high, low, constants.FLOW_CONTROL_HIGH_WATER_SSL_WRITE)
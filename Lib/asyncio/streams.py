@@ -5,6 +5,7 @@
 import collections
 import socket
 import sys
+import threading
 import warnings
 import weakref
 
@@ -21,6 +22,12 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_RECV_BUFFER_SIZE = 2 ** 16  # 64 KiB
+
+# The buffers _BufferedStreamReaderProtocol receives data into.  Data is
+# moved out of them before the transport's read callback returns, so the
+# protocols of all the event loops running in a thread can share one.
+_recv_buffers = threading.local()
 
 
 async def open_connection(host=None, port=None, *,
@@ -44,7 +51,7 @@ async def open_connection(host=None, port=None, *,
     """
     loop = events.get_running_loop()
     reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -77,8 +84,8 @@ async def start_server(client_connected_cb, host=None, port=None, *,
 
     def factory():
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, client_connected_cb,
+                                                 loop=loop)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -93,7 +100,7 @@ async def open_unix_connection(path=None, *,
         loop = events.get_running_loop()
 
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
@@ -106,8 +113,8 @@ async def start_unix_server(client_connected_cb, path=None, *,
 
         def factory():
             reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            protocol = _BufferedStreamReaderProtocol(
+                reader, client_connected_cb, loop=loop)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -306,6 +313,44 @@ def __del__(self):
                 closed.exception()
 
 
+class _BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                    protocols.BufferedProtocol):
+    """StreamReaderProtocol receiving data with the BufferedProtocol API.
+
+    Data is received into a buffer shared by the thread and moved into the
+    StreamReader's buffer, without creating a bytes object per read.  If
+    a readinto() call is waiting for data on an empty StreamReader, data is
+    received directly into the buffer passed to readinto().
+    """
+
+    _read_target = False
+
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is not None:
+            target = reader._get_read_target()
+            if target is not None:
+                self._read_target = True
+                return target
+        self._read_target = False
+        try:
+            return _recv_buffers.view
+        except AttributeError:
+            view = _recv_buffers.view = memoryview(
+                bytearray(_RECV_BUFFER_SIZE))
+            return view
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        if reader is None:
+            return
+        if self._read_target:
+            self._read_target = False
+            reader._read_target_updated(nbytes)
+        else:
+            reader.feed_data(_recv_buffers.view[:nbytes])
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -431,6 +476,10 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         self._exception = None
         self._transport = None
         self._paused = False
+        # The buffer of a readinto() call waiting for data, and the number
+        # of bytes received directly into it.
+        self._read_target = None
+        self._read_target_nbytes = 0
         if self._loop.get_debug():
             self._source_traceback = format_helpers.extract_stack(
                 sys._getframe(1))
@@ -512,6 +561,23 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
+    def _get_read_target(self):
+        """Return the buffer of a readinto() call waiting for data, if data
+        can be received directly into it, else None."""
+        waiter = self._waiter
+        if (self._read_target is not None and not self._buffer and
+                waiter is not None and not waiter.done()):
+            return self._read_target
+        return None
+
+    def _read_target_updated(self, nbytes):
+        """Called when nbytes were received into the buffer returned by
+        _get_read_target()."""
+        assert not self._eof, '_read_target_updated after feed_eof'
+        self._read_target = None
+        self._read_target_nbytes = nbytes
+        self._wakeup_waiter()
+
     async def _wait_for_data(self, func_name):
         """Wait until feed_data() or feed_eof() is called.
 
@@ -777,6 +843,52 @@ async def readexactly(self, n):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into buffer.
+
+        Return the number of bytes read, as soon as at least 1 byte is
+        available.  If EOF was received and the internal buffer is empty,
+        return 0.
+
+        buffer must be a writable bytes-like object.  When the internal
+        buffer is empty, the data may be received directly into buffer,
+        without being copied.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as view, view.cast('B') as target:
+            if not target:
+                return 0
+
+            if not self._buffer and not self._eof:
+                self._read_target = target
+                self._read_target_nbytes = 0
+                try:
+                    await self._wait_for_data('readinto')
+                except BaseException:
+                    # Don't lose the data already received into target,
+                    # if the task was cancelled before it resumed.
+                    self._buffer[:0] = target[:self._read_target_nbytes]
+                    raise
+                finally:
+                    self._read_target = None
+                    nbytes = self._read_target_nbytes
+                    self._read_target_nbytes = 0
+                if nbytes:
+                    return nbytes
+
+            nbytes = min(len(target), len(self._buffer))
+            with memoryview(self._buffer) as data:
+                target[:nbytes] = data[:nbytes]
+            del self._buffer[:nbytes]
+
+        self._maybe_resume_transport()
+        return nbytes
+
     def __aiter__(self):
         return self
 
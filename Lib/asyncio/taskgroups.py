@@ -21,11 +21,17 @@ class TaskGroup:
 
     All tasks are awaited when the context manager exits.
 
+    If *eager_start* is true, tasks created by create_task() start
+    executing immediately, like tasks created by
+    `asyncio.eager_task_factory`: a task whose coroutine completes
+    without suspending is done when create_task() returns.
+
     Any exceptions other than `asyncio.CancelledError` raised within
     a task will cancel all remaining tasks and wait for them to exit.
     The exceptions are then combined and raised as an `ExceptionGroup`.
     """
-    def __init__(self):
+    def __init__(self, *, eager_start=False):
+        self._eager_start = eager_start
         self._entered = False
         self._exiting = False
         self._aborting = False
@@ -162,10 +168,9 @@ def create_task(self, coro, *, name=None, context=None):
         if self._aborting:
             coro.close()
             raise RuntimeError(f"TaskGroup {self!r} is shutting down")
-        if context is None:
-            task = self._loop.create_task(coro, name=name)
-        else:
-            task = self._loop.create_task(coro, name=name, context=context)
+        task = tasks._create_task(self._loop, coro, name=name,
+                                  context=context,
+                                  eager_start=self._eager_start)
 
         # optimization: Immediately call the done callback if the task is
         # already done (e.g. if the coro was able to complete eagerly),
@@ -779,7 +779,7 @@ def cancel(self, msg=None):
         return ret
 
 
-def gather(*coros_or_futures, return_exceptions=False):
+def gather(*coros_or_futures, return_exceptions=False, eager_start=False):
     """Return a future aggregating results from the given coroutines/futures.
 
     Coroutines will be wrapped in a future and scheduled in the event
@@ -808,6 +808,11 @@ def gather(*coros_or_futures, return_exceptions=False):
     exception to the caller, therefore, calling ``gather.cancel()``
     after catching an exception (raised by one of the awaitables) from
     gather won't cancel any other awaitables.
+
+    If *eager_start* is True and the event loop is running, coroutines
+    are wrapped in eager tasks: they start executing immediately, and
+    the returned future is already done if they all complete without
+    suspending.
     """
     if not coros_or_futures:
         loop = events.get_event_loop()
@@ -879,7 +884,12 @@ def _done_callback(fut):
     outer = None  # bpo-46672
     for arg in coros_or_futures:
         if arg not in arg_to_fut:
-            fut = ensure_future(arg, loop=loop)
+            if eager_start and coroutines.iscoroutine(arg):
+                if loop is None:
+                    loop = events.get_event_loop()
+                fut = _create_task(loop, arg, eager_start=True)
+            else:
+                fut = ensure_future(arg, loop=loop)
             if loop is None:
                 loop = futures._get_loop(fut)
             if fut is not arg:
@@ -1002,6 +1012,20 @@ def callback():
     return future
 
 
+def _create_task(loop, coro, *, name=None, context=None, eager_start=False):
+    # Like loop.create_task(), but if eager_start is true and the loop
+    # uses the default task factory, start the task eagerly.
+    if eager_start and loop.get_task_factory() is None:
+        task = Task(coro, loop=loop, name=name, context=context,
+                    eager_start=True)
+        if task._source_traceback:
+            del task._source_traceback[-1]
+        return task
+    if context is None:
+        return loop.create_task(coro, name=name)
+    return loop.create_task(coro, name=name, context=context)
+
+
 def create_eager_task_factory(custom_task_constructor):
     """Create a function suitable for use as a task factory on an event-loop.
 
@@ -0,0 +1,213 @@
+"""Hierarchical timer wheel for scheduling TimerHandles.
+
+Time is divided in ticks of a fixed resolution.  A timer expiring at
+tick t is stored in one of the _LEVELS wheels of _SIZE slots, depending
+on the most significant group of _BITS bits in which t differs from the
+current tick: the timers of a slot of level N > 0 are redistributed in
+lower levels ("cascaded") when the current tick reaches the start of
+the slot.  Timers which are too far in the future for the top level are
+kept in an overflow bucket, which is redistributed every time the top
+level wraps around.
+
+Inserting and removing a timer are O(1) operations.  Timers expire at
+the end of their tick: they are never called early, but may be called
+up to one resolution late.
+"""
+
+import math
+import operator
+
+# Each level of the wheel has 64 slots: with a resolution of 1 ms, the
+# levels cover 64 ms, 4 s, 4 min, 4.7 hours and 12.4 days.
+_BITS = 6
+_SIZE = 1 << _BITS
+_MASK = _SIZE - 1
+_LEVELS = 5
+
+
+class TimerWheel:
+    """Schedule of TimerHandles using a hierarchical timer wheel.
+
+    The tick 0 starts at the origin time, using the time reference of
+    the event loop.
+    """
+
+    def __init__(self, resolution, origin):
+        self._resolution = resolution
+        self._origin = origin
+        self._tick = 0
+        self._count = 0
+        # Timers whose tick was reached, and which wait for expire()
+        self._due = {}
+        self._overflow = {}
+        # Buckets map id(handle) to the handle: a timer handle is not a
+        # suitable key since distinct handles may compare equal.
+        self._slots = [[{} for i in range(_SIZE)] for level in range(_LEVELS)]
+        # Bit i of the bitmap of a level is set if its slot i is not empty.
+        self._bitmaps = [0] * _LEVELS
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def __len__(self):
+        return self._count
+
+    def _ticks(self, handle):
+        # Round up, so that a timer is never expired before its time.
+        try:
+            return math.ceil((handle._when - self._origin) / self._resolution)
+        except (OverflowError, ValueError):
+            # Infinite or NaN: the timer never expires.
+            return None
+
+    def _bucket(self, ticks):
+        # Return the bucket of a timer expiring at tick ticks, and its
+        # level and slot index.
+        if ticks is None:
+            return self._overflow, _LEVELS, 0
+        if ticks <= self._tick:
+            return self._due, -1, 0
+        level = ((ticks ^ self._tick).bit_length() - 1) // _BITS
+        if level >= _LEVELS:
+            return self._overflow, _LEVELS, 0
+        index = (ticks >> (level * _BITS)) & _MASK
+        return self._slots[level][index], level, index
+
+    def _insert(self, handle, ticks):
+        if ticks is None:
+            self._overflow[id(handle)] = handle
+        elif ticks <= self._tick:
+            self._due[id(handle)] = handle
+        else:
+            level = ((ticks ^ self._tick).bit_length() - 1) // _BITS
+            if level >= _LEVELS:
+                self._overflow[id(handle)] = handle
+            else:
+                index = (ticks >> (level * _BITS)) & _MASK
+                self._slots[level][index][id(handle)] = handle
+                self._bitmaps[level] |= 1 << index
+
+    def insert(self, handle):
+        """Schedule a TimerHandle."""
+        # This is _insert(handle, _ticks(handle)), inlined for speed.
+        try:
+            ticks = math.ceil((handle._when - self._origin) / self._resolution)
+        except (OverflowError, ValueError):
+            ticks = None
+        self._count += 1
+        tick = self._tick
+        if ticks is not None and ticks > tick:
+            level = ((ticks ^ tick).bit_length() - 1) // _BITS
+            if level < _LEVELS:
+                index = (ticks >> (level * _BITS)) & _MASK
+                self._slots[level][index][id(handle)] = handle
+                self._bitmaps[level] |= 1 << index
+                return
+        self._insert(handle, ticks)
+
+    def remove(self, handle):
+        """Unschedule a TimerHandle.
+
+        Do nothing if the handle is not scheduled.
+        """
+        bucket, level, index = self._bucket(self._ticks(handle))
+        if bucket.pop(id(handle), None) is None:
+            return
+        self._count -= 1
+        if 0 <= level < _LEVELS and not bucket:
+            self._bitmaps[level] &= ~(1 << index)
+
+    def _next_tick(self):
+        # Return the first tick after the current tick at which a slot
+        # must be processed, or None if there are no timers.
+        tick = self._tick
+        for level in range(_LEVELS):
+            shift = level * _BITS
+            # Slots up to the current one are empty.
+            index = ((tick >> shift) & _MASK) + 1
+            pending = self._bitmaps[level] >> index << index
+            if pending:
+                index = (pending & -pending).bit_length() - 1
+                start = tick >> (shift + _BITS) << (shift + _BITS)
+                return start | (index << shift)
+        if self._overflow:
+            shift = _LEVELS * _BITS
+            return ((tick >> shift) + 1) << shift
+        return None
+
+    def _advance(self, target):
+        # Move the current tick to target, skipping the ticks which
+        # have no slot to process.
+        while True:
+            tick = self._next_tick()
+            if tick is None or tick > target:
+                break
+            self._tick = tick
+            if not tick & ((1 << (_LEVELS * _BITS)) - 1) and self._overflow:
+                handles = self._overflow
+                self._overflow = {}
+                for handle in handles.values():
+                    self._insert(handle, self._ticks(handle))
+            # Cascade from the top level, down to the level 0 slot whose
+            # timers are due.
+            for level in reversed(range(_LEVELS)):
+                shift = level * _BITS
+                if tick & ((1 << shift) - 1):
+                    continue
+                index = (tick >> shift) & _MASK
+                handles = self._slots[level][index]
+                if handles:
+                    self._slots[level][index] = {}
+                    self._bitmaps[level] &= ~(1 << index)
+                    for handle in handles.values():
+                        self._insert(handle, self._ticks(handle))
+        if target > self._tick:
+            self._tick = target
+
+    def timeout(self, now):
+        """Return the delay until the next timer expires.
+
+        Return None if there are no timers.  The delay may be shorter:
+        the wheel must then be advanced by expire() without returning
+        any timer.
+        """
+        if self._due:
+            return 0
+        tick = self._next_tick()
+        if tick is None:
+            return None
+        return max(self._origin + tick * self._resolution - now, 0)
+
+    def expire(self, now):
+        """Remove and return the timers which expire until now.
+
+        Return a list of TimerHandles sorted by their time.
+        """
+        target = math.floor((now - self._origin) / self._resolution)
+        if target > self._tick:
+            self._advance(target)
+        if not self._due:
+            return []
+        handles = sorted(self._due.values(), key=operator.attrgetter('_when'))
+        self._due = {}
+        self._count -= len(handles)
+        return handles
+
+    def handles(self):
+        """Return a list of all scheduled TimerHandles."""
+        handles = [*self._due.values(), *self._overflow.values()]
+        for slots in self._slots:
+            for bucket in slots:
+                handles.extend(bucket.values())
+        return handles
+
+    def clear(self):
+        """Unschedule all timers."""
+        self._count = 0
+        self._due.clear()
+        self._overflow.clear()
+        for slots in self._slots:
+            for bucket in slots:
+                bucket.clear()
+        self._bitmaps = [0] * _LEVELS
@@ -99,6 +99,14 @@ def get_write_buffer_size(self):
         """Return the current size of the write buffer."""
         raise NotImplementedError
 
+    def get_write_buffer_count(self):
+        """Return the number of buffers in the write buffer.
+
+        Transports which send the write buffer with vectored I/O pass
+        up to that many buffers to a single system call.
+        """
+        raise NotImplementedError
+
     def get_write_buffer_limits(self):
         """Get the high and low watermarks for write flow control.
         Return a tuple (low, high) where low and high are
@@ -703,6 +703,10 @@ def __repr__(self):
     def get_write_buffer_size(self):
         return len(self._buffer)
 
+    def get_write_buffer_count(self):
+        # Buffered data is joined in a single buffer
+        return 1 if self._buffer else 0
+
     def _read_ready(self):
         # Pipe was closed by peer.
         if self._loop.get_debug():
@@ -17,7 +17,7 @@
                                       wait,
                                       as_completed)
 
-__all__ = (
+__all__ = [
     'FIRST_COMPLETED',
     'FIRST_EXCEPTION',
     'ALL_COMPLETED',
@@ -30,15 +30,25 @@
     'as_completed',
     'ProcessPoolExecutor',
     'ThreadPoolExecutor',
-)
+    'WorkStealingThreadPoolExecutor',
+]
+
+try:
+    import _xxsubinterpreters as _interpreters
+except ImportError:
+    _interpreters = None
+
+if _interpreters:
+    __all__.append('InterpreterPoolExecutor')
 
 
 def __dir__():
-    return __all__ + ('__author__', '__doc__')
+    return __all__ + ['__author__', '__doc__']
 
 
 def __getattr__(name):
     global ProcessPoolExecutor, ThreadPoolExecutor
+    global WorkStealingThreadPoolExecutor, InterpreterPoolExecutor
 
     if name == 'ProcessPoolExecutor':
         from .process import ProcessPoolExecutor as pe
@@ -50,4 +60,14 @@ def __getattr__(name):
         ThreadPoolExecutor = te
         return te
 
+    if name == 'WorkStealingThreadPoolExecutor':
+        from .thread import WorkStealingThreadPoolExecutor as wte
+        WorkStealingThreadPoolExecutor = wte
+        return wte
+
+    if _interpreters and name == 'InterpreterPoolExecutor':
+        from .interpreter import InterpreterPoolExecutor as ie
+        InterpreterPoolExecutor = ie
+        return ie
+
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
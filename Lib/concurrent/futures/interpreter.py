@@ -0,0 +1,154 @@
+"""Implements InterpreterPoolExecutor."""
+
+import pickle
+import textwrap
+import _xxsubinterpreters as _interpreters
+import _xxinterpqueues as _interpqueues
+from concurrent.futures import thread as _thread
+
+
+class BrokenInterpreterPool(_thread.BrokenThreadPool):
+    """
+    Raised when a worker thread in an InterpreterPoolExecutor failed
+    initializing.
+    """
+
+
+class ExecutionFailed(_interpreters.InterpreterError):
+    """An unhandled exception happened in a worker interpreter.
+
+    This is raised when the exception cannot be passed back to the calling
+    interpreter.  The message is the traceback of the exception.
+    """
+
+
+class _RemoteTraceback(Exception):
+    def __init__(self, tb):
+        self.tb = tb
+    def __str__(self):
+        return self.tb
+
+
+# The queue format for objects that are shared without pickling them.
+_SHARED_ONLY = 0
+
+# Run in the worker interpreter, with __main__._task set to the pickled
+# (fn, args, kwargs) and __main__._qid to the ID of the results queue.
+# Puts (pickled result, False) or (pickled exception, True) in the queue.
+_RUN_TASK = textwrap.dedent('''
+    import pickle as _pickle
+    import traceback as _traceback
+    import _xxinterpqueues as _interpqueues
+    try:
+        _fn, _args, _kwargs = _pickle.loads(_task)
+        _result = _pickle.dumps(_fn(*_args, **_kwargs)), False
+    except BaseException as _exc:
+        _tb = ''.join(_traceback.format_exception(_exc))
+        try:
+            _result = _pickle.dumps((_exc, _tb)), True
+        except BaseException:
+            _result = _pickle.dumps((None, _tb)), True
+        del _exc, _tb
+    finally:
+        del _task
+        _fn = _args = _kwargs = None
+    _interpqueues.put(_qid, _result, 0)
+    del _result
+    ''')
+
+
+class WorkerContext(_thread.WorkerContext):
+    """Runs the calls of a worker thread in its own interpreter.
+
+    The calls and their arguments are pickled, run in the interpreter
+    owned by the worker thread, and their results or exceptions are
+    pickled and passed back through a cross-interpreter queue.
+    """
+
+    @classmethod
+    def prepare(cls, initializer, initargs):
+        if initializer is not None:
+            if not callable(initializer):
+                raise TypeError("initializer must be a callable")
+            initdata = pickle.dumps((initializer, initargs, {}))
+        else:
+            initdata = None
+        def create_context():
+            return cls(initdata)
+        def resolve_task(fn, args, kwargs):
+            return pickle.dumps((fn, args, kwargs))
+        return create_context, resolve_task
+
+    def __init__(self, initdata):
+        self.initdata = initdata
+        self.interpid = None
+        self.resultsid = None
+
+    def initialize(self):
+        assert self.interpid is None, self.interpid
+        # A new isolated interpreter, with its own GIL.
+        self.interpid = _interpreters.create()
+        try:
+            self.resultsid = _interpqueues.create(1, _SHARED_ONLY)
+            if self.initdata is not None:
+                self.run(self.initdata)
+        except BaseException:
+            self.finalize()
+            raise
+
+    def finalize(self):
+        interpid, self.interpid = self.interpid, None
+        resultsid, self.resultsid = self.resultsid, None
+        try:
+            if resultsid is not None:
+                try:
+                    _interpqueues.destroy(resultsid)
+                except _interpqueues.QueueNotFoundError:
+                    pass
+        finally:
+            if interpid is not None:
+                _interpreters.destroy(interpid)
+
+    def run(self, task):
+        excinfo = _interpreters.exec(self.interpid, _RUN_TASK,
+                                     {'_task': task, '_qid': self.resultsid})
+        if excinfo is not None:
+            raise ExecutionFailed(excinfo.errdisplay or excinfo.formatted)
+        data, is_exception = _interpqueues.get(self.resultsid)[0]
+        result = pickle.loads(data)
+        if not is_exception:
+            return result
+        exc, tb = result
+        if exc is None:
+            # The exception could not be pickled.
+            raise ExecutionFailed(tb)
+        exc.__cause__ = _RemoteTraceback(f'\n"""\n{tb}"""')
+        raise exc
+
+
+class InterpreterPoolExecutor(_thread.ThreadPoolExecutor):
+
+    BROKEN = BrokenInterpreterPool
+
+    @classmethod
+    def prepare_context(cls, initializer, initargs):
+        return WorkerContext.prepare(initializer, initargs)
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=()):
+        """Initializes a new InterpreterPoolExecutor instance.
+
+        Args:
+            max_workers: The maximum number of interpreters that can be used
+                to execute the given calls.
+            thread_name_prefix: An optional name prefix to give our threads.
+            initializer: A callable used to initialize each worker
+                interpreter.
+            initargs: A tuple of arguments to pass to the initializer.
+
+        The calls, their arguments and results, as well as the initializer
+        and its arguments, must be picklable.  Each worker thread runs the
+        calls in its own isolated interpreter, which has its own GIL.
+        """
+        super().__init__(max_workers, thread_name_prefix,
+                         initializer, initargs)
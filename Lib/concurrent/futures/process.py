@@ -45,7 +45,11 @@
 
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
+import array
+import collections
+import io
 import os
+import pickle
 from concurrent.futures import _base
 import queue
 import multiprocessing as mp
@@ -53,11 +57,13 @@
 # so that it can be accessed later as `mp.connection`
 import multiprocessing.connection
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler
 import threading
 import weakref
 from functools import partial
 import itertools
 import sys
+import time
 from traceback import format_exception
 
 
@@ -164,6 +170,155 @@ def __init__(self, work_id, fn, args, kwargs):
         self.args = args
         self.kwargs = kwargs
 
+class _SharedMemoryCallItem(_CallItem):
+    def __init__(self, work_id, payload):
+        self.work_id = work_id
+        self.payload = payload
+
+
+def _rebuild_buffer(cls, buffer):
+    return cls(buffer)
+
+def _rebuild_array(typecode, buffer):
+    a = array.array(typecode)
+    a.frombytes(buffer)
+    return a
+
+def _rebuild_memoryview(readonly, format, shape, buffer):
+    data = bytes(buffer) if readonly else bytearray(buffer)
+    return memoryview(data).cast('B').cast(format, shape)
+
+
+class _LargeBuffer(object):
+    # Pickling calls reducer_override() for a bytes or bytearray object
+    # wrapped in this, but not for these objects themselves.
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+def _wrap_large_buffer(obj, threshold):
+    if type(obj) in (bytes, bytearray) and len(obj) >= threshold:
+        return _LargeBuffer(obj)
+    return obj
+
+
+def _store_buffer(threshold, segments, copied_buffers, buffer):
+    try:
+        raw = buffer.raw()
+    except BufferError:
+        # Not contiguous
+        return True
+    with raw:
+        if raw.nbytes < threshold:
+            return True
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(create=True, size=raw.nbytes,
+                                         track=False)
+        try:
+            shm.buf[:raw.nbytes] = raw
+        except BaseException:
+            shm.unlink()
+            raise
+        finally:
+            shm.close()
+        copy = id(buffer) not in copied_buffers
+        segments.append((shm.name, raw.nbytes, copy))
+    return False
+
+
+class _SharedMemoryPickler(pickle.Pickler):
+    """Pickler copying large buffers into new shared memory segments.
+
+    Buffers of at least threshold bytes are pickled out-of-band with
+    protocol 5 and the (name, size, copy) triples of the segments holding
+    them are appended to segments.  copy is false for the buffers of the
+    bytes, bytearray, array.array and memoryview objects, which are
+    rebuilt from a copy of their buffer anyway.  Note that bytes and
+    bytearray objects are only pickled out-of-band when wrapped in a
+    _LargeBuffer.
+    """
+
+    def __init__(self, file, threshold, segments):
+        threshold = max(threshold, 1)
+        # Maps the id of the PickleBuffers created by reducer_override()
+        # to themselves, keeping them alive while pickling.
+        self._copied_buffers = {}
+        # Don't make the buffer callback a bound method: the reference cycle
+        # would keep the buffers exported until the next garbage collection.
+        super().__init__(file, 5, buffer_callback=partial(
+            _store_buffer, threshold, segments, self._copied_buffers))
+        self.dispatch_table = ForkingPickler._copyreg_dispatch_table.copy()
+        self.dispatch_table.update(ForkingPickler._extra_reducers)
+        self._threshold = threshold
+
+    def _wrap(self, obj):
+        buffer = pickle.PickleBuffer(obj)
+        self._copied_buffers[id(buffer)] = buffer
+        return buffer
+
+    def reducer_override(self, obj):
+        cls = type(obj)
+        if cls is _LargeBuffer:
+            return _rebuild_buffer, (type(obj.data), self._wrap(obj.data))
+        elif cls is array.array:
+            if len(obj) * obj.itemsize >= self._threshold:
+                return _rebuild_array, (obj.typecode, self._wrap(obj))
+        elif cls is memoryview:
+            if (obj.nbytes >= self._threshold and obj.c_contiguous
+                    and len(obj.format) == 1):
+                return _rebuild_memoryview, (obj.readonly, obj.format,
+                                             obj.shape, self._wrap(obj))
+        return NotImplemented
+
+
+class _SharedMemoryPayload(object):
+    """An object pickled with its large buffers in shared memory.
+
+    The segments are created by the process which pickles the object and
+    unlinked by the process which calls load().  They are not registered
+    with the resource tracker, since the two processes may not share it.
+    """
+
+    def __init__(self, obj, threshold):
+        obj = _wrap_large_buffer(obj, threshold)
+        self.segments = []
+        file = io.BytesIO()
+        try:
+            _SharedMemoryPickler(file, threshold, self.segments).dump(obj)
+        except BaseException:
+            self.unlink()
+            raise
+        self.data = file.getvalue()
+
+    def unlink(self):
+        from multiprocessing import shared_memory
+        for name, size, copy in self.segments:
+            try:
+                shared_memory.SharedMemory(name, track=False).unlink()
+            except FileNotFoundError:
+                pass
+
+    def load(self):
+        from multiprocessing import shared_memory
+        segments = []
+        buffers = []
+        try:
+            for name, size, copy in self.segments:
+                shm = shared_memory.SharedMemory(name, track=False)
+                segments.append(shm)
+                shm.unlink()
+                buffers.append(shm.buf[:size])
+            return pickle.loads(self.data, buffers=[
+                bytearray(buffer) if copy else buffer
+                for buffer, (name, size, copy) in zip(buffers, self.segments)
+            ])
+        finally:
+            for buffer in buffers:
+                buffer.release()
+            for shm in segments:
+                shm.close()
+
 
 class _SafeQueue(Queue):
     """Safe Queue set exception to the future object linked to a job"""
@@ -202,6 +357,47 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk of an iterable passed to map with chunksize=None.
+
+    Returns the time spent on the chunk along with the results, to let
+    the parent process adjust the size of the next chunks.
+
+    This function is run in a separate process.
+
+    """
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return time.perf_counter() - start, results
+
+
+class _ChunkSizeTuner:
+    """Chooses chunk sizes for map() with chunksize=None.
+
+    The chunk size starts at one and is adjusted so that each chunk keeps a
+    worker busy for about target_time seconds, which amortizes the cost of
+    sending tasks and results between processes while keeping the work
+    evenly spread.  It at most doubles from one chunk to the next.
+    """
+
+    target_time = 0.02
+    max_chunksize = 4096
+
+    def __init__(self):
+        self.chunksize = 1
+
+    def update(self, elapsed, count):
+        if count < self.chunksize:
+            # The last, partial chunk says little about the item cost.
+            return
+        if elapsed > 0:
+            ideal = int(self.target_time * count / elapsed)
+        else:
+            ideal = self.max_chunksize
+        self.chunksize = max(1, min(ideal, 2 * self.chunksize,
+                                    self.max_chunksize))
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
                      exit_pid=None):
     """Safely send back the given result or exception"""
@@ -214,7 +410,8 @@ def _sendback_result(result_queue, work_id, result=None, exception=None,
                                      exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
+def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None,
+                    shared_memory_threshold=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -226,6 +423,9 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of tasks to run before exiting, or None
+        shared_memory_threshold: If not None, buffers of at least this size
+            in the results are sent through shared memory.
     """
     if initializer is not None:
         try:
@@ -250,7 +450,14 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
                 exit_pid = os.getpid()
 
         try:
-            r = call_item.fn(*call_item.args, **call_item.kwargs)
+            if isinstance(call_item, _SharedMemoryCallItem):
+                fn, args, kwargs = call_item.payload.load()
+                r = fn(*args, **kwargs)
+                del fn, args, kwargs
+            else:
+                r = call_item.fn(*call_item.args, **call_item.kwargs)
+            if shared_memory_threshold is not None:
+                r = _SharedMemoryPayload(r, shared_memory_threshold)
         except BaseException as e:
             exc = _ExceptionWithTraceback(e, e.__traceback__)
             _sendback_result(result_queue, call_item.work_id, exception=exc,
@@ -321,10 +528,19 @@ def weakref_cb(_,
         # exiting safely
         self.max_tasks_per_child = executor._max_tasks_per_child
 
+        # Minimum size of the buffers sent through shared memory, or None
+        self.shared_memory_threshold = executor._shared_memory_threshold
+
         # A dict mapping work ids to _WorkItems e.g.
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
 
+        # A dict mapping work ids to the _SharedMemoryPayloads of the call
+        # items sent to the workers, until their result is received.  The
+        # segments of the payloads which no worker loaded are unlinked
+        # when the executor is shut down or broken.
+        self.pending_payloads = {}
+
         super().__init__()
 
     def run(self):
@@ -393,11 +609,28 @@ def add_call_item_to_queue(self):
                 work_item = self.pending_work_items[work_id]
 
                 if work_item.future.set_running_or_notify_cancel():
-                    self.call_queue.put(_CallItem(work_id,
-                                                  work_item.fn,
-                                                  work_item.args,
-                                                  work_item.kwargs),
-                                        block=True)
+                    if self.shared_memory_threshold is None:
+                        call_item = _CallItem(work_id,
+                                              work_item.fn,
+                                              work_item.args,
+                                              work_item.kwargs)
+                    else:
+                        try:
+                            threshold = self.shared_memory_threshold
+                            args = tuple(_wrap_large_buffer(arg, threshold)
+                                         for arg in work_item.args)
+                            kwargs = {key: _wrap_large_buffer(value, threshold)
+                                      for key, value
+                                      in work_item.kwargs.items()}
+                            payload = _SharedMemoryPayload(
+                                (work_item.fn, args, kwargs), threshold)
+                        except BaseException as exc:
+                            del self.pending_work_items[work_id]
+                            work_item.future.set_exception(exc)
+                            continue
+                        self.pending_payloads[work_id] = payload
+                        call_item = _SharedMemoryCallItem(work_id, payload)
+                    self.call_queue.put(call_item, block=True)
                 else:
                     del self.pending_work_items[work_id]
                     continue
@@ -443,12 +676,26 @@ def process_result_item(self, result_item):
 
         # Received a _ResultItem so mark the future as completed.
         work_item = self.pending_work_items.pop(result_item.work_id, None)
+        payload = self.pending_payloads.pop(result_item.work_id, None)
+        if payload is not None:
+            # The worker unlinked the segments, unless it failed to load
+            # the payload.
+            payload.unlink()
+        result = result_item.result
+        exception = result_item.exception
+        if isinstance(result, _SharedMemoryPayload):
+            # Load the result even if the future is gone, to release the
+            # shared memory.
+            try:
+                result = result.load()
+            except BaseException as exc:
+                exception = exc
         # work_item can be None if another process terminated (see above)
         if work_item is not None:
-            if result_item.exception:
-                work_item.future.set_exception(result_item.exception)
+            if exception:
+                work_item.future.set_exception(exception)
             else:
-                work_item.future.set_result(result_item.result)
+                work_item.future.set_result(result)
 
     def is_shutting_down(self):
         # Check whether we should start shutting down the executor.
@@ -526,6 +773,11 @@ def flag_executor_shutting_down(self):
                     if not work_item.future.cancel():
                         new_pending_work_items[work_id] = work_item
                 self.pending_work_items = new_pending_work_items
+                # Unlink the payloads of the call items which are no longer
+                # pending, e.g. because they could not be sent.
+                for work_id in list(self.pending_payloads):
+                    if work_id not in new_pending_work_items:
+                        self.pending_payloads.pop(work_id).unlink()
                 # Drain work_ids_queue since we no longer need to
                 # add items to the call queue.
                 while True:
@@ -555,6 +807,13 @@ def join_executor_internals(self):
         with self.shutdown_lock:
             self._join_executor_internals()
 
+    def unlink_pending_payloads(self):
+        # Destroy the shared memory segments of the call items which were
+        # not processed by a worker.
+        for payload in self.pending_payloads.values():
+            payload.unlink()
+        self.pending_payloads.clear()
+
     def _join_executor_internals(self, broken=False):
         # If broken, call_queue was closed and so can no longer be used.
         if not broken:
@@ -572,6 +831,9 @@ def _join_executor_internals(self, broken=False):
                 p.terminate()
             p.join()
 
+        # Unlink the segments once no worker can load them anymore.
+        self.unlink_pending_payloads()
+
     def get_n_children_alive(self):
         # This is an upper bound on the number of children alive.
         return sum(p.is_alive() for p in self.processes.values())
@@ -634,7 +896,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -652,6 +915,11 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: If not None, the buffers of at least this
+                number of bytes in the arguments and results of the calls,
+                such as the contents of large bytes objects, are passed
+                through shared memory segments instead of being sent through
+                a pipe. Not supported on Windows.
         """
         _check_system_limits()
 
@@ -698,6 +966,18 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            elif shared_memory_threshold < 0:
+                raise ValueError("shared_memory_threshold must be >= 0")
+            if sys.platform == 'win32':
+                # Shared memory segments are destroyed on Windows as soon as
+                # the process which created them closes them.
+                raise NotImplementedError(
+                    "shared_memory_threshold is not supported on Windows")
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -783,7 +1063,8 @@ def _spawn_process(self):
                   self._result_queue,
                   self._initializer,
                   self._initargs,
-                  self._max_tasks_per_child))
+                  self._max_tasks_per_child,
+                  self._shared_memory_threshold))
         p.start()
         self._processes[p.pid] = p
 
@@ -812,7 +1093,7 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -823,6 +1104,14 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If None, the chunk size is adjusted from the measured time
+                spent on each item, and the iterables are consumed lazily.
+            buffersize: The number of submitted chunks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task
+                is submitted for each chunk, except when chunksize is None,
+                where the buffer holds two chunks per worker process.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -833,14 +1122,67 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize is None:
+            return self._map_adaptive(fn, zip(*iterables), timeout,
+                                      buffersize)
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               itertools.batched(zip(*iterables), chunksize),
-                              timeout=timeout)
+                              timeout=timeout, buffersize=buffersize)
         return _chain_from_iterable_of_lists(results)
 
+    def _map_adaptive(self, fn, zipped_iterables, timeout, buffersize):
+        if buffersize is not None and not isinstance(buffersize, int):
+            raise TypeError("buffersize must be an integer or None")
+        if buffersize is None:
+            buffersize = 2 * self._max_workers
+        elif buffersize < 1:
+            raise ValueError("buffersize must be None or > 0")
+
+        if timeout is not None:
+            end_time = timeout + time.monotonic()
+
+        tuner = _ChunkSizeTuner()
+        executor_weakref = weakref.ref(self)
+        fs = collections.deque()
+
+        def submit_chunk():
+            if (executor := executor_weakref()) is None:
+                return False
+            chunk = tuple(itertools.islice(zipped_iterables, tuner.chunksize))
+            if not chunk:
+                return False
+            fs.append(executor.submit(_process_timed_chunk, fn, chunk))
+            return True
+
+        for _ in range(buffersize):
+            if not submit_chunk():
+                break
+
+        # Yield must be hidden in closure so that the futures are submitted
+        # before the first iterator value is required.
+        def result_iterator():
+            try:
+                while fs:
+                    future = fs.popleft()
+                    # Keep the buffer full while waiting for this chunk.
+                    submit_chunk()
+                    if timeout is None:
+                        elapsed, results = _base._result_or_cancel(future)
+                    else:
+                        elapsed, results = _base._result_or_cancel(
+                            future, end_time - time.monotonic())
+                    # Careful not to keep a reference to the popped future
+                    del future
+                    tuner.update(elapsed, len(results))
+                    yield from _chain_from_iterable_of_lists((results,))
+            finally:
+                for future in fs:
+                    future.cancel()
+        return result_iterator()
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
             self._cancel_pending_futures = cancel_futures
@@ -6,6 +6,7 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
@@ -43,19 +44,57 @@ def _python_exit():
                         after_in_parent=_global_shutdown_lock.release)
 
 
+class WorkerContext:
+    """The state of a worker thread, and how it runs the submitted calls.
+
+    The executor calls prepare() once; a new context is then created by
+    each worker thread, which calls initialize() before running any call
+    with run() and finalize() before exiting.
+    """
+
+    @classmethod
+    def prepare(cls, initializer, initargs):
+        """Return a (create_context, resolve_task) pair of functions.
+
+        create_context() returns a new context for a worker thread, and
+        resolve_task(fn, args, kwargs) returns the task to pass to run().
+        """
+        if initializer is not None:
+            if not callable(initializer):
+                raise TypeError("initializer must be a callable")
+        def create_context():
+            return cls(initializer, initargs)
+        def resolve_task(fn, args, kwargs):
+            return (fn, args, kwargs)
+        return create_context, resolve_task
+
+    def __init__(self, initializer, initargs):
+        self.initializer = initializer
+        self.initargs = initargs
+
+    def initialize(self):
+        if self.initializer is not None:
+            self.initializer(*self.initargs)
+
+    def finalize(self):
+        pass
+
+    def run(self, task):
+        fn, args, kwargs = task
+        return fn(*args, **kwargs)
+
+
 class _WorkItem:
-    def __init__(self, future, fn, args, kwargs):
+    def __init__(self, future, task):
         self.future = future
-        self.fn = fn
-        self.args = args
-        self.kwargs = kwargs
+        self.task = task
 
-    def run(self):
+    def run(self, ctx):
         if not self.future.set_running_or_notify_cancel():
             return
 
         try:
-            result = self.fn(*self.args, **self.kwargs)
+            result = ctx.run(self.task)
         except BaseException as exc:
             self.future.set_exception(exc)
             # Break a reference cycle with the exception 'exc'
@@ -66,16 +105,15 @@ def run(self):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
-def _worker(executor_reference, work_queue, initializer, initargs):
-    if initializer is not None:
-        try:
-            initializer(*initargs)
-        except BaseException:
-            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
-            executor = executor_reference()
-            if executor is not None:
-                executor._initializer_failed()
-            return
+def _worker(executor_reference, ctx, work_queue):
+    try:
+        ctx.initialize()
+    except BaseException:
+        _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+        executor = executor_reference()
+        if executor is not None:
+            executor._initializer_failed()
+        return
     try:
         while True:
             try:
@@ -89,7 +127,7 @@ def _worker(executor_reference, work_queue, initializer, initargs):
                 work_item = work_queue.get(block=True)
 
             if work_item is not None:
-                work_item.run()
+                work_item.run(ctx)
                 # Delete references to object. See GH-60488
                 del work_item
                 continue
@@ -110,6 +148,8 @@ def _worker(executor_reference, work_queue, initializer, initargs):
             del executor
     except BaseException:
         _base.LOGGER.critical('Exception in worker', exc_info=True)
+    finally:
+        ctx.finalize()
 
 
 class BrokenThreadPool(_base.BrokenExecutor):
@@ -120,9 +160,15 @@ class BrokenThreadPool(_base.BrokenExecutor):
 
 class ThreadPoolExecutor(_base.Executor):
 
+    BROKEN = BrokenThreadPool
+
     # Used to assign unique thread names when thread_name_prefix is not supplied.
     _counter = itertools.count().__next__
 
+    @classmethod
+    def prepare_context(cls, initializer, initargs):
+        return WorkerContext.prepare(initializer, initargs)
+
     def __init__(self, max_workers=None, thread_name_prefix='',
                  initializer=None, initargs=()):
         """Initializes a new ThreadPoolExecutor instance.
@@ -146,8 +192,9 @@ def __init__(self, max_workers=None, thread_name_prefix='',
         if max_workers <= 0:
             raise ValueError("max_workers must be greater than 0")
 
-        if initializer is not None and not callable(initializer):
-            raise TypeError("initializer must be a callable")
+        (self._create_worker_context,
+         self._resolve_work_item_task,
+         ) = type(self).prepare_context(initializer, initargs)
 
         self._max_workers = max_workers
         self._work_queue = queue.SimpleQueue()
@@ -158,13 +205,11 @@ def __init__(self, max_workers=None, thread_name_prefix='',
         self._shutdown_lock = threading.Lock()
         self._thread_name_prefix = (thread_name_prefix or
                                     ("ThreadPoolExecutor-%d" % self._counter()))
-        self._initializer = initializer
-        self._initargs = initargs
 
     def submit(self, fn, /, *args, **kwargs):
         with self._shutdown_lock, _global_shutdown_lock:
             if self._broken:
-                raise BrokenThreadPool(self._broken)
+                raise self.BROKEN(self._broken)
 
             if self._shutdown:
                 raise RuntimeError('cannot schedule new futures after shutdown')
@@ -173,7 +218,8 @@ def submit(self, fn, /, *args, **kwargs):
                                    'interpreter shutdown')
 
             f = _base.Future()
-            w = _WorkItem(f, fn, args, kwargs)
+            task = self._resolve_work_item_task(fn, args, kwargs)
+            w = _WorkItem(f, task)
 
             self._work_queue.put(w)
             self._adjust_thread_count()
@@ -196,9 +242,8 @@ def weakref_cb(_, q=self._work_queue):
                                      num_threads)
             t = threading.Thread(name=thread_name, target=_worker,
                                  args=(weakref.ref(self, weakref_cb),
-                                       self._work_queue,
-                                       self._initializer,
-                                       self._initargs))
+                                       self._create_worker_context(),
+                                       self._work_queue))
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
@@ -214,7 +259,7 @@ def _initializer_failed(self):
                 except queue.Empty:
                     break
                 if work_item is not None:
-                    work_item.future.set_exception(BrokenThreadPool(self._broken))
+                    work_item.future.set_exception(self.BROKEN(self._broken))
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
@@ -237,3 +282,226 @@ def shutdown(self, wait=True, *, cancel_futures=False):
             for t in self._threads:
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+
+class _WorkerQueue:
+    """The work items of one WorkStealingThreadPoolExecutor worker."""
+
+    def __init__(self):
+        self.items = collections.deque()
+        self._wakeup = threading.Semaphore(0)
+
+    def put(self, item):
+        # Only used to wake up the worker: see _python_exit() and
+        # WorkStealingThreadPoolExecutor.shutdown().
+        self._wakeup.release()
+
+    def wait(self):
+        self._wakeup.acquire()
+
+
+def _steal(own_queue, queues):
+    try:
+        return own_queue.items.popleft()
+    except IndexError:
+        pass
+    # The queues of the other workers are served in submission order too.
+    for work_queue in queues:
+        try:
+            return work_queue.items.popleft()
+        except IndexError:
+            pass
+    return None
+
+
+def _work_stealing_worker(executor_reference, ctx, work_queue, queues,
+                          idle_queues, idle_lock, local):
+    try:
+        ctx.initialize()
+    except BaseException:
+        _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+        executor = executor_reference()
+        if executor is not None:
+            executor._initializer_failed()
+        return
+    local.work_queue = work_queue
+    try:
+        while True:
+            work_item = _steal(work_queue, queues)
+            if work_item is None:
+                executor = executor_reference()
+                # Exit once all queues are empty if:
+                #   - The interpreter is shutting down OR
+                #   - The executor that owns the worker has been collected OR
+                #   - The executor that owns the worker has been shutdown.
+                if _shutdown or executor is None or executor._shutdown:
+                    if executor is not None:
+                        executor._shutdown = True
+                    # Notice other workers
+                    for other in queues:
+                        other.put(None)
+                    return
+                del executor
+
+                # Register as idle before checking the queues a last time, so
+                # that an item submitted in between wakes us up.
+                with idle_lock:
+                    idle_queues.append(work_queue)
+                work_item = _steal(work_queue, queues)
+                if work_item is None:
+                    work_queue.wait()
+                with idle_lock:
+                    try:
+                        idle_queues.remove(work_queue)
+                    except ValueError:
+                        pass
+                if work_item is None:
+                    continue
+
+            work_item.run(ctx)
+            # Delete references to object. See GH-60488
+            del work_item
+    except BaseException:
+        _base.LOGGER.critical('Exception in worker', exc_info=True)
+    finally:
+        ctx.finalize()
+
+
+class WorkStealingThreadPoolExecutor(ThreadPoolExecutor):
+    """A ThreadPoolExecutor giving each worker thread its own queue.
+
+    Each thread submits calls to the queue of one of the workers, and
+    calls submitted from a worker thread are put in its own queue.
+    A worker whose queue is empty takes work from the queues of the other
+    workers, so that the threads are not all contending for a single
+    queue.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=()):
+        super().__init__(max_workers, thread_name_prefix,
+                         initializer, initargs)
+        self._work_queues = []
+        self._next_queue = itertools.count().__next__
+        self._idle_queues = []
+        self._idle_lock = threading.Lock()
+        self._local = threading.local()
+    __init__.__doc__ = ThreadPoolExecutor.__init__.__doc__
+
+    def _check_submit(self):
+        if self._broken:
+            raise self.BROKEN(self._broken)
+
+        if self._shutdown:
+            raise RuntimeError('cannot schedule new futures after shutdown')
+        if _shutdown:
+            raise RuntimeError('cannot schedule new futures after '
+                               'interpreter shutdown')
+
+    def submit(self, fn, /, *args, **kwargs):
+        # The locks are only taken to start a worker thread, or if the
+        # executor was shut down or broken while the work item was queued.
+        self._check_submit()
+
+        f = _base.Future()
+        task = self._resolve_work_item_task(fn, args, kwargs)
+        w = _WorkItem(f, task)
+
+        if len(self._threads) < self._max_workers and not self._idle_queues:
+            with self._shutdown_lock, _global_shutdown_lock:
+                self._check_submit()
+                self._adjust_thread_count()
+        local = self._local
+        work_queue = getattr(local, 'work_queue', None)
+        if work_queue is None:
+            # Other threads each submit to one queue, chosen at their
+            # first call.
+            try:
+                index = local.queue_index
+            except AttributeError:
+                index = local.queue_index = self._next_queue()
+            queues = self._work_queues
+            work_queue = queues[index % len(queues)]
+        work_queue.items.append(w)
+        if self._broken or self._shutdown or _shutdown:
+            # The workers may have drained the queues and exited already:
+            # don't leave the work item behind.
+            with self._shutdown_lock, _global_shutdown_lock:
+                try:
+                    work_queue.items.remove(w)
+                except ValueError:
+                    # It was run or cancelled
+                    pass
+                else:
+                    self._check_submit()
+        if self._idle_queues:
+            with self._idle_lock:
+                if self._idle_queues:
+                    self._idle_queues.pop().put(None)
+        return f
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def _adjust_thread_count(self):
+        # if idle threads are available, don't spin new threads
+        if self._idle_queues:
+            return
+
+        num_threads = len(self._threads)
+        if num_threads < self._max_workers:
+            work_queue = _WorkerQueue()
+            self._work_queues.append(work_queue)
+
+            # When the executor gets lost, the weakref callback will wake up
+            # the worker threads.
+            def weakref_cb(_, queues=self._work_queues):
+                for q in queues:
+                    q.put(None)
+
+            thread_name = '%s_%d' % (self._thread_name_prefix or self,
+                                     num_threads)
+            t = threading.Thread(name=thread_name,
+                                 target=_work_stealing_worker,
+                                 args=(weakref.ref(self, weakref_cb),
+                                       self._create_worker_context(),
+                                       work_queue,
+                                       self._work_queues,
+                                       self._idle_queues,
+                                       self._idle_lock,
+                                       self._local))
+            t.start()
+            self._threads.add(t)
+            _threads_queues[t] = work_queue
+
+    def _drain(self):
+        for work_queue in self._work_queues:
+            while True:
+                try:
+                    work_item = work_queue.items.popleft()
+                except IndexError:
+                    break
+                yield work_item
+
+    def _initializer_failed(self):
+        with self._shutdown_lock:
+            self._broken = ('A thread initializer failed, the thread pool '
+                            'is not usable anymore')
+            # Drain work queues and mark pending futures failed
+            for work_item in self._drain():
+                work_item.future.set_exception(self.BROKEN(self._broken))
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._shutdown_lock:
+            self._shutdown = True
+            if cancel_futures:
+                # Drain all work items from the queues, and then cancel their
+                # associated futures.
+                for work_item in self._drain():
+                    work_item.future.cancel()
+
+            # Wake up idle threads so that they notice the shutdown.
+            for work_queue in self._work_queues:
+                work_queue.put(None)
+        if wait:
+            for t in self._threads:
+                t.join()
+    shutdown.__doc__ = _base.Executor.shutdown.__doc__
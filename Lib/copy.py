@@ -143,7 +143,7 @@ def deepcopy(x, memo=None, _nil=[]):
                 y = copier(memo)
             else:
                 reductor = dispatch_table.get(cls)
-                if reductor:
+                if reductor is not None:
                     rv = reductor(x)
                 else:
                     reductor = getattr(x, "__reduce_ex__", None)
@@ -291,6 +291,11 @@ def _reconstruct(x, memo, func, args,
 
 del types, weakref
 
+try:
+    from _copy import deepcopy
+except ImportError:
+    pass
+
 
 def replace(obj, /, **changes):
     """Return a new object replacing specified fields with new values.
@@ -63,6 +63,7 @@ class excel:
         written as two quotes
 """
 
+import os
 import re
 import types
 from _csv import Error, writer, reader, register_dialect, \
@@ -72,6 +73,7 @@ class excel:
                  QUOTE_STRINGS, QUOTE_NOTNULL
 from _csv import Dialect as _Dialect
 
+from collections import deque
 from io import StringIO
 
 __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
@@ -80,7 +82,7 @@ class excel:
            "field_size_limit", "reader", "writer",
            "register_dialect", "get_dialect", "list_dialects", "Sniffer",
            "unregister_dialect", "DictReader", "DictWriter",
-           "unix_dialect"]
+           "unix_dialect", "parallel_reader"]
 
 __version__ = "1.0"
 
@@ -231,6 +233,157 @@ def writerows(self, rowdicts):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
+# Default size of the byte ranges parsed by the workers of
+# parallel_reader(), and size of the blocks scanned for record boundaries.
+_PARALLEL_CHUNK_SIZE = 16 * 1024 * 1024
+_SCAN_SIZE = 1024 * 1024
+
+_DIALECT_ATTRS = ('delimiter', 'quotechar', 'escapechar', 'doublequote',
+                  'skipinitialspace', 'lineterminator', 'quoting', 'strict')
+
+
+def _record_ranges(f, chunk_size, quote):
+    """Split the binary file f into (start, end) ranges of whole records.
+
+    Each range ends after the first newline which follows at least
+    chunk_size bytes and which is not inside a quoted field, i.e. is
+    preceded by an even number of quote characters.  If quote is None,
+    every newline ends a record.  If chunk_size is None, the whole file
+    is a single range.
+    """
+    size = f.seek(0, os.SEEK_END)
+    start = 0
+    if chunk_size is None:
+        if size:
+            yield 0, size
+        return
+    if quote is None:
+        while start < size:
+            f.seek(start + chunk_size)
+            f.readline()
+            end = min(f.tell(), size)
+            yield start, end
+            start = end
+        return
+
+    f.seek(0)
+    pos = 0
+    in_quotes = False
+    target = chunk_size
+    while block := f.read(_SCAN_SIZE):
+        end = pos + len(block)
+        # Quotes in block[:counted] are accounted for in in_quotes.
+        counted = 0
+        while target < end:
+            nl = block.find(b'\n', max(target - pos, counted))
+            if nl < 0:
+                break
+            in_quotes ^= block.count(quote, counted, nl) & 1
+            counted = nl + 1
+            if not in_quotes:
+                yield start, pos + counted
+                start = pos + counted
+                target = start + chunk_size
+        in_quotes ^= block.count(quote, counted) & 1
+        pos = end
+    if start < size:
+        yield start, size
+
+
+def _read_range(filename, start, end, encoding, errors, params):
+    """Parse the records in the byte range [start, end) of a CSV file."""
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return list(reader(StringIO(data.decode(encoding, errors), newline=''),
+                       **params))
+
+
+def parallel_reader(filename, dialect='excel', *, encoding=None,
+                    errors=None, executor=None, max_workers=None,
+                    chunk_size=_PARALLEL_CHUNK_SIZE, batches=False,
+                    **fmtparams):
+    """Read the rows of a CSV file, parsing parts of it in parallel.
+
+    The file is split into byte ranges of about chunk_size bytes which
+    end at record boundaries, and the ranges are parsed by the workers of
+    executor, a ProcessPoolExecutor with max_workers processes by default.
+    Returns an iterator over the rows in file order, or over lists of
+    rows (one per range) if batches is true.
+
+    The encoding must encode ASCII characters as single bytes, like
+    UTF-8 or Latin-1.  Quote characters are expected only at the start
+    and end of quoted fields and doubled inside them, as written by
+    csv.writer.  A dialect with an escapechar cannot be split safely, so
+    the whole file is then parsed by a single worker.
+    """
+    import codecs
+
+    filename = os.fspath(filename)
+    if encoding is None:
+        import locale
+        encoding = locale.getpreferredencoding(False)
+    if errors is None:
+        errors = 'strict'
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    params = reader((), dialect, **fmtparams).dialect
+    params = {name: getattr(params, name) for name in _DIALECT_ATTRS}
+
+    # The file is split on the encoded newlines and quote characters.  A
+    # BOM is only present at the start of the file.
+    split_encoding = codecs.lookup(encoding).name
+    if split_encoding == 'utf-8-sig':
+        split_encoding = 'utf-8'
+    if '\n'.encode(split_encoding) != b'\n':
+        raise ValueError(f"encoding {encoding!r} is not ASCII compatible")
+    quote = None
+    if params['quoting'] != QUOTE_NONE and params['quotechar'] is not None:
+        quote = params['quotechar'].encode(split_encoding)
+    if params['escapechar'] is not None:
+        chunk_size = None
+
+    return _parallel_rows(filename, encoding, errors, params, executor,
+                          max_workers, chunk_size, quote, batches)
+
+
+def _parallel_rows(filename, encoding, errors, params, executor,
+                   max_workers, chunk_size, quote, batches):
+    from concurrent.futures import ProcessPoolExecutor
+
+    own_executor = executor is None
+    if max_workers is None:
+        max_workers = os.process_cpu_count() or 1
+    pending = deque()
+    try:
+        with open(filename, 'rb') as f:
+            for start, end in _record_ranges(f, chunk_size, quote):
+                if executor is None:
+                    executor = ProcessPoolExecutor(max_workers)
+                pending.append(executor.submit(_read_range, filename,
+                                               start, end, encoding, errors,
+                                               params))
+                # Keep the workers busy, but do not hold the rows of the
+                # whole file in memory.
+                if len(pending) > 2 * max_workers:
+                    rows = pending.popleft().result()
+                    if batches:
+                        yield rows
+                    else:
+                        yield from rows
+        while pending:
+            rows = pending.popleft().result()
+            if batches:
+                yield rows
+            else:
+                yield from rows
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor and executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
 class Sniffer:
     '''
     "Sniffs" the format of a CSV file (i.e. delimiter, quotechar)
@@ -6,6 +6,7 @@
 import keyword
 import itertools
 import abc
+import weakref
 from reprlib import recursive_repr
 from types import FunctionType, GenericAlias
 
@@ -216,6 +217,17 @@ def __repr__(self):
 # __init__.
 _POST_INIT_NAME = '__post_init__'
 
+# The names of the asdict(), astuple() and replace() functions generated
+# for the fields of a dataclass.
+_ASDICT_NAME = '__dataclass_asdict__'
+_ASTUPLE_NAME = '__dataclass_astuple__'
+_REPLACE_NAME = '__dataclass_replace__'
+
+# The cache of these functions: maps a class to a dict of its functions by
+# name.  It is not stored on the classes, so that they don't get attributes
+# which the user didn't ask for.
+_GENERATED_FNS = weakref.WeakKeyDictionary()
+
 # String regex that string annotations for ClassVar or InitVar must match.
 # Allows "identifier.identifier[" or "identifier[".
 # https://bugs.python.org/issue33453 for details.
@@ -468,7 +480,8 @@ def add_fn(self, name, args, body, *, locals=None, return_type=MISSING,
         # Compute the text of the entire function, add it to the text we're generating.
         self.src.append(f'{f' {decorator}\n' if decorator else ''} def {name}({args}){return_annotation}:\n{body}')
 
-    def add_fns_to_class(self, cls):
+    def create_fns(self, cls):
+        # Return a dict of the functions we're generating, by name.
         # The source to all of the functions we're generating.
         fns_src = '\n'.join(self.src)
 
@@ -498,10 +511,13 @@ def add_fns_to_class(self, cls):
         ns = {}
         exec(txt, self.globals, ns)
         fns = ns['__create_fn__'](**self.locals)
+        for fn in fns:
+            fn.__qualname__ = f"{cls.__qualname__}.{fn.__name__}"
+        return dict(zip(self.names, fns))
 
+    def add_fns_to_class(self, cls):
         # Now that we've generated the functions, assign them into cls.
-        for name, fn in zip(self.names, fns):
-            fn.__qualname__ = f"{cls.__qualname__}.{fn.__name__}"
+        for name, fn in self.create_fns(cls).items():
             if self.unconditional_adds.get(name, False):
                 setattr(cls, name, fn)
             else:
@@ -1358,17 +1374,8 @@ def _asdict_inner(obj, dict_factory):
     if obj_type in _ATOMIC_TYPES:
         return obj
     elif hasattr(obj_type, _FIELDS):
-        # dataclass instance: fast path for the common case
-        if dict_factory is dict:
-            return {
-                f.name: _asdict_inner(getattr(obj, f.name), dict)
-                for f in fields(obj)
-            }
-        else:
-            return dict_factory([
-                (f.name, _asdict_inner(getattr(obj, f.name), dict_factory))
-                for f in fields(obj)
-            ])
+        # dataclass instance: use the function generated for its class
+        return _get_generated_fn(obj_type, _ASDICT_NAME)(obj, dict_factory)
     # handle the builtin types first for speed; subclasses handled below
     elif obj_type is list:
         return [_asdict_inner(v, dict_factory) for v in obj]
@@ -1446,13 +1453,12 @@ class C:
 
 
 def _astuple_inner(obj, tuple_factory):
-    if type(obj) in _ATOMIC_TYPES:
+    obj_type = type(obj)
+    if obj_type in _ATOMIC_TYPES:
         return obj
-    elif _is_dataclass_instance(obj):
-        return tuple_factory([
-            _astuple_inner(getattr(obj, f.name), tuple_factory)
-            for f in fields(obj)
-        ])
+    elif hasattr(obj_type, _FIELDS):
+        # dataclass instance: use the function generated for its class
+        return _get_generated_fn(obj_type, _ASTUPLE_NAME)(obj, tuple_factory)
     elif isinstance(obj, tuple) and hasattr(obj, '_fields'):
         # obj is a namedtuple.  Recurse into it, but the returned
         # object is another namedtuple of the same type.  This is
@@ -1591,34 +1597,101 @@ class C:
 
 
 def _replace(self, /, **changes):
-    # We're going to mutate 'changes', but that's okay because it's a
-    # new dict, even if called with 'replace(self, **my_changes)'.
+    return _get_generated_fn(type(self), _REPLACE_NAME)(self, **changes)
 
-    # It's an error to have init=False fields in 'changes'.
-    # If a field is not in 'changes', read its value from the provided 'self'.
 
-    for f in getattr(self, _FIELDS).values():
+def _get_generated_fn(cls, name):
+    # Return the asdict(), astuple() or replace() function generated for
+    # the fields of the dataclass cls.  They are generated the first time
+    # one of them is needed rather than when the class is created, so that
+    # creating dataclasses does not get slower.  They are cached by class,
+    # not looked up through the MRO: a dataclass derived from cls has other
+    # fields.
+    try:
+        fns = _GENERATED_FNS[cls]
+    except KeyError:
+        fns = _GENERATED_FNS[cls] = _create_generated_fns(cls)
+    return fns[name]
+
+
+def _generated_value(name, inner, factory):
+    # Return the text of the expression converting the value of the field
+    # name of obj, recursing with inner() unless it is of an atomic type.
+    return (f'(__dataclass_v__ if type(__dataclass_v__ := obj.{name}) '
+            f'in __dataclass_atomic_types__ '
+            f'else {inner}(__dataclass_v__, {factory}))')
+
+
+def _create_generated_fns(cls):
+    fields = getattr(cls, _FIELDS)
+    field_list = [f for f in fields.values() if f._field_type is _FIELD]
+    func_builder = _FuncBuilder({})
+    locals = {'__dataclass_atomic_types__': _ATOMIC_TYPES,
+              '__dataclass_asdict_inner__': _asdict_inner,
+              '__dataclass_astuple_inner__': _astuple_inner,
+              '__dataclass_builtins_dict__': dict,
+              '__dataclass_builtins_tuple__': tuple,
+              }
+
+    # The equivalent of:
+    #   {f.name: _asdict_inner(getattr(obj, f.name), dict_factory)
+    #    for f in fields(obj)}
+    # with the atomic types check of _asdict_inner() inlined.
+    values = [(f.name, _generated_value(f.name, '__dataclass_asdict_inner__',
+                                        'dict_factory'))
+              for f in field_list]
+    func_builder.add_fn(_ASDICT_NAME,
+                        ('obj', 'dict_factory'),
+                        ['  if dict_factory is __dataclass_builtins_dict__:',
+                         '   return {' + ','.join([f'{name!r}:{value}'
+                                                   for name, value in values])
+                         + '}',
+                         '  return dict_factory([' +
+                         ','.join([f'({name!r},{value})'
+                                   for name, value in values]) + '])'],
+                        locals=locals)
+
+    # The equivalent of:
+    #   tuple_factory([_astuple_inner(getattr(obj, f.name), tuple_factory)
+    #                  for f in fields(obj)])
+    values = [_generated_value(f.name, '__dataclass_astuple_inner__',
+                               'tuple_factory')
+              for f in field_list]
+    func_builder.add_fn(_ASTUPLE_NAME,
+                        ('obj', 'tuple_factory'),
+                        ['  if tuple_factory is __dataclass_builtins_tuple__:',
+                         '   return (' + ''.join([f'{value},'
+                                                  for value in values]) + ')',
+                         '  return tuple_factory([' + ','.join(values) + '])'],
+                        locals=locals)
+
+    # 'changes' is mutated, but that's okay because it's a new dict, even
+    # if called with 'replace(self, **my_changes)'.  It's an error to have
+    # init=False fields in 'changes'.  If a field is not in 'changes', its
+    # value is read from the provided 'self'.  Then the new object is
+    # created, which calls __init__() and __post_init__() (if defined),
+    # using all of the init fields added and/or left in 'changes'.  If
+    # there are values supplied in changes that aren't fields, this will
+    # correctly raise a TypeError.
+    body = []
+    for f in fields.values():
         # Only consider normal fields or InitVars.
         if f._field_type is _FIELD_CLASSVAR:
             continue
-
         if not f.init:
             # Error if this field is specified in changes.
-            if f.name in changes:
-                raise TypeError(f'field {f.name} is declared with '
-                                f'init=False, it cannot be specified with '
-                                f'replace()')
-            continue
+            msg = (f'field {f.name} is declared with init=False, '
+                   f'it cannot be specified with replace()')
+            body += [f'  if {f.name!r} in changes:',
+                     f'   raise TypeError({msg!r})']
+        elif f._field_type is _FIELD_INITVAR and f.default is MISSING:
+            msg = f'InitVar {f.name!r} must be specified with replace()'
+            body += [f'  if {f.name!r} not in changes:',
+                     f'   raise TypeError({msg!r})']
+        else:
+            body += [f'  if {f.name!r} not in changes:',
+                     f'   changes[{f.name!r}]=self.{f.name}']
+    body.append('  return self.__class__(**changes)')
+    func_builder.add_fn(_REPLACE_NAME, ('self', '/', '**changes'), body)
 
-        if f.name not in changes:
-            if f._field_type is _FIELD_INITVAR and f.default is MISSING:
-                raise TypeError(f"InitVar {f.name!r} "
-                                f'must be specified with replace()')
-            changes[f.name] = getattr(self, f.name)
-
-    # Create the new object, which calls __init__() and
-    # __post_init__() (if defined), using all of the init fields we've
-    # added and/or left in 'changes'.  If there are values supplied in
-    # changes that aren't fields, this will correctly raise a
-    # TypeError.
-    return self.__class__(**changes)
+    return func_builder.create_fns(cls)
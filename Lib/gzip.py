@@ -8,6 +8,8 @@
 import struct, sys, time, os
 import zlib
 import builtins
+import bisect
+import collections
 import io
 import _compression
 
@@ -23,10 +25,12 @@
 
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
+_PARALLEL_BLOCK_SIZE = 1024 * 1024
 
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *,
+         workers=None, block_size=_PARALLEL_BLOCK_SIZE, index=False):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -40,6 +44,9 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
     GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
     and newline arguments must not be provided.
 
+    The workers, block_size and index arguments are passed to the GzipFile
+    constructor.
+
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
     behavior, and line ending(s).
@@ -57,10 +64,12 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
             raise ValueError("Argument 'newline' not supported in binary mode")
 
     gz_mode = mode.replace("t", "")
+    kwargs = dict(workers=workers, block_size=block_size, index=index)
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel, **kwargs)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               **kwargs)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -99,6 +108,11 @@ def read(self, size):
             return self._buffer[read:] + \
                    self.file.read(size-self._length+read)
 
+    def tell(self):
+        if self._read is None:
+            return self.file.tell()
+        return self.file.tell() - (self._length - self._read)
+
     def prepend(self, prepend=b''):
         if self._read is None:
             self._buffer = prepend
@@ -150,7 +164,8 @@ class GzipFile(_compression.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None,
+                 *, workers=None, block_size=_PARALLEL_BLOCK_SIZE, index=False):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -183,10 +198,27 @@ def __init__(self, filename=None, mode=None,
         If mtime is omitted or None, the current time is used. Use mtime = 0
         to generate a compressed stream that does not depend on creation time.
 
+        If workers is given when writing, the data is split into blocks of
+        block_size bytes which are compressed concurrently by a pool of that
+        many threads.  Each block is written as a separate gzip member, so
+        the compressed file is slightly larger than a file compressed in one
+        piece, but it can be decompressed by any gzip implementation.
+
+        If index is true when reading, the uncompressed and compressed
+        offsets of the start of every gzip member read are recorded, and
+        seek() restarts decompression from the nearest recorded member
+        instead of from the beginning of the file.  This makes random access
+        to multi-member files, such as those written with workers, cheap.
+        The file object must support tell() and seek().
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
             raise ValueError("Invalid mode: {!r}".format(mode))
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be greater than 0")
+        if block_size < 1:
+            raise ValueError("block_size must be greater than 0")
         if mode and 'b' not in mode:
             mode += 'b'
         if fileobj is None:
@@ -204,7 +236,7 @@ def __init__(self, filename=None, mode=None,
 
         if mode.startswith('r'):
             self.mode = READ
-            raw = _GzipReader(fileobj)
+            raw = _GzipReader(fileobj, index=index)
             self._buffer = io.BufferedReader(raw)
             self.name = filename
 
@@ -224,6 +256,9 @@ def __init__(self, filename=None, mode=None,
                                              zlib.DEF_MEM_LEVEL,
                                              0)
             self._write_mtime = mtime
+            self._executor = None
+            if workers is not None:
+                self._init_parallel_write(compresslevel, workers, block_size)
             self._buffer_size = _WRITE_BUFFER_SIZE
             self._buffer = io.BufferedWriter(_WriteBufferStream(self),
                                              buffer_size=self._buffer_size)
@@ -252,6 +287,21 @@ def _init_write(self, filename):
         self.bufsize = 0
         self.offset = 0  # Current file offset for seek(), tell(), etc
 
+    def _init_parallel_write(self, compresslevel, workers, block_size):
+        from concurrent.futures import ThreadPoolExecutor
+        # All the members get the same header timestamp.
+        if self._write_mtime is None:
+            self._write_mtime = time.time()
+        self._compresslevel = compresslevel
+        self._workers = workers
+        self._block_size = block_size
+        self._block = bytearray()
+        self._pending = collections.deque()
+        # The header of the first member is written by the constructor.
+        self._header_written = True
+        self._executor = ThreadPoolExecutor(workers,
+                                            thread_name_prefix='gzip')
+
     def tell(self):
         self._check_not_closed()
         self._buffer.flush()
@@ -310,13 +360,47 @@ def _write_raw(self, data):
             length = data.nbytes
 
         if length > 0:
-            self.fileobj.write(self.compress.compress(data))
-            self.size += length
-            self.crc = zlib.crc32(data, self.crc)
+            if self._executor is not None:
+                self._block += data
+                while len(self._block) >= self._block_size:
+                    self._submit_block(self._block[:self._block_size])
+                    del self._block[:self._block_size]
+            else:
+                self.fileobj.write(self.compress.compress(data))
+                self.size += length
+                self.crc = zlib.crc32(data, self.crc)
             self.offset += length
 
         return length
 
+    def _submit_block(self, block):
+        self._pending.append(self._executor.submit(
+            _compress_block, bytes(block), self._compresslevel))
+        # Limit the amount of memory held by blocks waiting to be written.
+        while len(self._pending) > 2 * self._workers:
+            self._write_member(self._pending.popleft().result())
+
+    def _write_member(self, member):
+        compressed, crc, size = member
+        if self._header_written:
+            self._header_written = False
+        else:
+            self.fileobj.write(_create_simple_gzip_header(
+                self._compresslevel, self._write_mtime))
+        self.fileobj.write(compressed)
+        write32u(self.fileobj, crc)
+        write32u(self.fileobj, size & 0xffffffff)
+
+    def _flush_parallel(self, final=False):
+        # Compress the partially filled block and write all pending members.
+        # The last member is written even if empty to complete the header
+        # written by the constructor.
+        if self._block or (final and self._header_written):
+            self._submit_block(self._block)
+            self._block.clear()
+        while self._pending:
+            self._write_member(self._pending.popleft().result())
+
     def read(self, size=-1):
         self._check_not_closed()
         if self.mode != READ:
@@ -355,14 +439,20 @@ def close(self):
         try:
             if self.mode == WRITE:
                 self._buffer.flush()
-                fileobj.write(self.compress.flush())
-                write32u(fileobj, self.crc)
-                # self.size may exceed 2 GiB, or even 4 GiB
-                write32u(fileobj, self.size & 0xffffffff)
+                if self._executor is not None:
+                    self._flush_parallel(final=True)
+                else:
+                    fileobj.write(self.compress.flush())
+                    write32u(fileobj, self.crc)
+                    # self.size may exceed 2 GiB, or even 4 GiB
+                    write32u(fileobj, self.size & 0xffffffff)
             elif self.mode == READ:
                 self._buffer.close()
         finally:
             self.fileobj = None
+            if self.mode == WRITE and self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._pending.clear()
             myfileobj = self.myfileobj
             if myfileobj:
                 self.myfileobj = None
@@ -372,8 +462,12 @@ def flush(self,zlib_mode=zlib.Z_SYNC_FLUSH):
         self._check_not_closed()
         if self.mode == WRITE:
             self._buffer.flush()
-            # Ensure the compressor's buffer is flushed
-            self.fileobj.write(self.compress.flush(zlib_mode))
+            if self._executor is not None:
+                # Every member ends with a full flush of the compressor.
+                self._flush_parallel()
+            else:
+                # Ensure the compressor's buffer is flushed
+                self.fileobj.write(self.compress.flush(zlib_mode))
             self.fileobj.flush()
 
     def fileno(self):
@@ -482,12 +576,19 @@ def _read_gzip_header(fp):
 
 
 class _GzipReader(_compression.DecompressReader):
-    def __init__(self, fp):
+    def __init__(self, fp, index=False):
         super().__init__(_PaddedFile(fp), zlib._ZlibDecompressor,
                          wbits=-zlib.MAX_WBITS)
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        # The uncompressed and compressed offsets of the members read so far,
+        # or None if no index is kept.
+        if index:
+            self._member_starts = []
+            self._member_offsets = []
+        else:
+            self._member_starts = self._member_offsets = None
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
@@ -525,10 +626,17 @@ def read(self, size=-1):
                 # If the _new_member flag is set, we have to
                 # jump to the next member, if there is one.
                 self._init_read()
+                if self._member_starts is not None:
+                    offset = self._fp.tell()
                 if not self._read_gzip_header():
                     self._size = self._pos
                     return b""
                 self._new_member = False
+                if (self._member_starts is not None and
+                    (not self._member_starts or
+                     self._member_starts[-1] < self._pos)):
+                    self._member_starts.append(self._pos)
+                    self._member_offsets.append(offset)
 
             # Read a chunk of data from the file
             if self._decompressor.needs_input:
@@ -578,6 +686,31 @@ def _rewind(self):
         super()._rewind()
         self._new_member = True
 
+    def seek(self, offset, whence=io.SEEK_SET):
+        if self._member_starts is not None:
+            if whence == io.SEEK_CUR:
+                offset = self._pos + offset
+                whence = io.SEEK_SET
+            elif whence == io.SEEK_END:
+                if self._size < 0:
+                    while self.read(io.DEFAULT_BUFFER_SIZE):
+                        pass
+                offset = self._size + offset
+                whence = io.SEEK_SET
+            if whence == io.SEEK_SET:
+                # Jump to the last member starting at or before offset,
+                # unless it is faster to keep decompressing from here.
+                i = bisect.bisect_right(self._member_starts, offset) - 1
+                if i >= 0 and (offset < self._pos or
+                               self._member_starts[i] > self._pos):
+                    self._fp.seek(self._member_offsets[i])
+                    self._eof = False
+                    self._pos = self._member_starts[i]
+                    self._decompressor = self._decomp_factory(
+                        **self._decomp_args)
+                    self._new_member = True
+        return super().seek(offset, whence)
+
 
 def _create_simple_gzip_header(compresslevel: int,
                                mtime = None) -> bytes:
@@ -600,6 +733,12 @@ def _create_simple_gzip_header(compresslevel: int,
     return struct.pack("<BBBBLBB", 0x1f, 0x8b, 8, 0, int(mtime), xfl, 255)
 
 
+def _compress_block(data, compresslevel):
+    # Run in a worker thread; zlib releases the GIL while compressing.
+    return (zlib.compress(data, level=compresslevel, wbits=-zlib.MAX_WBITS),
+            zlib.crc32(data), len(data))
+
+
 def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=None):
     """Compress data in one shot and return the compressed string.
 
@@ -76,6 +76,7 @@
 import re
 import socket
 import sys
+import collections
 import collections.abc
 from urllib.parse import urlsplit
 
@@ -1444,6 +1445,127 @@ def getresponse(self):
             response.close()
             raise
 
+    def pipeline(self, requests, *, max_in_flight=10):
+        """Send several requests and yield their responses in order.
+
+        `requests' is an iterable of (method, url[, body[, headers]])
+        tuples, with the same meaning as the arguments of request().
+        Up to `max_in_flight' requests are written to the connection
+        before their responses are read, so a batch of requests does not
+        pay one round trip per request.  Requests are taken lazily from
+        the iterable as responses are consumed.
+
+        Responses share the connection and must be consumed in order:
+        when the next response is requested, any unread part of the
+        previous response body is discarded.  If the generator is not
+        exhausted, or if an error occurs, the connection is closed.  If
+        the server closes the connection while requests are outstanding,
+        RemoteDisconnected is raised.
+
+        Pipelining should only be used with idempotent requests.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be greater than 0")
+        if self.__response and self.__response.isclosed():
+            self.__response = None
+        if self.__state != _CS_IDLE or self.__response:
+            raise CannotSendRequest(self.__state)
+
+        requests = iter(requests)
+        pending = collections.deque()   # methods of unanswered requests
+        reader = None
+        response = None
+        try:
+            while True:
+                while len(pending) < max_in_flight:
+                    try:
+                        method, url, *args = next(requests)
+                    except StopIteration:
+                        break
+                    self.request(method, url, *args)
+                    # Allow the next request to be sent before the
+                    # response to this one has been read.
+                    self.__state = _CS_IDLE
+                    pending.append(method)
+                if response is not None:
+                    if not response.isclosed():
+                        response.read()
+                    if response.will_close:
+                        if pending:
+                            raise RemoteDisconnected(
+                                "Remote end closed connection with %d "
+                                "pipelined requests outstanding"
+                                % len(pending))
+                        break
+                if not pending:
+                    break
+                if reader is None:
+                    reader = _PipelineSocket(self.sock.makefile("rb"))
+                method = pending.popleft()
+                if self.debuglevel > 0:
+                    response = self.response_class(reader, self.debuglevel,
+                                                   method=method)
+                else:
+                    response = self.response_class(reader, method=method)
+                response.begin()
+                yield response
+        except:
+            response = None
+            self.close()
+            raise
+        finally:
+            if reader is not None:
+                reader.close()
+            self.__state = _CS_IDLE
+        if response is not None and response.will_close:
+            self.close()
+
+
+class _PipelineSocket:
+    """Socket stand-in sharing one buffered reader between responses.
+
+    Pipelined responses follow each other on the connection, so they
+    must all read from the same buffer; closing the file of a response
+    leaves the shared reader open.
+    """
+
+    def __init__(self, fp):
+        self._fp = fp
+
+    def makefile(self, mode):
+        return _PipelineReader(self._fp)
+
+    def close(self):
+        self._fp.close()
+
+
+class _PipelineReader(io.BufferedIOBase):
+
+    def __init__(self, fp):
+        self._fp = fp
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return self._fp.read(size)
+
+    def read1(self, size=-1):
+        return self._fp.read1(size)
+
+    def readinto(self, b):
+        return self._fp.readinto(b)
+
+    def readline(self, size=-1):
+        return self._fp.readline(size)
+
+    def peek(self, size=0):
+        return self._fp.peek(size)
+
+    def fileno(self):
+        return self._fp.fileno()
+
+
 try:
     import ssl
 except ImportError:
@@ -83,8 +83,9 @@
 __version__ = "0.6"
 
 __all__ = [
-    "HTTPServer", "ThreadingHTTPServer", "BaseHTTPRequestHandler",
-    "SimpleHTTPRequestHandler", "CGIHTTPRequestHandler",
+    "HTTPServer", "ThreadingHTTPServer", "AsyncHTTPServer",
+    "BaseHTTPRequestHandler", "SimpleHTTPRequestHandler",
+    "CGIHTTPRequestHandler",
 ]
 
 import copy
@@ -97,10 +98,12 @@
 import mimetypes
 import os
 import posixpath
+import re
 import select
 import shutil
 import socket # For gethostbyaddr()
 import socketserver
+import stat
 import sys
 import time
 import urllib.parse
@@ -763,17 +766,68 @@ def send_head(self):
                             f.close()
                             return None
 
-            self.send_response(HTTPStatus.OK)
-            self.send_header("Content-type", ctype)
-            self.send_header("Content-Length", str(fs[6]))
-            self.send_header("Last-Modified",
-                self.date_time_string(fs.st_mtime))
+            size = fs[6]
+            last_modified = self.date_time_string(fs.st_mtime)
+            byte_range = self._get_range(size, last_modified)
+            if byte_range is _UNSATISFIABLE_RANGE:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", "bytes */%d" % size)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                f.close()
+                return None
+            if byte_range is not None:
+                start, end = byte_range
+                self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-type", ctype)
+                self.send_header("Content-Range",
+                                 "bytes %d-%d/%d" % (start, end, size))
+                self.send_header("Content-Length", str(end - start + 1))
+                f = _FileRange(f, start, end - start + 1)
+            else:
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-type", ctype)
+                self.send_header("Content-Length", str(size))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Last-Modified", last_modified)
             self.end_headers()
             return f
         except:
             f.close()
             raise
 
+    def _get_range(self, size, last_modified):
+        """Return the byte range requested by the Range header.
+
+        Return an inclusive (start, end) tuple, None to send the whole
+        file, or _UNSATISFIABLE_RANGE.  Only single byte ranges are
+        supported; other Range headers are ignored, as allowed by
+        RFC 9110.
+
+        """
+        value = self.headers.get("Range")
+        if value is None:
+            return None
+        if_range = self.headers.get("If-Range")
+        if if_range is not None and if_range.strip() != last_modified:
+            return None
+        m = re.fullmatch(r"\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*", value)
+        if m is None or not (m[1] or m[2]):
+            return None
+        if not m[1]:
+            # suffix range: the last N bytes
+            length = int(m[2])
+            if not length or not size:
+                return _UNSATISFIABLE_RANGE
+            return max(size - length, 0), size - 1
+        start = int(m[1])
+        if m[2] and int(m[2]) < start:
+            return None
+        if start >= size:
+            return _UNSATISFIABLE_RANGE
+        end = int(m[2]) if m[2] else size - 1
+        return start, min(end, size - 1)
+
     def list_directory(self, path):
         """Helper to produce a directory listing (absent index.html).
 
@@ -874,8 +928,32 @@ def copyfile(self, source, outputfile):
         -- note however that this the default server uses this
         to copy binary data as well.
 
+        When a regular file is copied to the unbuffered self.wfile,
+        it is sent with the connection's sendfile() method, avoiding
+        copies through user space where os.sendfile() is available.
+
         """
-        shutil.copyfileobj(source, outputfile)
+        if outputfile is self.wfile and self._can_sendfile(source):
+            # Let the kernel copy the file to the socket.
+            offset = source.tell()
+            if isinstance(source, _FileRange):
+                count = source.remaining
+            else:
+                count = os.fstat(source.fileno()).st_size - offset
+            if count > 0:
+                self.connection.sendfile(source, offset, count)
+        else:
+            shutil.copyfileobj(source, outputfile)
+
+    def _can_sendfile(self, source):
+        # The output must go directly to the connection socket and the
+        # source must be a regular file.
+        if not isinstance(self.wfile, socketserver._SocketWriter):
+            return False
+        try:
+            return stat.S_ISREG(os.fstat(source.fileno()).st_mode)
+        except (AttributeError, OSError, ValueError):
+            return False
 
     def guess_type(self, path):
         """Guess the type of a file.
@@ -903,6 +981,41 @@ def guess_type(self, path):
         return 'application/octet-stream'
 
 
+_UNSATISFIABLE_RANGE = object()
+
+
+class _FileRange:
+    """Part of a file sent in response to a Range request.
+
+    It is returned by send_head() and limits reads to the requested
+    range, so that copyfile() implementations send the right bytes.
+    """
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self._file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def tell(self):
+        return self._file.tell()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._file.seek(offset, whence)
+
+    def close(self):
+        self._file.close()
+
+
 # Utilities for CGIHTTPRequestHandler
 
 def _url_collapse_path(path):
@@ -1244,6 +1357,242 @@ def run_cgi(self):
                 self.log_message("CGI script exited OK")
 
 
+class _AsyncRequest:
+    """Socket stand-in passing one buffered request to a request handler.
+
+    The handler reads the request from memory and everything it sends is
+    collected, to be written to the transport once the handler returns.
+    Other socket methods are delegated to the connection's socket.
+    """
+
+    def __init__(self, data, sock):
+        self._data = data
+        self._sock = sock
+        self.output = []        # bytes and (file, offset, count) tuples
+        self.keep_alive = False
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+    def settimeout(self, timeout):
+        # Timeouts are applied by the server while reading requests.
+        pass
+
+    def makefile(self, mode, bufsize=None):
+        if 'r' in mode:
+            return _AsyncRequestReader(self._data, self)
+        return socketserver._SocketWriter(self)
+
+    def sendall(self, data):
+        self.output.append(bytes(data))
+
+    def sendfile(self, file, offset=0, count=None):
+        # The handler may close the file before its contents are sent,
+        # so keep a duplicate of the file descriptor.
+        fileno = file.fileno()
+        if count is None:
+            count = os.fstat(fileno).st_size - offset
+        if count > 0:
+            self.output.append((open(os.dup(fileno), 'rb'), offset, count))
+        file.seek(offset + count)
+        return count
+
+
+class _AsyncRequestReader(io.BytesIO):
+
+    def __init__(self, data, request):
+        super().__init__(data)
+        self._request = request
+
+    def readline(self, size=-1):
+        line = super().readline(size)
+        if not line:
+            # BaseHTTPRequestHandler.handle() only reads another request
+            # if the connection should be kept alive.
+            self._request.keep_alive = True
+        return line
+
+
+class AsyncHTTPServer:
+    """HTTP server handling connections on an asyncio event loop.
+
+    Requests are dispatched to the same request handler classes as
+    HTTPServer (e.g. BaseHTTPRequestHandler subclasses).  Each request is
+    read without blocking and the handler is then run in the event loop
+    thread with the request buffered in memory, so it should not block.
+    Idle persistent connections do not occupy a thread.  Handler output
+    is written to the transport once the handler returns; files passed
+    to the connection's sendfile() method are sent with loop.sendfile().
+    """
+
+    # Maximum size of the request line and headers.
+    max_request_head_size = 65536
+
+    # Maximum size of a request body, or None for no limit.
+    max_request_body_size = 64 * 1024 * 1024
+
+    def __init__(self, server_address, RequestHandlerClass):
+        self.server_address = server_address
+        self.RequestHandlerClass = RequestHandlerClass
+        self._server = None
+
+    async def start(self):
+        """Bind the server socket and start accepting connections."""
+        import asyncio
+        host, port = self.server_address[:2]
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port,
+            limit=self.max_request_head_size)
+        self.server_address = self._server.sockets[0].getsockname()
+        host, port = self.server_address[:2]
+        self.server_name = socket.getfqdn(host)
+        self.server_port = port
+
+    async def serve_forever(self):
+        """Accept connections until the task is cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    def close(self):
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+
+    async def wait_closed(self):
+        """Wait until the server and its connections are closed."""
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+        await self.wait_closed()
+
+    def finish_request(self, request, client_address):
+        """Finish one request by instantiating RequestHandlerClass."""
+        self.RequestHandlerClass(request, client_address, self)
+
+    def handle_error(self, request, client_address):
+        """Handle an error gracefully.  May be overridden.
+
+        The default is to print a traceback and continue.
+
+        """
+        socketserver.BaseServer.handle_error(self, request, client_address)
+
+    async def _read_request(self, reader, writer):
+        # Return the request head and body, or None at the end of the
+        # connection.
+        import asyncio
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError as exc:
+            # Without a blank line, the request can still be a complete
+            # HTTP/0.9 request; the handler decides.
+            return (exc.partial, b'') if exc.partial.strip() else None
+        except asyncio.LimitOverrunError:
+            self._write_error(writer, b'431 Request Header Fields Too Large')
+            return None
+
+        lines = head.splitlines()
+        length = None
+        expect_continue = False
+        for line in lines[1:]:
+            name, _, value = line.partition(b':')
+            name = name.strip().lower()
+            if name == b'content-length':
+                # Reject anything but a plain decimal number, and
+                # conflicting values: the body would otherwise be parsed
+                # as the next request.
+                value = value.strip()
+                try:
+                    value = int(value) if value.isdigit() else -1
+                except ValueError:
+                    # Too many digits
+                    value = -1
+                if value < 0 or length not in (None, value):
+                    self._write_error(writer, b'400 Bad Request')
+                    return None
+                length = value
+            elif name == b'transfer-encoding':
+                self._write_error(writer, b'411 Length Required')
+                return None
+            elif name == b'expect':
+                expect_continue = value.strip().lower() == b'100-continue'
+        if not length:
+            return head, b''
+        if (self.max_request_body_size is not None and
+                length > self.max_request_body_size):
+            self._write_error(writer, b'413 Request Entity Too Large')
+            return None
+        words = lines[0].split()
+        if (expect_continue and len(words) == 3 and
+                words[2] >= b'HTTP/1.1' and
+                self.RequestHandlerClass.protocol_version >= 'HTTP/1.1'):
+            # The client waits for an interim response before sending the
+            # body.  The handler sends another one, which clients ignore.
+            writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+        return head, await reader.readexactly(length)
+
+    @staticmethod
+    def _write_error(writer, status):
+        # The connection is closed after the response.
+        writer.write(b'HTTP/1.1 ' + status + b'\r\n'
+                     b'Connection: close\r\nContent-Length: 0\r\n\r\n')
+
+    async def _handle_connection(self, reader, writer):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        client_address = writer.get_extra_info('peername')
+        sock = writer.get_extra_info('socket')
+        timeout = getattr(self.RequestHandlerClass, 'timeout', None)
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout(timeout):
+                        data = await self._read_request(reader, writer)
+                except (TimeoutError, ConnectionError,
+                        asyncio.IncompleteReadError):
+                    break
+                if data is None:
+                    break
+                request = _AsyncRequest(b''.join(data), sock)
+                try:
+                    self.finish_request(request, client_address)
+                except Exception:
+                    self.handle_error(request, client_address)
+                    request.keep_alive = False
+                try:
+                    for item in request.output:
+                        if isinstance(item, bytes):
+                            writer.write(item)
+                        else:
+                            file, offset, count = item
+                            with file:
+                                await writer.drain()
+                                await loop.sendfile(writer.transport, file,
+                                                    offset, count)
+                    await writer.drain()
+                except ConnectionError:
+                    break
+                finally:
+                    for item in request.output:
+                        if not isinstance(item, bytes):
+                            item[0].close()
+                if not request.keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
 def _get_best_family(*address):
     infos = socket.getaddrinfo(
         *address,
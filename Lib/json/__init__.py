@@ -97,13 +97,13 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONStreamDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONStreamDecoder
 from .encoder import JSONEncoder
 import codecs
 
@@ -166,14 +166,19 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
+            default=default, sort_keys=sort_keys, **kw)
+    if type(encoder).iterencode is JSONEncoder.iterencode:
+        # Let the C encoder, if available, write large chunks directly.
+        iterable = encoder.iterencode(obj, _write=fp.write)
+    else:
+        iterable = encoder.iterencode(obj)
     # could accelerate with writelines in some versions of Python, at
     # a debuggability cost
     for chunk in iterable:
@@ -271,6 +276,10 @@ def detect_encoding(b):
     return 'utf-8'
 
 
+# Size of the pieces read by iterload().
+_READ_SIZE = 64 * 1024
+
+
 def load(fp, *, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``fp`` (a ``.read()``-supporting file-like object containing
@@ -296,6 +305,43 @@ def load(fp, *, cls=None, object_hook=None, parse_float=None,
         parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
 
 
+def iterload(fp, *, array=False, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object) and return an iterator over the decoded Python objects.
+
+    If ``array`` is false (the default), ``fp`` contains a sequence of JSON
+    documents separated by optional whitespace, such as JSON Lines, and
+    each document is returned in turn.  If ``array`` is true, ``fp``
+    contains a single JSON array, and its items are returned one by one.
+
+    ``fp`` is read in pieces, and only one decoded object is held in
+    memory at a time.  The other arguments have the same meaning as in
+    ``load()``.
+
+    To use a custom ``JSONStreamDecoder`` subclass, specify it with the
+    ``cls`` kwarg; otherwise ``JSONStreamDecoder`` is used.
+    """
+    if cls is None:
+        cls = JSONStreamDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    decoder = cls(array=array, **kw)
+    while data := fp.read(_READ_SIZE):
+        decoder.feed(data)
+        yield from decoder.read_values()
+    decoder.close()
+    yield from decoder.read_values()
+
+
 def loads(s, *, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``s`` (a ``str``, ``bytes`` or ``bytearray`` instance
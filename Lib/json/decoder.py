@@ -1,5 +1,6 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
 
 from json import scanner
@@ -8,7 +9,7 @@
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONStreamDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -290,7 +291,7 @@ class JSONDecoder(object):
 
     def __init__(self, *, object_hook=None, parse_float=None,
             parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
+            object_pairs_hook=None, cache_keys=False):
         """``object_hook``, if specified, will be called with the result
         of every JSON object decoded and its return value will be used in
         place of the given ``dict``.  This can be used to provide custom
@@ -322,6 +323,14 @@ def __init__(self, *, object_hook=None, parse_float=None,
         characters will be allowed inside strings.  Control characters in
         this context are those with character codes in the 0-31 range,
         including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
+
+        If ``cache_keys`` is true (false is the default), the key strings
+        of JSON objects are kept between calls and shared by all the
+        objects decoded, and the C accelerator also remembers the keys of
+        the objects decoded so far to presize the dicts of objects with
+        the same keys and match their keys without decoding them.  This
+        speeds up decoding many objects with the same keys, for example
+        with ``JSONStreamDecoder``.
         """
         self.object_hook = object_hook
         self.parse_float = parse_float or float
@@ -332,6 +341,7 @@ def __init__(self, *, object_hook=None, parse_float=None,
         self.parse_object = JSONObject
         self.parse_array = JSONArray
         self.parse_string = scanstring
+        self.cache_keys = cache_keys
         self.memo = {}
         self.scan_once = scanner.make_scanner(self)
 
@@ -361,3 +371,163 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+# States of JSONStreamDecoder when decoding the items of an array.
+_ARRAY_START = 0    # expecting '['
+_ARRAY_FIRST = 1    # expecting the first item or ']'
+_ARRAY_ITEM = 2     # expecting an item
+_ARRAY_NEXT = 3     # expecting ',' or ']'
+_ARRAY_END = 4      # only whitespace may follow
+
+# The longest token which can be incomplete at the end of the fed data
+# and still be reported at its start ("-Infinity"); escape sequences
+# ("\uXXXX") are shorter.
+_MAX_TOKEN_LENGTH = 9
+
+# Matches the numbers and the beginnings of numbers ("-", "1.", "1e+"),
+# which may continue in the next piece of the input.
+_NUMBER_PREFIX = re.compile(
+    r'-?(?:(?:0|[1-9]\d*)(?:\.(?:\d+(?:[eE][-+]?\d*)?)?|[eE][-+]?\d*)?)?')
+
+
+class JSONStreamDecoder(JSONDecoder):
+    """Incremental JSON decoder.
+
+    The input is passed to ``feed()`` in pieces as it arrives, and
+    ``read_values()`` returns an iterator over the values which can be
+    decoded from the input fed so far.  ``close()`` is called at the end
+    of the input.  Only the undecoded part of the input is kept, so the
+    memory used is bounded by the size of the largest value.
+
+    If ``array`` is false (the default), the input is a sequence of JSON
+    values separated by optional whitespace, such as JSON Lines
+    (newline-delimited JSON).  If ``array`` is true, the input is a single
+    JSON array, and its items are returned one by one.
+
+    The other arguments are the same as for ``JSONDecoder``.
+    """
+
+    def __init__(self, *, array=False, **kw):
+        super().__init__(**kw)
+        self.array = array
+        self._buffer = ''
+        self._pos = 0
+        self._state = _ARRAY_START if array else _ARRAY_ITEM
+        # Number of undecoded characters needed before retrying to decode
+        # an incomplete value.  It is doubled on each failure, so that
+        # decoding a large value fed in small pieces takes linear time.
+        self._retry_size = 0
+        self._bytes_decoder = None
+        self._pending = b''
+        self._closed = False
+
+    def feed(self, data):
+        """Feed a piece of the input (a ``str``, or a ``bytes`` or
+        ``bytearray`` instance in UTF-8, UTF-16 or UTF-32).
+        """
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        if not isinstance(data, str):
+            if not isinstance(data, (bytes, bytearray)):
+                raise TypeError(f'the JSON object must be str, bytes or '
+                                f'bytearray, not {data.__class__.__name__}')
+            data = self._decode_bytes(data, False)
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+
+    def close(self):
+        """Signal the end of the input.
+
+        The remaining values are then returned by ``read_values()``, which
+        raises ``JSONDecodeError`` if the input is incomplete.
+        """
+        if not self._closed:
+            if self._bytes_decoder is not None or self._pending:
+                self.feed(self._decode_bytes(b'', True))
+            self._closed = True
+
+    def _decode_bytes(self, data, final):
+        if self._bytes_decoder is None:
+            # Detect the encoding from the first bytes, like loads().
+            data = self._pending + data
+            if len(data) < 4 and not final:
+                self._pending = data
+                return ''
+            from json import detect_encoding
+            decoder = codecs.getincrementaldecoder(detect_encoding(data))
+            self._bytes_decoder = decoder('surrogatepass')
+            self._pending = b''
+        return self._bytes_decoder.decode(data, final)
+
+    def read_values(self):
+        """Return an iterator over the values decoded from the input fed
+        so far which were not returned yet.
+        """
+        while (value := self._decode_next()) is not self:
+            yield value
+
+    def _decode_next(self, _w=WHITESPACE.match,
+                     _number_prefix=_NUMBER_PREFIX.fullmatch):
+        # Return the next value, or self if more input is needed.
+        s = self._buffer
+        end = len(s)
+        while True:
+            idx = self._pos = _w(s, self._pos).end()
+            state = self._state
+            if idx == end:
+                if (not self._closed or state == _ARRAY_END or
+                        (state == _ARRAY_ITEM and not self.array)):
+                    return self
+                if state == _ARRAY_NEXT:
+                    raise JSONDecodeError("Expecting ',' delimiter", s, idx)
+                raise JSONDecodeError("Expecting value", s, idx)
+            nextchar = s[idx]
+            if state == _ARRAY_ITEM:
+                break
+            elif state == _ARRAY_FIRST:
+                if nextchar != ']':
+                    break
+                self._state = _ARRAY_END
+            elif state == _ARRAY_NEXT:
+                if nextchar == ',':
+                    self._state = _ARRAY_ITEM
+                elif nextchar == ']':
+                    self._state = _ARRAY_END
+                else:
+                    raise JSONDecodeError("Expecting ',' delimiter", s, idx)
+            elif state == _ARRAY_START:
+                if nextchar != '[':
+                    raise JSONDecodeError("Expecting '['", s, idx)
+                self._state = _ARRAY_FIRST
+            else:
+                raise JSONDecodeError("Extra data", s, idx)
+            self._pos = idx + 1
+
+        if not self._closed:
+            if end - idx < self._retry_size:
+                return self
+            if s[idx] in '-0123456789' and _number_prefix(s, idx, end):
+                # The number may continue in the next piece of the input.
+                return self._incomplete(idx, end)
+        try:
+            obj, vend = self.scan_once(s, idx)
+        except StopIteration as err:
+            if not self._closed and end - err.value < _MAX_TOKEN_LENGTH:
+                return self._incomplete(idx, end)
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+        except JSONDecodeError as err:
+            if not self._closed and (
+                    end - err.pos < _MAX_TOKEN_LENGTH or
+                    err.msg.startswith('Unterminated string')):
+                return self._incomplete(idx, end)
+            raise
+        self._pos = vend
+        self._retry_size = 0
+        if self.array:
+            self._state = _ARRAY_NEXT
+        return obj
+
+    def _incomplete(self, idx, end):
+        self._retry_size = 2 * (end - idx)
+        return self
@@ -12,6 +12,9 @@
     r'(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?',
     (re.VERBOSE | re.MULTILINE | re.DOTALL))
 
+# With cache_keys, the memo is emptied when it grows beyond this size.
+_CACHE_SIZE = 4096
+
 def py_make_scanner(context):
     parse_object = context.parse_object
     parse_array = context.parse_array
@@ -24,6 +27,7 @@ def py_make_scanner(context):
     object_hook = context.object_hook
     object_pairs_hook = context.object_pairs_hook
     memo = context.memo
+    cache_keys = getattr(context, 'cache_keys', False)
 
     def _scan_once(string, idx):
         try:
@@ -66,7 +70,8 @@ def scan_once(string, idx):
         try:
             return _scan_once(string, idx)
         finally:
-            memo.clear()
+            if not cache_keys or len(memo) >= _CACHE_SIZE:
+                memo.clear()
 
     return scan_once
 
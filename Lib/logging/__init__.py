@@ -1018,6 +1018,45 @@ def handle(self, record):
                 self.emit(record)
         return rv
 
+    def emit_batch(self, records):
+        """
+        Do whatever it takes to actually log the specified logging records.
+
+        This version calls emit() for each record. Subclasses may override
+        it to output several records at once more efficiently.
+        """
+        for record in records:
+            self.emit(record)
+
+    def handle_batch(self, records):
+        """
+        Conditionally emit the specified logging records.
+
+        The records which pass the filters which may have been added to the
+        handler are emitted with a single call to emit_batch(), wrapped with
+        acquisition/release of the I/O thread lock. If handle() is overridden
+        in a subclass, it is called for each record instead.
+
+        Returns the list of the log records that were emitted.
+        """
+        emitted = []
+        if type(self).handle is not Handler.handle:
+            for record in records:
+                rv = self.handle(record)
+                if rv:
+                    emitted.append(rv if isinstance(rv, LogRecord) else record)
+            return emitted
+        for record in records:
+            rv = self.filter(record)
+            if isinstance(rv, LogRecord):
+                record = rv
+            if rv:
+                emitted.append(record)
+        if emitted:
+            with self.lock:
+                self.emit_batch(emitted)
+        return emitted
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1149,6 +1188,38 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a list of records.
+
+        The records are formatted as by emit(), then written to the stream
+        with a single write, and the stream is flushed once. If emit() is
+        overridden in a subclass, it is called for each record instead.
+        """
+        if type(self).emit is not StreamHandler.emit:
+            Handler.emit_batch(self, records)
+        else:
+            self._write_batch(records)
+
+    def _write_batch(self, records):
+        msgs = []
+        for record in records:
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:
+                self.handleError(record)
+        if not msgs:
+            return
+        try:
+            self.stream.write(''.join(msgs))
+            self.flush()
+        except RecursionError:  # See issue 36272
+            raise
+        except Exception:
+            self.handleError(records[-1])
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1255,6 +1326,23 @@ def emit(self, record):
         if self.stream:
             StreamHandler.emit(self, record)
 
+    def emit_batch(self, records):
+        """
+        Emit a list of records.
+
+        The stream is opened if needed as by emit(), then the records are
+        written with a single write. If emit() is overridden in a subclass,
+        it is called for each record instead.
+        """
+        if type(self).emit is not FileHandler.emit:
+            Handler.emit_batch(self, records)
+            return
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            self._write_batch(records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
@@ -48,6 +48,9 @@
 
 _MIDNIGHT = 24 * 60 * 60  # number of seconds in a day
 
+# Seconds between polls of a QueueListener.dequeue() without a timeout.
+_DEQUEUE_POLL_INTERVAL = 0.005
+
 class BaseRotatingHandler(logging.FileHandler):
     """
     Base class for handlers that rotate log files at a certain point.
@@ -1499,25 +1502,42 @@ class QueueListener(object):
     list of handlers for processing.
     """
     _sentinel = None
+    # Whether dequeue() accepts a timeout, computed when first needed.
+    _dequeue_has_timeout = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 batch_size=1, batch_timeout=0):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If batch_size is greater than one, up to batch_size records are
+        removed from the queue at once and passed to the handlers together,
+        waiting at most batch_timeout seconds for more records to arrive
+        after the first one.
         """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+        if batch_timeout < 0:
+            raise ValueError('batch_timeout must not be negative')
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
 
-    def dequeue(self, block):
+    def dequeue(self, block, timeout=None):
         """
         Dequeue a record and return it, optionally blocking.
 
+        If timeout is not None, wait at most timeout seconds for a record.
         The base implementation uses get. You may want to override this method
         if you want to use timeouts or work with custom queue implementations.
         """
-        return self.queue.get(block)
+        if timeout is None:
+            return self.queue.get(block)
+        return self.queue.get(block, timeout)
 
     def start(self):
         """
@@ -1556,6 +1576,85 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def handle_batch(self, records):
+        """
+        Handle a list of records.
+
+        This prepares each record, then offers the records to each handler
+        at once, through its handle_batch method if it has one. If handle()
+        is overridden in a subclass, it is called for each record instead.
+        """
+        if type(self).handle is not QueueListener.handle:
+            for record in records:
+                self.handle(record)
+            return
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if not batch:
+                continue
+            handle_batch = getattr(handler, 'handle_batch', None)
+            if handle_batch is not None:
+                handle_batch(batch)
+            else:
+                for record in batch:
+                    handler.handle(record)
+
+    def _dequeue_batch(self, record):
+        """
+        Collect up to batch_size records, starting with the given one.
+
+        Return the records and whether the sentinel was dequeued.
+        """
+        records = [record]
+        if self.batch_timeout:
+            deadline = time.monotonic() + self.batch_timeout
+            if self._dequeue_has_timeout is None:
+                self._dequeue_has_timeout = self._check_dequeue_timeout()
+        while len(records) < self.batch_size:
+            try:
+                if not self.batch_timeout:
+                    record = self.dequeue(False)
+                else:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    if self._dequeue_has_timeout:
+                        record = self.dequeue(True, timeout)
+                    else:
+                        # Poll a dequeue() which can't wait with a timeout.
+                        try:
+                            record = self.dequeue(False)
+                        except queue.Empty:
+                            time.sleep(min(timeout, _DEQUEUE_POLL_INTERVAL))
+                            continue
+            except queue.Empty:
+                break
+            if record is self._sentinel:
+                return records, True
+            records.append(record)
+        return records, False
+
+    def _check_dequeue_timeout(self):
+        """
+        Return whether dequeue() accepts a timeout.
+
+        Subclasses written for Python 3.12 and earlier may override it as
+        dequeue(self, block).
+        """
+        if type(self).dequeue is QueueListener.dequeue:
+            return True
+        import inspect
+        try:
+            inspect.signature(self.dequeue).bind(True, None)
+        except (TypeError, ValueError):
+            return False
+        return True
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1573,9 +1672,18 @@ def _monitor(self):
                     if has_task_done:
                         q.task_done()
                     break
-                self.handle(record)
+                if self.batch_size == 1:
+                    self.handle(record)
+                    if has_task_done:
+                        q.task_done()
+                    continue
+                records, stop = self._dequeue_batch(record)
+                self.handle_batch(records)
                 if has_task_done:
-                    q.task_done()
+                    for _ in range(len(records) + stop):
+                        q.task_done()
+                if stop:
+                    break
             except queue.Empty:
                 break
 
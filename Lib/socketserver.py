@@ -21,6 +21,8 @@
         - synchronous (one request is handled at a time)
         - forking (each request is handled by a new process)
         - threading (each request is handled by a new thread)
+        - thread pool (each request is handled by one of a fixed set of
+          threads)
 
 The classes in this module favor the server type that is simplest to
 write: a synchronous TCP/IP server.  This is bad class design, but
@@ -126,6 +128,7 @@ class will essentially render the service "deaf" while one request is
 import socket
 import selectors
 import os
+import queue
 import sys
 import threading
 from io import BufferedIOBase
@@ -134,7 +137,8 @@ class will essentially render the service "deaf" while one request is
 __all__ = ["BaseServer", "TCPServer", "UDPServer",
            "ThreadingUDPServer", "ThreadingTCPServer",
            "BaseRequestHandler", "StreamRequestHandler",
-           "DatagramRequestHandler", "ThreadingMixIn"]
+           "DatagramRequestHandler", "ThreadingMixIn",
+           "ThreadPoolUDPServer", "ThreadPoolTCPServer", "ThreadPoolMixIn"]
 if hasattr(os, "fork"):
     __all__.extend(["ForkingUDPServer","ForkingTCPServer", "ForkingMixIn"])
 if hasattr(socket, "AF_UNIX"):
@@ -710,6 +714,69 @@ def server_close(self):
         self._threads.join()
 
 
+class ThreadPoolMixIn:
+    """Mix-in class to handle requests in a fixed pool of threads."""
+
+    # Number of worker threads
+    max_workers = 16
+    # Maximum number of accepted requests waiting for a free worker.
+    # When it is reached, the server stops accepting requests until a
+    # worker becomes available, leaving clients in the listen backlog.
+    max_queued_requests = 16
+    # Decides how worker threads will act upon termination of the
+    # main process
+    daemon_threads = False
+    # If true, server_close() waits until the queued requests have been
+    # handled and all worker threads terminate.
+    block_on_close = True
+    # Worker threads, started by the first request
+    _workers = None
+
+    def process_request_thread(self, request, client_address):
+        """Same as in BaseServer but in a worker thread.
+
+        In addition, exception handling is done here.
+
+        """
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def _worker(self, requests):
+        while (item := requests.get()) is not None:
+            self.process_request_thread(*item)
+
+    def process_request(self, request, client_address):
+        """Queue the request for a worker thread.
+
+        Blocks while max_queued_requests requests are already waiting.
+
+        """
+        if self._workers is None:
+            self._requests = queue.Queue(self.max_queued_requests)
+            self._workers = []
+            for _ in range(self.max_workers):
+                t = threading.Thread(target = self._worker,
+                                     args = (self._requests,))
+                t.daemon = self.daemon_threads
+                t.start()
+                self._workers.append(t)
+        self._requests.put((request, client_address))
+
+    def server_close(self):
+        super().server_close()
+        if self._workers is not None:
+            workers, self._workers = self._workers, None
+            for _ in workers:
+                self._requests.put(None)
+            if self.block_on_close:
+                for t in workers:
+                    t.join()
+
+
 if hasattr(os, "fork"):
     class ForkingUDPServer(ForkingMixIn, UDPServer): pass
     class ForkingTCPServer(ForkingMixIn, TCPServer): pass
@@ -717,6 +784,9 @@ class ForkingTCPServer(ForkingMixIn, TCPServer): pass
 class ThreadingUDPServer(ThreadingMixIn, UDPServer): pass
 class ThreadingTCPServer(ThreadingMixIn, TCPServer): pass
 
+class ThreadPoolUDPServer(ThreadPoolMixIn, UDPServer): pass
+class ThreadPoolTCPServer(ThreadPoolMixIn, TCPServer): pass
+
 if hasattr(socket, 'AF_UNIX'):
 
     class UnixStreamServer(TCPServer):
@@ -412,6 +412,48 @@ def cb(loop):
         self.assertTrue(processed)
         self.assertEqual([handle], list(self.loop._ready))
 
+    def test_timer_wheel(self):
+        self.loop._process_events = mock.Mock()
+        now = 100.0
+        self.loop.time = lambda: now
+        calls = []
+
+        h1 = self.loop.call_later(10, calls.append, 'a')
+        h2 = self.loop.call_later(5, calls.append, 'b')
+        self.assertIsNone(self.loop.get_timer_wheel())
+        self.loop.set_timer_wheel(0.25)
+        self.assertEqual(self.loop.get_timer_wheel(), 0.25)
+        # Scheduled callbacks are moved to the timer wheel
+        self.assertEqual(self.loop._scheduled, [])
+        self.assertEqual(len(self.loop._timer_wheel), 2)
+
+        h3 = self.loop.call_later(1, calls.append, 'c')
+        self.loop.call_later(0.9, calls.append, 'd')
+        self.assertTrue(h3._scheduled)
+        h2.cancel()
+        self.assertFalse(h2._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 3)
+
+        now = 100.25
+        self.loop._run_once()
+        self.loop._selector.select.assert_called_with(0.75)
+        self.assertEqual(calls, [])
+        now = 101.0
+        self.loop._run_once()
+        self.assertEqual(calls, ['d', 'c'])
+        self.assertFalse(h3._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
+        self.loop.set_timer_wheel(None)
+        self.assertIsNone(self.loop.get_timer_wheel())
+        self.assertEqual(self.loop._scheduled, [h1])
+        self.assertTrue(h1._scheduled)
+
+        self.assertRaises(ValueError, self.loop.set_timer_wheel, 0)
+        self.assertRaises(ValueError, self.loop.set_timer_wheel, -1)
+        self.assertRaises(ValueError, self.loop.set_timer_wheel, float('nan'))
+        self.assertRaises(ValueError, self.loop.set_timer_wheel, float('inf'))
+
     def test__run_once_cancelled_event_cleanup(self):
         self.loop._process_events = mock.Mock()
 
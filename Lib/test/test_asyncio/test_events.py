@@ -2652,6 +2652,10 @@ def test_not_implemented(self):
             NotImplementedError, loop.remove_signal_handler, 1)
         self.assertRaises(
             NotImplementedError, loop.remove_signal_handler, 1)
+        self.assertRaises(
+            NotImplementedError, loop.set_timer_wheel, 0.001)
+        self.assertRaises(
+            NotImplementedError, loop.get_timer_wheel)
         self.assertRaises(
             NotImplementedError, loop.set_exception_handler, f)
         self.assertRaises(
@@ -525,6 +525,8 @@ def test_pause_writing_3write(self):
         self.loop._run_once()
         self.assertEqual(tr.get_write_buffer_size(), 6)
         self.assertTrue(self.protocol.pause_writing.called)
+        # The pending write, and the buffer joining the later writes
+        self.assertEqual(tr.get_write_buffer_count(), 2)
 
     def test_dont_pause_writing(self):
         tr = self.pause_writing_transport(high=4)
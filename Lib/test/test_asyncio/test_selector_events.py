@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import array
 import collections
 import selectors
 import socket
@@ -805,6 +806,59 @@ def test_writelines_send_partial(self):
         self.assertTrue(self.sock.send.called)
         self.assertTrue(self.loop.writers)
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_buffer_size(self):
+        self.sock.send.side_effect = BlockingIOError
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 3
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_buffer_limits(high=8)
+        transport.write(b'head')
+        self.assertEqual(transport.get_write_buffer_size(), 4)
+        self.assertEqual(transport.get_write_buffer_count(), 1)
+        # Buffers are queued separately, and sent with one sendmsg() call
+        transport.writelines([b'body', bytearray(b'tail')])
+        self.sock.sendmsg.assert_called_once()
+        self.assertEqual(list_to_buffer([b'd', b'body', b'tail']),
+                         transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 9)
+        self.assertEqual(transport.get_write_buffer_count(), 3)
+        self.assertTrue(self.protocol.pause_writing.called)
+
+        self.sock.sendmsg.return_value = 9
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+        self.assertEqual(transport.get_write_buffer_count(), 0)
+        self.assertTrue(self.protocol.resume_writing.called)
+        self.assertFalse(self.loop.writers)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg_memoryview_itemsize(self):
+        data = array.array('i', range(4))
+        nbytes = data.itemsize * len(data)
+        self.sock.send.return_value = 2
+        self.sock.sendmsg = mock.Mock()
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.write(memoryview(data))
+        transport.write(memoryview(data))
+        self.assertEqual(transport.get_write_buffer_size(), 2 * nbytes - 2)
+        self.assertEqual(transport.get_write_buffer_count(), 2)
+
+        # Sent the rest of the first buffer and part of the second one
+        self.sock.sendmsg.return_value = nbytes
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), nbytes - 2)
+        self.assertEqual(list_to_buffer([data.tobytes()[2:]]),
+                         transport._buffer)
+
+        self.sock.sendmsg.return_value = nbytes - 2
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+        self.assertEqual(transport.get_write_buffer_count(), 0)
+        self.assertFalse(self.loop.writers)
+
     @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
     def test_write_sendmsg_full(self):
         data = memoryview(b'data')
@@ -954,6 +1008,23 @@ def test_write_ready_partial_none(self):
         self.loop.assert_writer(7, transport._write_ready)
         self.assertEqual(list_to_buffer([b'data']), transport._buffer)
 
+    def test_write_ready_buffer_size(self):
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.write(b'data1')
+        transport.write(b'data2')
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+        self.assertEqual(transport.get_write_buffer_count(), 2)
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), 6)
+        self.assertEqual(transport.get_write_buffer_count(), 2)
+        self.sock.send.side_effect = OSError()
+        transport._fatal_error = mock.Mock()
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+        self.assertEqual(transport.get_write_buffer_count(), 0)
+
     def test_write_ready_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
 
@@ -965,6 +1036,8 @@ def test_write_ready_tryagain(self):
 
         self.loop.assert_writer(7, transport._write_ready)
         self.assertEqual(buffer, transport._buffer)
+        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+                         transport._buffer)
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
@@ -579,6 +579,134 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        buf = bytearray(4)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 4)
+        self.assertEqual(buf, self.DATA[:4])
+        self.assertEqual(stream._buffer, self.DATA[4:])
+
+        buf = bytearray(100)
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)))
+        self.assertEqual(buf[:n], self.DATA[4:])
+        self.assertEqual(stream._buffer, b'')
+
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(n, 0)
+
+        read_task = self.loop.create_task(stream.readinto(buf))
+        self.loop.call_soon(stream.feed_data, b'data')
+        self.assertEqual(self.loop.run_until_complete(read_task), 4)
+        self.assertEqual(buf[:4], b'data')
+
+        stream.feed_eof()
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 0)
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(ValueError, self.loop.run_until_complete,
+                          stream.readinto(bytearray(2)))
+
+    def test_readinto_buffered_protocol(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+
+        # Without a pending readinto(), data is moved to the stream buffer.
+        view = protocol.get_buffer(-1)
+        view[:5] = b'line\n'
+        protocol.buffer_updated(5)
+        self.assertEqual(stream._buffer, b'line\n')
+        self.assertEqual(
+            self.loop.run_until_complete(stream.readline()), b'line\n')
+
+        # With a pending readinto(), data is received directly into its
+        # buffer.
+        buf = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+        view = protocol.get_buffer(-1)
+        self.assertEqual(len(view), 10)
+        view[:3] = b'abc'
+        protocol.buffer_updated(3)
+        self.assertEqual(stream._buffer, b'')
+        # The buffer is not reused before readinto() returns.
+        self.assertIsNot(protocol.get_buffer(-1).obj, buf)
+        self.assertEqual(self.loop.run_until_complete(read_task), 3)
+        self.assertEqual(buf[:3], b'abc')
+
+        # The buffer of a cancelled readinto() is not used.
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+        read_task.cancel()
+        view = protocol.get_buffer(-1)
+        self.assertIsNot(view.obj, buf)
+        view[:2] = b'xy'
+        protocol.buffer_updated(2)
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(stream._buffer, b'xy')
+
+    def test_readinto_buffered_protocol_cancelled(self):
+        # Data received into the buffer of a readinto() cancelled before
+        # it returns is kept in the stream.
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        buf = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+        view = protocol.get_buffer(-1)
+        view[:5] = b'hello'
+        protocol.buffer_updated(5)
+        read_task.cancel()
+        view = protocol.get_buffer(-1)
+        self.assertIsNot(view.obj, buf)
+        view[:5] = b'world'
+        protocol.buffer_updated(5)
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(stream._buffer, b'helloworld')
+        stream.feed_eof()
+        self.assertEqual(self.loop.run_until_complete(stream.read()),
+                         b'helloworld')
+
+    def test_readinto_stream(self):
+        data = os.urandom(1024 * 1024)
+
+        async def handle_client(client_reader, client_writer):
+            buf = bytearray(1000)
+            while n := await client_reader.readinto(buf):
+                client_writer.write(buf[:n])
+            client_writer.close()
+            await client_writer.wait_closed()
+
+        async def client():
+            server = await asyncio.start_server(
+                handle_client, socket_helper.HOSTv4, 0)
+            addr = server.sockets[0].getsockname()
+            reader, writer = await asyncio.open_connection(*addr)
+            self.assertIsInstance(writer._protocol, asyncio.BufferedProtocol)
+            writer.write(data)
+            writer.write_eof()
+            received = bytearray()
+            buf = bytearray(4096)
+            while n := await reader.readinto(buf):
+                received += buf[:n]
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+            return received
+
+        received = self.loop.run_until_complete(client())
+        self.assertEqual(received, data)
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
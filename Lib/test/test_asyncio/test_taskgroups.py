@@ -823,6 +823,58 @@ async def test_taskgroup_without_parent_task(self):
         with self.assertRaisesRegex(RuntimeError, "has not been entered"):
             tg.create_task(coro)
 
+    async def test_taskgroup_eager_start(self):
+        waiter = asyncio.get_running_loop().create_future()
+
+        async def foo1():
+            return 42
+
+        async def foo2():
+            return await waiter
+
+        async with taskgroups.TaskGroup(eager_start=True) as g:
+            t1 = g.create_task(foo1())
+            self.assertTrue(t1.done())
+            self.assertEqual(t1.result(), 42)
+            t2 = g.create_task(foo2(), name='foo2')
+            self.assertFalse(t2.done())
+            self.assertEqual(t2.get_name(), 'foo2')
+            waiter.set_result(11)
+
+        self.assertEqual(t2.result(), 11)
+
+    async def test_taskgroup_eager_start_error(self):
+
+        async def foo1():
+            await asyncio.sleep(1)
+
+        async def foo2():
+            1 / 0
+
+        with self.assertRaises(ExceptionGroup) as cm:
+            async with taskgroups.TaskGroup(eager_start=True) as g:
+                t1 = g.create_task(foo1())
+                t2 = g.create_task(foo2())
+                self.assertTrue(t2.done())
+
+        self.assertEqual(get_error_types(cm.exception), {ZeroDivisionError})
+        self.assertTrue(t1.cancelled())
+
+    async def test_taskgroup_eager_start_context(self):
+        cvar = contextvars.ContextVar('cvar', default='nope')
+        ctx = contextvars.copy_context()
+        ctx.run(cvar.set, 'yes')
+
+        async def foo():
+            return cvar.get()
+
+        async with taskgroups.TaskGroup(eager_start=True) as g:
+            t1 = g.create_task(foo(), context=ctx)
+            t2 = g.create_task(foo())
+
+        self.assertEqual(t1.result(), 'yes')
+        self.assertEqual(t2.result(), 'nope')
+
     def test_coro_closed_when_tg_closed(self):
         async def run_coro_after_tg_closes():
             async with taskgroups.TaskGroup() as tg:
@@ -3408,6 +3408,56 @@ async def coro(s):
             # NameError should not happen:
             self.one_loop.call_exception_handler.assert_not_called()
 
+    def test_eager_start(self):
+        waiter = self.one_loop.create_future()
+        started = []
+
+        async def coro(s):
+            started.append(s)
+            return s
+
+        async def suspending(s):
+            started.append(s)
+            return await waiter
+
+        async def main():
+            fut = asyncio.gather(coro('abc'), coro('def'), eager_start=True)
+            # Coroutines completing without suspending do not need a
+            # loop iteration
+            self.assertEqual(started, ['abc', 'def'])
+            self.assertTrue(fut.done())
+            self.assertEqual(fut.result(), ['abc', 'def'])
+
+            fut = asyncio.gather(coro('ghi'), suspending('jkl'),
+                                 eager_start=True)
+            self.assertEqual(started[2:], ['ghi', 'jkl'])
+            self.assertFalse(fut.done())
+            waiter.set_result('mno')
+            self.assertEqual(await fut, ['ghi', 'mno'])
+
+        self.one_loop.run_until_complete(main())
+
+    def test_eager_start_task_factory(self):
+        # A custom task factory is used instead of starting tasks eagerly
+        created = []
+
+        def factory(loop, coro, **kwargs):
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+            created.append(task)
+            return task
+
+        async def coro(s):
+            return s
+
+        async def main():
+            fut = asyncio.gather(coro('abc'), eager_start=True)
+            self.assertFalse(fut.done())
+            return await fut
+
+        self.one_loop.set_task_factory(factory)
+        self.assertEqual(self.one_loop.run_until_complete(main()), ['abc'])
+        self.assertEqual(len(created), 2)
+
 
 class RunCoroutineThreadsafeTests(test_utils.TestCase):
     """Test case for asyncio.run_coroutine_threadsafe."""
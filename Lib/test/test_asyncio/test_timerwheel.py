@@ -0,0 +1,144 @@
+"""Tests for timerwheel.py"""
+
+import random
+import unittest
+from unittest import mock
+
+from asyncio import events
+from asyncio import timerwheel
+
+
+def tearDownModule():
+    # not needed for the test file but added for uniformness with all other
+    # asyncio test files for the sake of unified cleanup
+    import asyncio
+    asyncio.set_event_loop_policy(None)
+
+
+class TimerWheelTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = mock.Mock()
+        self.loop.get_debug.return_value = False
+
+    def handle(self, when):
+        return events.TimerHandle(when, mock.Mock(), (), self.loop)
+
+    def test_expire(self):
+        wheel = timerwheel.TimerWheel(0.5, 10.0)
+        self.assertEqual(wheel.resolution, 0.5)
+        self.assertIsNone(wheel.timeout(10.0))
+        h1 = self.handle(12.0)
+        h2 = self.handle(11.2)
+        h3 = self.handle(11.0)
+        for h in h1, h2, h3:
+            wheel.insert(h)
+        self.assertEqual(len(wheel), 3)
+        self.assertEqual(wheel.timeout(10.0), 1.0)
+        self.assertEqual(wheel.expire(10.9), [])
+        self.assertEqual(wheel.expire(11.0), [h3])
+        # Timers are never expired early
+        self.assertEqual(wheel.timeout(11.0), 0.5)
+        self.assertEqual(wheel.expire(11.2), [])
+        self.assertEqual(wheel.expire(11.5), [h2])
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.expire(100.0), [h1])
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.timeout(100.0))
+
+    def test_expire_sorted(self):
+        wheel = timerwheel.TimerWheel(1.0, 0.0)
+        handles = [self.handle(when) for when in (5.9, 5.1, 0.5, 5.5, -1.0)]
+        for h in handles:
+            wheel.insert(h)
+        self.assertEqual(wheel.timeout(0.0), 0)
+        self.assertEqual(wheel.expire(0.0), [handles[4]])
+        self.assertEqual(wheel.expire(10.0),
+                         sorted(handles[:4], key=lambda h: h.when()))
+
+    def test_remove(self):
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        handles = [self.handle(when) for when in (0.0, 0.01, 1.0, 100.0, 1e7)]
+        for h in handles:
+            wheel.insert(h)
+        for h in handles:
+            wheel.remove(h)
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(wheel.handles(), [])
+        self.assertIsNone(wheel.timeout(0.0))
+        # Removing a handle which is not scheduled does nothing
+        wheel.remove(handles[0])
+        self.assertEqual(len(wheel), 0)
+
+    def test_equal_handles(self):
+        wheel = timerwheel.TimerWheel(1.0, 0.0)
+        callback = mock.Mock()
+        h1 = events.TimerHandle(5.0, callback, (), self.loop)
+        h2 = events.TimerHandle(5.0, callback, (), self.loop)
+        self.assertEqual(h1, h2)
+        wheel.insert(h1)
+        wheel.insert(h2)
+        self.assertEqual(len(wheel), 2)
+        wheel.remove(h1)
+        self.assertEqual(wheel.expire(5.0), [h2])
+
+    def test_overflow(self):
+        wheel = timerwheel.TimerWheel(1.0, 0.0)
+        far = 2 ** (timerwheel._BITS * timerwheel._LEVELS) * 3 + 7
+        h1 = self.handle(far)
+        h2 = self.handle(float('inf'))
+        wheel.insert(h1)
+        wheel.insert(h2)
+        self.assertEqual(len(wheel._overflow), 2)
+        self.assertEqual(wheel.expire(far - 1), [])
+        self.assertEqual(wheel.expire(far), [h1])
+        self.assertEqual(wheel.handles(), [h2])
+        self.assertEqual(wheel.expire(far * 2), [])
+        wheel.remove(h2)
+        self.assertEqual(len(wheel), 0)
+
+    def test_clear(self):
+        wheel = timerwheel.TimerWheel(1.0, 0.0)
+        for when in (0.0, 10.0, 1000.0):
+            wheel.insert(self.handle(when))
+        wheel.clear()
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(wheel.handles(), [])
+        self.assertEqual(wheel.expire(2000.0), [])
+
+    def test_random(self):
+        # Compare with the expected expiration of random timers
+        rnd = random.Random(42)
+        resolution = 0.01
+        wheel = timerwheel.TimerWheel(resolution, 0.0)
+        now = 0.0
+        scheduled = {}
+        for i in range(5000):
+            op = rnd.random()
+            if op < 0.5:
+                delay = rnd.choice([0.01, 1, 100, 10_000, 1e8]) * rnd.random()
+                h = self.handle(now + delay)
+                wheel.insert(h)
+                scheduled[id(h)] = h
+            elif op < 0.7 and scheduled:
+                h = scheduled.pop(rnd.choice(list(scheduled)))
+                wheel.remove(h)
+            else:
+                timeout = wheel.timeout(now)
+                if scheduled:
+                    first = min(h.when() for h in scheduled.values())
+                    self.assertLessEqual(now + timeout, first + resolution)
+                else:
+                    self.assertIsNone(timeout)
+                now += rnd.choice([0.01, 1, 100, 10_000]) * rnd.random()
+                expired = wheel.expire(now)
+                for h in expired:
+                    self.assertLessEqual(h.when(), now)
+                    del scheduled[id(h)]
+                for h in scheduled.values():
+                    self.assertGreater(h.when(), now - resolution)
+            self.assertEqual(len(wheel), len(scheduled))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -911,6 +911,8 @@ def test_write_buffer(self, m_write):
         self.assertFalse(m_write.called)
         self.loop.assert_writer(5, tr._write_ready)
         self.assertEqual(bytearray(b'previousdata'), tr._buffer)
+        self.assertEqual(tr.get_write_buffer_size(), 12)
+        self.assertEqual(tr.get_write_buffer_count(), 1)
 
     @mock.patch('os.write')
     def test_write_again(self, m_write):
@@ -0,0 +1,108 @@
+import os
+import unittest
+from concurrent import futures
+from concurrent.futures.interpreter import (
+    BrokenInterpreterPool, ExecutionFailed,
+)
+from test import support
+
+from .executor import ExecutorTest, mul
+from .util import BaseTestCase, InterpreterPoolMixin, setup_module
+
+
+def get_interpreter_id(*args):
+    import _xxsubinterpreters
+    return _xxsubinterpreters.get_current()
+
+
+def get_main_attr(name):
+    import __main__
+    return getattr(__main__, name, None)
+
+
+def set_main_attr(name, value):
+    import __main__
+    setattr(__main__, name, value)
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise TypeError('cannot pickle')
+
+
+def raise_unpicklable():
+    raise ValueError(Unpicklable())
+
+
+class InterpreterPoolExecutorTest(InterpreterPoolMixin, ExecutorTest,
+                                  BaseTestCase):
+    def test_default_workers(self):
+        executor = self.executor_type()
+        expected = min(32, (os.process_cpu_count() or 1) + 4)
+        self.assertEqual(executor._max_workers, expected)
+        executor.shutdown()
+
+    def test_runs_in_subinterpreters(self):
+        main = get_interpreter_id()
+        ids = set(self.executor.map(get_interpreter_id, range(20)))
+        self.assertNotIn(main, ids)
+        self.assertLessEqual(len(ids), self.worker_count)
+
+    def test_isolated(self):
+        # The worker interpreters don't share the __main__ module.
+        set_main_attr('spam', 42)
+        try:
+            self.assertIsNone(self.executor.submit(get_main_attr,
+                                                   'spam').result())
+        finally:
+            set_main_attr('spam', None)
+
+    def test_initializer(self):
+        with self.executor_type(2, initializer=set_main_attr,
+                                initargs=('spam', 'eggs')) as executor:
+            self.assertEqual(executor.submit(get_main_attr, 'spam').result(),
+                             'eggs')
+
+    def test_initializer_failure(self):
+        with self.executor_type(2, initializer=mul,
+                                initargs=(1, 2, 3)) as executor:
+            with support.captured_stderr():
+                future = executor.submit(mul, 1, 2)
+                with self.assertRaises(BrokenInterpreterPool):
+                    future.result()
+        self.assertIsInstance(BrokenInterpreterPool('x'),
+                              futures.thread.BrokenThreadPool)
+
+    def test_unpicklable_arguments(self):
+        with self.assertRaises(TypeError):
+            self.executor.submit(mul, Unpicklable(), 2)
+        with self.assertRaises(AttributeError):
+            self.executor.submit(lambda: None)
+
+    def test_unpicklable_exception(self):
+        future = self.executor.submit(raise_unpicklable)
+        with self.assertRaises(ExecutionFailed) as cm:
+            future.result()
+        self.assertIn('ValueError', str(cm.exception))
+
+    def test_exception_traceback(self):
+        future = self.executor.submit(divmod, 1, 0)
+        with self.assertRaises(ZeroDivisionError) as cm:
+            future.result()
+        self.assertIn('ZeroDivisionError', str(cm.exception.__cause__))
+
+    def test_interpreters_destroyed(self):
+        import _xxsubinterpreters
+        before = len(_xxsubinterpreters.list_all())
+        executor = self.executor_type(3)
+        list(executor.map(mul, range(10), range(10)))
+        executor.shutdown(wait=True)
+        self.assertEqual(len(_xxsubinterpreters.list_all()), before)
+
+
+def setUpModule():
+    setup_module()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,18 @@
+import array
+import copy
+import itertools
 import os
 import sys
 import threading
 import time
 import unittest
+from unittest import mock
 from concurrent import futures
+from concurrent.futures import process
 from concurrent.futures.process import BrokenProcessPool
 
 from test import support
-from test.support import hashlib_helper
+from test.support import hashlib_helper, import_helper
 
 from .executor import ExecutorTest, mul
 from .util import (
@@ -59,6 +64,58 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_adaptive_chunksize(self):
+        ref = list(map(pow, range(500), range(500)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(500), range(500),
+                                   chunksize=None)),
+            ref)
+        for buffersize in (1, 2, 100):
+            with self.subTest(buffersize=buffersize):
+                self.assertEqual(
+                    list(self.executor.map(pow, range(500), range(500),
+                                           chunksize=None,
+                                           buffersize=buffersize)),
+                    ref)
+        self.assertEqual(
+            list(self.executor.map(pow, [], chunksize=None)), [])
+        self.assertRaises(ValueError, self.executor.map, str, range(4),
+                          chunksize=None, buffersize=0)
+        self.assertRaises(TypeError, self.executor.map, str, range(4),
+                          chunksize=None, buffersize=2.0)
+
+    def test_map_adaptive_chunksize_is_lazy(self):
+        res = self.executor.map(str, itertools.count(), chunksize=None,
+                                buffersize=2)
+        self.assertEqual(list(itertools.islice(res, 1000)),
+                         [str(i) for i in range(1000)])
+        res.close()
+
+    def test_map_adaptive_chunksize_exception(self):
+        i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5],
+                              chunksize=None, buffersize=1)
+        self.assertEqual(i.__next__(), (0, 1))
+        self.assertEqual(i.__next__(), (0, 1))
+        self.assertRaises(ZeroDivisionError, i.__next__)
+
+    def test_chunksize_tuner(self):
+        tuner = process._ChunkSizeTuner()
+        self.assertEqual(tuner.chunksize, 1)
+        # Cheap items: the chunk size grows, at most doubling each time.
+        tuner.update(1e-6, 1)
+        self.assertEqual(tuner.chunksize, 2)
+        tuner.update(1e-6, 2)
+        self.assertEqual(tuner.chunksize, 4)
+        # A partial chunk is ignored.
+        tuner.update(1.0, 3)
+        self.assertEqual(tuner.chunksize, 4)
+        # Expensive items: back to one item per chunk.
+        tuner.update(1.0, 4)
+        self.assertEqual(tuner.chunksize, 1)
+        for _ in range(50):
+            tuner.update(0.0, tuner.chunksize)
+        self.assertEqual(tuner.chunksize, tuner.max_chunksize)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -169,6 +226,97 @@ def test_max_tasks_per_child(self):
 
         executor.shutdown()
 
+    @unittest.skipIf(sys.platform == 'win32', 'requires POSIX shared memory')
+    def test_shared_memory_threshold(self):
+        import_helper.import_module("_posixshmem")
+        context = self.get_context()
+        executor = self.executor_type(
+                2, mp_context=context, shared_memory_threshold=1024)
+        with executor:
+            data = bytes(range(256)) * 100
+            self.assertEqual(executor.submit(bytes, data).result(), data)
+            result = executor.submit(bytearray, data).result()
+            self.assertIs(type(result), bytearray)
+            self.assertEqual(result, data)
+            a = array.array('d', range(1000))
+            self.assertEqual(executor.submit(copy.copy, a).result(), a)
+            self.assertEqual(executor.submit(len, data).result(), len(data))
+            self.assertEqual(executor.submit(mul, b'x', 10).result(), b'x' * 10)
+            self.assertEqual(
+                list(executor.map(mul, [b'a', b'b'], [2000, 10])),
+                [b'a' * 2000, b'b' * 10])
+            future = executor.submit(divmod, 1, 0)
+            self.assertRaises(ZeroDivisionError, future.result)
+
+        with self.assertRaises(TypeError):
+            self.executor_type(1, mp_context=context,
+                               shared_memory_threshold=1.5)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, mp_context=context,
+                               shared_memory_threshold=-1)
+
+    @unittest.skipIf(sys.platform == 'win32', 'requires POSIX shared memory')
+    def test_shared_memory_payload(self):
+        import_helper.import_module("_posixshmem")
+        from multiprocessing import shared_memory
+        a = array.array('i', range(1000))
+        view = memoryview(bytearray(4000)).cast('i', (100, 10))
+        data = array.array('b', range(100)) * 20
+        obj = [data, data, bytearray(10), a, view, a]
+        payload = process._SharedMemoryPayload(obj, 1024)
+        # Each large buffer is in a segment, once.
+        self.assertEqual([size for name, size, copy in payload.segments],
+                         [2000, 4000, 4000])
+        result = payload.load()
+        self.assertEqual(result[:4], obj[:4])
+        self.assertIs(result[0], result[1])
+        self.assertEqual(result[4].shape, (100, 10))
+        self.assertEqual(result[4].format, 'i')
+        self.assertFalse(result[4].readonly)
+        self.assertIs(result[3], result[5])
+        # The segments were destroyed.
+        for name, size, copy in payload.segments:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name, track=False)
+
+        for data in b'x' * 2000, bytearray(b'x' * 2000):
+            payload = process._SharedMemoryPayload(data, 1024)
+            self.assertEqual(len(payload.segments), 1)
+            self.assertNotIn(data, payload.data)
+            result = payload.load()
+            self.assertIs(type(result), type(data))
+            self.assertEqual(result, data)
+
+    @unittest.skipIf(sys.platform == 'win32', 'requires POSIX shared memory')
+    def test_shared_memory_broken_pool(self):
+        # The segments of the call items which no worker loaded are
+        # unlinked when the pool breaks.
+        import_helper.import_module("_posixshmem")
+        from multiprocessing import shared_memory
+        names = []
+        store_buffer = process._store_buffer
+
+        def record_buffer(threshold, segments, copied_buffers, buffer):
+            in_band = store_buffer(threshold, segments, copied_buffers,
+                                   buffer)
+            if not in_band:
+                names.append(segments[-1][0])
+            return in_band
+
+        executor = self.executor_type(
+                1, mp_context=self.get_context(), shared_memory_threshold=1024)
+        with mock.patch.object(process, '_store_buffer', record_buffer):
+            fs = [executor.submit(time.sleep, 0.5),
+                  executor.submit(os._exit, 1)]
+            fs += [executor.submit(len, b'x' * 2000) for _ in range(5)]
+            for f in fs[1:]:
+                self.assertRaises(BrokenProcessPool, f.result)
+            executor.shutdown()
+        self.assertTrue(names)
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name, track=False)
+
     def test_max_tasks_per_child_defaults_to_spawn_context(self):
         # not using self.executor as we need to control construction.
         # arguably this could go in another class w/o that mixin.
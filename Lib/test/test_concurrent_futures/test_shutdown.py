@@ -9,8 +9,8 @@
 from test.support.script_helper import assert_python_ok
 
 from .util import (
-    BaseTestCase, ThreadPoolMixin, ProcessPoolForkMixin,
-    ProcessPoolForkserverMixin, ProcessPoolSpawnMixin,
+    BaseTestCase, ThreadPoolMixin, WorkStealingThreadPoolMixin,
+    ProcessPoolForkMixin, ProcessPoolForkserverMixin, ProcessPoolSpawnMixin,
     create_executor_tests, setup_module)
 
 
@@ -252,6 +252,11 @@ def test_cancel_futures_wait_false(self):
         self.assertIn(out.strip(), [b"apple", b""])
 
 
+class WorkStealingThreadPoolShutdownTest(WorkStealingThreadPoolMixin,
+                                         ExecutorShutdownTest, BaseTestCase):
+    pass
+
+
 class ProcessPoolShutdownTest(ExecutorShutdownTest):
     def test_processes_terminate(self):
         def acquire_lock(lock):
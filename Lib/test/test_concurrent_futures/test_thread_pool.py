@@ -9,7 +9,8 @@
 from test import support
 
 from .executor import ExecutorTest, mul
-from .util import BaseTestCase, ThreadPoolMixin, setup_module
+from .util import (
+    BaseTestCase, ThreadPoolMixin, WorkStealingThreadPoolMixin, setup_module)
 
 
 class ThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest, BaseTestCase):
@@ -94,6 +95,62 @@ def log_n_wait(ident):
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
 
+
+class WorkStealingThreadPoolExecutorTest(WorkStealingThreadPoolMixin,
+                                         ThreadPoolExecutorTest):
+    def test_work_stealing(self):
+        # Calls queued for a blocked worker are run by the other workers.
+        executor = self.executor_type(max_workers=2)
+        event = threading.Event()
+        try:
+            blocked = executor.submit(event.wait)
+            executor.submit(abs, 0).result()
+            self.assertEqual(len(executor._threads), 2)
+            fs = [executor.submit(abs, -i) for i in range(10)]
+            self.assertEqual([f.result() for f in fs], list(range(10)))
+            self.assertFalse(blocked.done())
+        finally:
+            event.set()
+            executor.shutdown(wait=True)
+
+    def test_submit_from_worker(self):
+        # Calls submitted from a worker go to its own queue.
+        def submit_nested():
+            fs = [self.executor.submit(mul, i, 2) for i in range(5)]
+            own = self.executor._local.work_queue
+            return own, [f.result() for f in fs]
+
+        own, results = self.executor.submit(submit_nested).result()
+        self.assertEqual(results, [0, 2, 4, 6, 8])
+        self.assertIn(own, self.executor._work_queues)
+        self.assertIsNone(getattr(self.executor._local, 'work_queue', None))
+
+    def test_many_producers(self):
+        def produce(n):
+            return sum(f.result() for f in
+                       [self.executor.submit(mul, i, 1) for i in range(n)])
+
+        with futures.ThreadPoolExecutor(max_workers=8) as producers:
+            totals = list(producers.map(produce, [200] * 8))
+        self.assertEqual(totals, [sum(range(200))] * 8)
+
+    def test_cancel_futures(self):
+        executor = self.executor_type(max_workers=1)
+        started = threading.Event()
+        event = threading.Event()
+        def block():
+            started.set()
+            event.wait()
+        blocked = executor.submit(block)
+        started.wait()
+        fs = [executor.submit(abs, -i) for i in range(5)]
+        executor.shutdown(wait=False, cancel_futures=True)
+        event.set()
+        blocked.result()
+        self.assertTrue(all(f.cancelled() for f in fs))
+        for t in executor._threads:
+            t.join()
+
 def setUpModule():
     setup_module()
 
@@ -9,7 +9,7 @@
     CANCELLED_FUTURE, CANCELLED_AND_NOTIFIED_FUTURE, EXCEPTION_FUTURE,
     SUCCESSFUL_FUTURE,
     create_executor_tests, setup_module,
-    BaseTestCase, ThreadPoolMixin,
+    BaseTestCase, ThreadPoolMixin, WorkStealingThreadPoolMixin,
     ProcessPoolForkMixin, ProcessPoolForkserverMixin, ProcessPoolSpawnMixin)
 
 
@@ -152,7 +152,8 @@ def future_func():
 
 
 create_executor_tests(globals(), WaitTests,
-                      executor_mixins=(ProcessPoolForkMixin,
+                      executor_mixins=(WorkStealingThreadPoolMixin,
+                                       ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
                                        ProcessPoolSpawnMixin))
 
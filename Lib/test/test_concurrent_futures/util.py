@@ -74,6 +74,25 @@ class ThreadPoolMixin(ExecutorMixin):
     executor_type = futures.ThreadPoolExecutor
 
 
+class WorkStealingThreadPoolMixin(ExecutorMixin):
+    executor_type = futures.WorkStealingThreadPoolExecutor
+
+
+def skip_if_no_interpreters(cls):
+    try:
+        import _xxsubinterpreters
+    except ImportError:
+        return unittest.skip("requires the _xxsubinterpreters module")(cls)
+    return cls
+
+
+@skip_if_no_interpreters
+class InterpreterPoolMixin(ExecutorMixin):
+    @property
+    def executor_type(self):
+        return futures.InterpreterPoolExecutor
+
+
 class ProcessPoolForkMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
     ctx = "fork"
@@ -120,6 +139,7 @@ def get_context(self):
 
 def create_executor_tests(remote_globals, mixin, bases=(BaseTestCase,),
                           executor_mixins=(ThreadPoolMixin,
+                                           WorkStealingThreadPoolMixin,
                                            ProcessPoolForkMixin,
                                            ProcessPoolForkserverMixin,
                                            ProcessPoolSpawnMixin)):
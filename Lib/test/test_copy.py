@@ -8,6 +8,10 @@
 
 import unittest
 from test import support
+from test.support import import_helper
+
+py_copy = import_helper.import_fresh_module('copy', blocked=['_copy'])
+c_copy = import_helper.import_fresh_module('copy', fresh=['_copy'])
 
 order_comparisons = le, lt, ge, gt
 equality_comparisons = eq, ne
@@ -899,6 +903,203 @@ def m(self):
         g.b()
 
 
+class TestDeepcopyImplementations:
+    # Tests of the deepcopy() fast paths and memo protocol, run against
+    # both the Python and the C implementation.
+
+    def deepcopy(self, *args):
+        return self.module.deepcopy(*args)
+
+    def test_atomic_items(self):
+        x = [1, 2.5, 'a', None, b'b', True, (1, 'x', None), {'k': 1j}]
+        y = self.deepcopy(x)
+        self.assertEqual(y, x)
+        self.assertIsNot(y, x)
+        self.assertIs(y[6], x[6])
+        self.assertIsNot(y[7], x[7])
+        x = (1, [2], 'a')
+        y = self.deepcopy(x)
+        self.assertEqual(y, x)
+        self.assertIs(y[0], x[0])
+        self.assertIsNot(y[1], x[1])
+
+    def test_memo(self):
+        x = [[1], {'a': [2]}, ([3],), (4,)]
+        memo = {}
+        y = self.deepcopy(x, memo)
+        self.assertEqual(y, x)
+        self.assertIs(memo[id(x)], y)
+        self.assertIs(memo[id(x[0])], y[0])
+        self.assertIs(memo[id(x[1])], y[1])
+        self.assertIs(memo[id(x[2])], y[2])
+        self.assertNotIn(id(x[3]), memo)
+        self.assertEqual(len(memo), 7)
+        keep_alive = memo[id(memo)]
+        self.assertEqual([id(o) for o in keep_alive],
+                         [id(o) for o in (x[0], x[1]['a'], x[1], x[2][0],
+                                          x[2], x)])
+        # Existing memo entries are used.
+        memo = {id(x[0]): 'spam'}
+        y = self.deepcopy(x, memo)
+        self.assertEqual(y[0], 'spam')
+        self.assertEqual(y[1:], x[1:])
+
+    def test_memo_mapping(self):
+        class Memo:
+            def __init__(self):
+                self.data = {}
+            def get(self, key, default=None):
+                return self.data.get(key, default)
+            def __getitem__(self, key):
+                return self.data[key]
+            def __setitem__(self, key, value):
+                self.data[key] = value
+        memo = Memo()
+        x = [[1], ([2],)]
+        y = self.deepcopy(x, memo)
+        self.assertEqual(y, x)
+        self.assertIsNot(y[1], x[1])
+        self.assertIs(memo.data[id(x)], y)
+        self.assertIs(memo.data[id(x[1])], y[1])
+        self.assertEqual(len(memo.data[id(memo)]), 4)
+
+    def test_mutate_while_copying(self):
+        class Grow:
+            def __deepcopy__(self, memo):
+                x.append(3)
+                return 2
+        x = [1, Grow()]
+        self.assertEqual(self.deepcopy(x), [1, 2, 3])
+        class AddKey:
+            def __deepcopy__(self, memo):
+                x['b'] = 2
+                return 1
+        x = {'a': AddKey()}
+        with self.assertRaises(RuntimeError):
+            self.deepcopy(x)
+
+    def test_dispatch(self):
+        class C:
+            pass
+        def copier(x, memo):
+            return 'copied'
+        self.module._deepcopy_dispatch[C] = copier
+        try:
+            self.assertEqual(self.deepcopy([C()]), ['copied'])
+        finally:
+            del self.module._deepcopy_dispatch[C]
+
+    def test_dispatch_override(self):
+        # Overriding the copier of a type handled by a fast path works.
+        def copier(x, memo):
+            return 'copied'
+        dispatch = self.module._deepcopy_dispatch
+        for value in [1], {1: 2}, (1, [2]), 42, 'spam':
+            with self.subTest(value=value):
+                cls = type(value)
+                original = dispatch[cls]
+                dispatch[cls] = copier
+                try:
+                    self.assertEqual(self.deepcopy(value), 'copied')
+                    if cls is list:
+                        self.assertEqual(self.deepcopy({'a': value}),
+                                         {'a': 'copied'})
+                    else:
+                        self.assertEqual(self.deepcopy([value]), ['copied'])
+                finally:
+                    dispatch[cls] = original
+
+    def test_dispatch_table_none(self):
+        # A None reductor in copyreg.dispatch_table is ignored.
+        class C:
+            def __init__(self):
+                self.a = [1]
+        self.module.dispatch_table[C] = None
+        try:
+            x = C()
+            y = self.deepcopy(x)
+        finally:
+            del self.module.dispatch_table[C]
+        self.assertEqual(y.a, [1])
+        self.assertIsNot(y.a, x.a)
+
+    def test_reduce(self):
+        class L(list):
+            def __reduce__(self):
+                return (L, (), vars(self), iter(self))
+        class D(dict):
+            def __reduce__(self):
+                return (D, (), None, None, iter(self.items()))
+        class S:
+            __slots__ = ('a', '__dict__')
+        x = L([[1], 2])
+        x.attr = [3]
+        y = self.deepcopy(x)
+        self.assertIs(type(y), L)
+        self.assertEqual(y, x)
+        self.assertIsNot(y[0], x[0])
+        self.assertEqual(y.attr, [3])
+        self.assertIsNot(y.attr, x.attr)
+        x = D({'a': [1]})
+        y = self.deepcopy(x)
+        self.assertIs(type(y), D)
+        self.assertEqual(y, x)
+        self.assertIsNot(y['a'], x['a'])
+        x = S()
+        x.a = [1]
+        x.b = [2]
+        y = self.deepcopy(x)
+        self.assertEqual((y.a, y.b), ([1], [2]))
+        self.assertIsNot(y.a, x.a)
+        self.assertIsNot(y.b, x.b)
+
+    def test_reduce_errors(self):
+        class C:
+            def __init__(self, rv):
+                self.rv = rv
+            def __reduce__(self):
+                return self.rv
+        for rv in (C,), (C, (), None, None, None, None), 1:
+            with self.subTest(rv=rv):
+                self.assertRaises(TypeError, self.deepcopy, C(rv))
+        self.assertRaises(ValueError, self.deepcopy,
+                          C((dict, (), None, None, iter([(1, 2, 3)]))))
+
+    def test_deep_nesting(self):
+        x = []
+        for i in range(100_000):
+            x = [x]
+        with self.assertRaises(RecursionError):
+            self.deepcopy(x)
+
+
+class TestPyDeepcopy(TestDeepcopyImplementations, unittest.TestCase):
+    module = py_copy
+
+
+@unittest.skipUnless(c_copy, 'requires _copy')
+class TestCDeepcopy(TestDeepcopyImplementations, unittest.TestCase):
+    # The C implementation uses the helpers of the copy module.
+    module = copy
+
+    def test_accelerated(self):
+        self.assertIsNot(copy.deepcopy, py_copy.deepcopy)
+        self.assertEqual(type(copy.deepcopy).__name__,
+                         'builtin_function_or_method')
+
+    def test_module_attributes(self):
+        # The helpers of the copy module are looked up at each call.
+        def copier(x, memo):
+            return 'copied'
+        dispatch = copy._deepcopy_dispatch
+        try:
+            copy._deepcopy_dispatch = {**dispatch, list: copier}
+            self.assertEqual(copy.deepcopy([1]), 'copied')
+        finally:
+            copy._deepcopy_dispatch = dispatch
+        self.assertEqual(copy.deepcopy([1]), [1])
+
+
 class TestReplace(unittest.TestCase):
 
     def test_unsupported(self):
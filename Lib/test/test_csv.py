@@ -4,13 +4,14 @@
 import copy
 import sys
 import unittest
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
 from tempfile import TemporaryFile
 import csv
 import gc
 import pickle
 from test import support
-from test.support import import_helper, check_disallow_instantiation
+from test.support import import_helper, os_helper, check_disallow_instantiation
 from itertools import permutations
 from textwrap import dedent
 from collections import OrderedDict
@@ -1551,6 +1552,204 @@ def test_ordered_dict_reader(self):
             ])
 
 
+class TestReadBatch(unittest.TestCase):
+
+    lines = ['a,1,2.5\r\n', 'b,-2,3\r\n', '\r\n', '"c\r\n', 'd",3,1e3\r\n']
+
+    def test_read_batch(self):
+        r = csv.reader(self.lines)
+        self.assertEqual(r.read_batch(2), [['a', '1', '2.5'], ['b', '-2', '3']])
+        self.assertEqual(r.line_num, 2)
+        self.assertEqual(r.read_batch(0), [])
+        self.assertEqual(r.read_batch(5), [[], ['c\r\nd', '3', '1e3']])
+        self.assertEqual(r.line_num, 5)
+        self.assertEqual(r.read_batch(5), [])
+        r = csv.reader(self.lines)
+        self.assertEqual(r.read_batch(3), list(csv.reader(self.lines))[:3])
+        self.assertEqual(next(r), ['c\r\nd', '3', '1e3'])
+
+    def test_types(self):
+        r = csv.reader(self.lines)
+        rows = r.read_batch(10, types=[None, int, float])
+        self.assertEqual(rows, [['a', 1, 2.5], ['b', -2, 3.0], [],
+                                ['c\r\nd', 3, 1000.0]])
+        self.assertIs(type(rows[1][2]), float)
+        r = csv.reader(['1,2,x\n', '3,4\n'])
+        self.assertEqual(r.read_batch(5, types=(str.upper, float, str.upper,
+                                                int)),
+                         [['1', 2.0, 'X'], ['3', 4.0]])
+        # The types are only used by read_batch().
+        r = csv.reader(['1,2\n', '3,4\n'])
+        self.assertEqual(r.read_batch(1, types=[int, int]), [[1, 2]])
+        self.assertEqual(next(r), ['3', '4'])
+        # None fields are not converted.
+        r = csv.reader(['1,,""\n'], quoting=csv.QUOTE_NOTNULL)
+        self.assertEqual(r.read_batch(1, types=[int, int, str]),
+                         [[1, None, '']])
+
+    def test_types_errors(self):
+        r = csv.reader(['1,x\n', '2,3\n'])
+        with self.assertRaises(ValueError):
+            r.read_batch(2, types=[int, int])
+        self.assertEqual(r.read_batch(1, types=[int, int]), [[2, 3]])
+        with self.assertRaises(TypeError):
+            csv.reader([]).read_batch(1, types=[1])
+        with self.assertRaises(TypeError):
+            csv.reader([]).read_batch(1, types=1)
+        with self.assertRaises(ValueError):
+            csv.reader([]).read_batch(-1)
+        # The rows read before the error are lost.
+        r = csv.reader(['1\n', 'x\n', '2\n'])
+        with self.assertRaises(ValueError):
+            r.read_batch(3, types=[int])
+        self.assertEqual(r.line_num, 2)
+        self.assertEqual(r.read_batch(3, types=[int]), [[2]])
+
+    def test_arguments(self):
+        r = csv.reader(['1\n', '2\n'])
+        self.assertEqual(r.read_batch(size=1, types=[int], columnar=True),
+                         [[1]])
+        with self.assertRaises(TypeError):
+            r.read_batch(1, [int])
+        with self.assertRaises(TypeError):
+            r.read_batch()
+        with self.assertRaises(TypeError):
+            r.read_batch(1.0)
+
+    def test_columnar(self):
+        r = csv.reader(self.lines)
+        self.assertEqual(r.read_batch(10, types=[None, int, float],
+                                      columnar=True),
+                         [['a', 'b', 'c\r\nd'], [1, -2, 3], [2.5, 3.0, 1e3]])
+        self.assertEqual(r.read_batch(10, columnar=True), [])
+        r = csv.reader(['a,b\n', 'c\n'])
+        with self.assertRaisesRegex(csv.Error, 'expected 2 fields, got 1'):
+            r.read_batch(2, columnar=True)
+
+
+class TestParallelReader(unittest.TestCase):
+
+    rows = [['a', 'b c', ''], ['1', 'multi\nline', '"quoted"'],
+            ['x,y', '2', '\xe9\u20ac'], ['"', '\r\n', 'end\n']] * 50
+
+    def write_rows(self, rows, encoding='utf-8', **fmtparams):
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        with open(filename, 'w', newline='', encoding=encoding) as f:
+            csv.writer(f, **fmtparams).writerows(rows)
+        return filename
+
+    def read(self, filename, **kwargs):
+        kwargs.setdefault('encoding', 'utf-8')
+        with ThreadPoolExecutor(2) as executor:
+            return list(csv.parallel_reader(filename, executor=executor,
+                                            **kwargs))
+
+    def test_record_ranges(self):
+        data = b'a,"b\nc"\n"d""\n",e\r\nf\n"\n\n"'
+        for scan_size in 1, 2, 3, 1024:
+            with support.swap_attr(csv, '_SCAN_SIZE', scan_size):
+                with self.subTest(scan_size=scan_size):
+                    ranges = list(csv._record_ranges(BytesIO(data), 1, b'"'))
+                    self.assertEqual(ranges, [(0, 8), (8, 18), (18, 20),
+                                              (20, 24)])
+                    ranges = list(csv._record_ranges(BytesIO(data), 9, b'"'))
+                    self.assertEqual(ranges, [(0, 18), (18, 24)])
+        ranges = list(csv._record_ranges(BytesIO(data), 1, None))
+        self.assertEqual(ranges, [(0, 5), (5, 8), (8, 13), (13, 18),
+                                  (18, 20), (20, 22), (22, 24)])
+        ranges = list(csv._record_ranges(BytesIO(data), None, b'"'))
+        self.assertEqual(ranges, [(0, 24)])
+        self.assertEqual(list(csv._record_ranges(BytesIO(), 1, b'"')), [])
+
+    def test_read(self):
+        filename = self.write_rows(self.rows)
+        for chunk_size in 1, 7, 100, 10**6:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.read(filename, chunk_size=chunk_size),
+                                 self.rows)
+
+    def test_batches(self):
+        filename = self.write_rows(self.rows)
+        with ThreadPoolExecutor(2) as executor:
+            batches = list(csv.parallel_reader(filename, executor=executor,
+                                               encoding='utf-8',
+                                               chunk_size=200, batches=True))
+        self.assertGreater(len(batches), 1)
+        self.assertEqual([row for batch in batches for row in batch],
+                         self.rows)
+
+    def test_dialect(self):
+        filename = self.write_rows(self.rows, dialect='excel-tab')
+        self.assertEqual(self.read(filename, dialect='excel-tab',
+                                   chunk_size=50),
+                         self.rows)
+        filename = self.write_rows(self.rows, delimiter=';', quotechar="'",
+                                   quoting=csv.QUOTE_ALL)
+        self.assertEqual(self.read(filename, delimiter=';', quotechar="'",
+                                   quoting=csv.QUOTE_ALL, chunk_size=50),
+                         self.rows)
+
+    def test_escapechar(self):
+        rows = [['a,b', 'c\nd'], ['e', 'f']] * 10
+        filename = self.write_rows(rows, escapechar='\\',
+                                   quoting=csv.QUOTE_NONE)
+        with ThreadPoolExecutor(2) as executor:
+            batches = list(csv.parallel_reader(filename, executor=executor,
+                                               encoding='utf-8',
+                                               escapechar='\\',
+                                               quoting=csv.QUOTE_NONE,
+                                               chunk_size=1, batches=True))
+        self.assertEqual(batches, [rows])
+
+    def test_encoding(self):
+        for encoding in 'latin-1', 'utf-8-sig', 'cp1252':
+            with self.subTest(encoding=encoding):
+                rows = [[s.replace('\u20ac', '') for s in row]
+                        for row in self.rows]
+                filename = self.write_rows(rows, encoding=encoding)
+                self.assertEqual(self.read(filename, encoding=encoding,
+                                           chunk_size=30),
+                                 rows)
+        filename = self.write_rows(self.rows, encoding='utf-16')
+        with self.assertRaises(ValueError):
+            csv.parallel_reader(filename, encoding='utf-16')
+
+    def test_empty(self):
+        filename = self.write_rows([])
+        self.assertEqual(self.read(filename), [])
+
+    def test_errors(self):
+        filename = self.write_rows(self.rows)
+        with open(filename, 'a', encoding='utf-8') as f:
+            f.write('a,"b"c\n')
+        with self.assertRaises(csv.Error):
+            self.read(filename, chunk_size=100, strict=True)
+        with self.assertRaises(ValueError):
+            csv.parallel_reader(filename, chunk_size=0)
+        with self.assertRaises(TypeError):
+            csv.parallel_reader(filename, delimiter=0)
+
+    def test_close(self):
+        filename = self.write_rows(self.rows)
+        with ThreadPoolExecutor(1) as executor:
+            it = csv.parallel_reader(filename, executor=executor,
+                                     encoding='utf-8', chunk_size=1,
+                                     max_workers=1)
+            self.assertEqual(next(it), self.rows[0])
+            it.close()
+            # The executor is not shut down.
+            self.assertEqual(executor.submit(len, 'ab').result(), 2)
+
+    @support.requires_subprocess()
+    def test_process_pool(self):
+        import_helper.import_module('_multiprocessing')
+        filename = self.write_rows(self.rows)
+        it = csv.parallel_reader(filename, encoding='utf-8',
+                                 max_workers=2, chunk_size=500)
+        self.assertEqual(list(it), self.rows)
+
+
 class MiscTestCase(unittest.TestCase):
     def test__all__(self):
         support.check__all__(self, csv, ('csv', '_csv'))
@@ -1764,6 +1764,62 @@ class C:
         self.assertEqual(astuple(c), (1, 42))
         self.assertIs(type(astuple(c)), tuple)
 
+    def test_helper_generated_fns_per_class(self):
+        # The functions generated for a dataclass are not used for a
+        # dataclass derived from it, which has other fields, but are
+        # for a derived class which is not a dataclass.
+        @dataclass
+        class Base:
+            x: int
+        @dataclass
+        class Derived(Base):
+            y: int
+        class NotADataclass(Base):
+            pass
+        self.assertEqual(asdict(Base(1)), {'x': 1})
+        self.assertEqual(astuple(Base(1)), (1,))
+        self.assertEqual(asdict(Derived(1, 2)), {'x': 1, 'y': 2})
+        self.assertEqual(astuple(Derived(1, 2)), (1, 2))
+        self.assertEqual(replace(Derived(1, 2), y=3), Derived(1, 3))
+        self.assertEqual(asdict(NotADataclass(1)), {'x': 1})
+        self.assertIs(type(replace(NotADataclass(1), x=2)), NotADataclass)
+
+    def test_helper_generated_fns_not_on_class(self):
+        # The generated functions are cached without adding attributes to
+        # the class, and don't keep it alive.
+        @dataclass
+        class C:
+            x: int
+        attrs = set(C.__dict__)
+        c = C(1)
+        self.assertEqual(asdict(c), {'x': 1})
+        self.assertEqual(astuple(c), (1,))
+        self.assertEqual(replace(c, x=2), C(2))
+        self.assertEqual(set(C.__dict__), attrs)
+
+        c_ref = weakref.ref(C)
+        del C, c
+        support.gc_collect()
+        self.assertIsNone(c_ref())
+
+    def test_helper_generated_fns_field_names(self):
+        # Field names which are also names used in the generated functions.
+        @dataclass
+        class C:
+            obj: int
+            self: int
+            dict_factory: list
+            tuple_factory: dict
+            changes: object
+        c = C(1, 2, [3], {4: 5}, C(6, 7, [], {}, None))
+        self.assertEqual(astuple(c),
+                         (1, 2, [3], {4: 5}, (6, 7, [], {}, None)))
+        self.assertEqual(asdict(c)['changes'],
+                         {'obj': 6, 'self': 7, 'dict_factory': [],
+                          'tuple_factory': {}, 'changes': None})
+        self.assertEqual(replace(c, self=8, changes=9),
+                         C(1, 8, [3], {4: 5}, 9))
+
     def test_helper_astuple_raises_on_classes(self):
         # astuple() should raise on a class object.
         @dataclass
@@ -4271,6 +4327,32 @@ class C:
         self.assertEqual(repr(c), "TestReplace.test_recursive_repr_misc_attrs"
                                   ".<locals>.C(f=..., g=1)")
 
+    def test_missing_attribute(self):
+        # A field missing from the object can be specified.
+        @dataclass
+        class C:
+            x: int
+            y: int
+        c = C(1, 2)
+        del c.y
+        self.assertEqual(replace(c, y=3), C(1, 3))
+        with self.assertRaises(AttributeError):
+            replace(c, x=3)
+
+    def test_errors_in_field_order(self):
+        @dataclass
+        class C:
+            a: InitVar[int]
+            b: int = field(init=False, default=0)
+            def __post_init__(self, a):
+                pass
+        c = C(1)
+        with self.assertRaisesRegex(TypeError, "InitVar 'a' must be"):
+            replace(c, b=2)
+        with self.assertRaisesRegex(TypeError, 'field b is declared with '
+                                               'init=False'):
+            replace(c, a=1, b=2)
+
     ## def test_initvar(self):
     ##     @dataclass
     ##     class C:
@@ -835,6 +835,95 @@ def test_write_seek_write(self):
         data = b.getvalue()
         self.assertEqual(gzip.decompress(data), message * 2)
 
+    def test_parallel_write(self):
+        data = bytes(range(256)) * 40
+        for workers in 1, 3:
+            for size in 0, 1, 999, 1000, 1001, len(data):
+                with self.subTest(workers=workers, size=size):
+                    b = io.BytesIO()
+                    with gzip.GzipFile('file.txt', 'wb', fileobj=b, mtime=0,
+                                       workers=workers,
+                                       block_size=100) as f:
+                        for i in range(0, size, 37):
+                            f.write(data[i:min(i + 37, size)])
+                        self.assertEqual(f.tell(), size)
+                    compressed = b.getvalue()
+                    self.assertEqual(gzip.decompress(compressed), data[:size])
+                    # The first member keeps the file name.
+                    self.assertEqual(compressed[3], gzip.FNAME)
+                    self.assertEqual(compressed[10:19], b'file.txt\0')
+                    with gzip.GzipFile(fileobj=io.BytesIO(compressed),
+                                       index=True) as f:
+                        self.assertEqual(f.read(), data[:size])
+                        self.assertEqual(len(f._buffer.raw._member_starts),
+                                         max(-(-size // 100), 1))
+
+    def test_parallel_write_flush(self):
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', workers=2,
+                           block_size=10) as f:
+            f.write(data1)
+            f.flush()
+            partial_data = b.getvalue()
+            # Every member is complete after a flush.
+            self.assertEqual(gzip.decompress(partial_data), data1)
+            f.flush()
+            self.assertEqual(b.getvalue(), partial_data)
+            f.write(data2)
+        self.assertEqual(gzip.decompress(b.getvalue()), data1 + data2)
+
+    def test_parallel_write_bad_params(self):
+        for kwargs in dict(workers=0), dict(block_size=0):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', **kwargs)
+
+    def test_index_seek(self):
+        data = os.urandom(1000) + data1 * 50
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', workers=2,
+                           block_size=200) as f:
+            f.write(data)
+        with gzip.GzipFile(fileobj=io.BytesIO(b.getvalue()), index=True) as f:
+            reader = f._buffer.raw
+            self.assertEqual(f.read(), data)
+            starts = list(range(0, len(data), 200))
+            self.assertEqual(reader._member_starts, starts)
+            def rewind():
+                raise AssertionError("unexpected rewind")
+            reader._rewind = rewind
+            for pos in 5000, 1999, 2000, 0, 450, len(data) - 10, 777:
+                f.seek(pos)
+                self.assertEqual(f.read(30), data[pos:pos + 30])
+            f.seek(-100, io.SEEK_END)
+            self.assertEqual(f.read(), data[-100:])
+            f.seek(250)
+            f.seek(-100, io.SEEK_CUR)
+            self.assertEqual(f.read(10), data[150:160])
+            self.assertEqual(reader._member_starts, starts)
+
+    def test_index_seek_before_read(self):
+        data = data1 * 20 + data2 * 20
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', workers=1,
+                           block_size=100) as f:
+            f.write(data)
+        with gzip.GzipFile(fileobj=io.BytesIO(b.getvalue()), index=True) as f:
+            f.seek(-10, io.SEEK_END)
+            self.assertEqual(f.read(), data[-10:])
+            f.seek(1234)
+            self.assertEqual(f.read(10), data[1234:1244])
+            f.seek(0)
+            self.assertEqual(f.read(10), data[:10])
+
+    def test_index_single_member(self):
+        self.test_write()
+        with gzip.GzipFile(self.filename, index=True) as f:
+            self.assertEqual(f.read(), data1 * 50)
+            f.seek(100)
+            self.assertEqual(f.read(10), (data1 * 50)[100:110])
+            self.assertEqual(f._buffer.raw._member_starts, [0])
+
 
 class TestOpen(BaseTest):
     def test_binary_modes(self):
@@ -920,6 +1009,14 @@ def test_text_modes(self):
             file_data = gzip.decompress(f.read()).decode("ascii")
             self.assertEqual(file_data, uncompressed_raw * 2)
 
+    def test_parallel(self):
+        uncompressed = data1 * 50
+        with gzip.open(self.filename, "wb", workers=2, block_size=100) as f:
+            f.write(uncompressed)
+        with gzip.open(self.filename, "rb", index=True) as f:
+            self.assertEqual(f.read(), uncompressed)
+            self.assertEqual(len(f._buffer.raw._member_starts), 61)
+
     def test_fileobj(self):
         uncompressed_bytes = data1 * 50
         uncompressed_str = uncompressed_bytes.decode("ascii")
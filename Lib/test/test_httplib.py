@@ -1899,6 +1899,88 @@ def test_100_close(self):
         self.assertEqual(conn.connections, 2)
 
 
+class PipelineTest(TestCase):
+
+    responses = (
+        'HTTP/1.1 200 OK\r\n'
+        'Content-Length: 5\r\n'
+        '\r\n'
+        'first'
+        'HTTP/1.1 404 Not Found\r\n'
+        'Transfer-Encoding: chunked\r\n'
+        '\r\n'
+        '6\r\nsecond\r\n0\r\n\r\n'
+        'HTTP/1.1 200 OK\r\n'
+        'Content-Length: 5\r\n'
+        '\r\n'
+        'third'
+    )
+
+    def test_responses_in_order(self):
+        conn = FakeSocketHTTPConnection(self.responses)
+        requests = [('GET', '/1'), ('GET', '/2', None, {'X-Foo': 'bar'}),
+                    ('POST', '/3', b'body')]
+        results = [(resp.status, resp.read())
+                   for resp in conn.pipeline(requests)]
+        self.assertEqual(results, [(200, b'first'), (404, b'second'),
+                                   (200, b'third')])
+        sent = conn.sock.data
+        self.assertLess(sent.index(b'GET /1 '), sent.index(b'GET /2 '))
+        self.assertLess(sent.index(b'GET /2 '), sent.index(b'POST /3 '))
+        self.assertIn(b'X-Foo: bar\r\n', sent)
+        self.assertEqual(conn.connections, 1)
+        # The connection can be used normally afterwards.
+        conn.request('GET', '/4')
+
+    def test_max_in_flight(self):
+        conn = FakeSocketHTTPConnection(self.responses)
+        requests = [('GET', '/%d' % i) for i in range(3)]
+        pipeline = conn.pipeline(requests, max_in_flight=2)
+        resp = next(pipeline)
+        self.assertEqual(conn.sock.data.count(b'GET /'), 2)
+        self.assertEqual(resp.read(), b'first')
+        resp = next(pipeline)
+        self.assertEqual(conn.sock.data.count(b'GET /'), 3)
+        resp = next(pipeline)
+        self.assertEqual(resp.read(), b'third')
+        self.assertRaises(StopIteration, next, pipeline)
+        with self.assertRaises(ValueError):
+            next(conn.pipeline(requests, max_in_flight=0))
+
+    def test_unread_body_discarded(self):
+        conn = FakeSocketHTTPConnection(self.responses)
+        requests = [('GET', '/%d' % i) for i in range(3)]
+        statuses = [resp.status for resp in conn.pipeline(requests)]
+        self.assertEqual(statuses, [200, 404, 200])
+
+    def test_early_close(self):
+        conn = FakeSocketHTTPConnection(
+            'HTTP/1.1 200 OK\r\n'
+            'Connection: close\r\n'
+            'Content-Length: 5\r\n'
+            '\r\n'
+            'first'
+        )
+        pipeline = conn.pipeline([('GET', '/1'), ('GET', '/2')])
+        self.assertEqual(next(pipeline).read(), b'first')
+        self.assertRaises(client.RemoteDisconnected, next, pipeline)
+        self.assertIsNone(conn.sock)
+
+    def test_abandoned(self):
+        conn = FakeSocketHTTPConnection(self.responses)
+        pipeline = conn.pipeline([('GET', '/1'), ('GET', '/2')])
+        next(pipeline)
+        pipeline.close()
+        self.assertIsNone(conn.sock)
+
+    def test_unread_response(self):
+        conn = FakeSocketHTTPConnection(self.responses)
+        conn.request('GET', '/')
+        conn.getresponse()
+        with self.assertRaises(client.CannotSendRequest):
+            next(conn.pipeline([('GET', '/1')]))
+
+
 class HTTPSTest(TestCase):
 
     def setUp(self):
@@ -315,6 +315,162 @@ def test_head_via_send_error(self):
             self.assertEqual(b'', data)
 
 
+class AsyncHTTPServerTestCase(unittest.TestCase):
+
+    class request_handler(NoLogRequestHandler, BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            body = ('%s %s' % (self.path, self.client_address[0])).encode()
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[::-1])
+
+        def do_FILE(self):
+            with open(__file__, 'rb') as f:
+                self.send_response(HTTPStatus.OK)
+                self.send_header('Content-Length', '100')
+                self.end_headers()
+                self.connection.sendfile(f, 10, 100)
+
+        def do_CRASH(self):
+            raise ValueError('crash')
+
+    def setUp(self):
+        import asyncio
+        started = threading.Event()
+
+        async def serve():
+            self.loop = asyncio.get_running_loop()
+            self.stopped = self.loop.create_future()
+            async with server.AsyncHTTPServer(('localhost', 0),
+                                              self.request_handler) as httpd:
+                self.HOST, self.PORT = httpd.server_address[:2]
+                started.set()
+                await self.stopped
+
+        thread = threading.Thread(target=asyncio.run, args=(serve(),))
+        thread.start()
+        self.addCleanup(thread.join)
+        started.wait()
+        self.addCleanup(self.loop.call_soon_threadsafe,
+                        self.stopped.set_result, None)
+
+    def connect(self):
+        con = http.client.HTTPConnection(self.HOST, self.PORT)
+        self.addCleanup(con.close)
+        return con
+
+    def get(self, con, method, path, body=None, headers={}):
+        con.request(method, path, body, headers)
+        res = con.getresponse()
+        return res.status, res.read()
+
+    def test_keep_alive(self):
+        con = self.connect()
+        self.assertEqual(self.get(con, 'GET', '/a'), (200, b'/a 127.0.0.1'))
+        sock = con.sock
+        self.assertEqual(self.get(con, 'POST', '/', b'abc'), (200, b'cba'))
+        self.assertEqual(self.get(con, 'GET', '/b'), (200, b'/b 127.0.0.1'))
+        self.assertIs(con.sock, sock)
+
+    def test_pipelined_requests(self):
+        con = self.connect()
+        responses = [res.read() for res in con.pipeline(
+            [('GET', '/1'), ('POST', '/', b'xyz'), ('GET', '/3')])]
+        self.assertEqual(responses, [b'/1 127.0.0.1', b'zyx', b'/3 127.0.0.1'])
+
+    def test_close(self):
+        for request in (b'GET / HTTP/1.1\r\nConnection: close\r\n\r\n',
+                        b'GET / HTTP/1.0\r\n\r\n'):
+            with socket.create_connection((self.HOST, self.PORT)) as sock:
+                sock.sendall(request)
+                with sock.makefile('rb') as f:
+                    # The server closes the connection after the response.
+                    self.assertTrue(f.read().endswith(b'\r\n/ 127.0.0.1'))
+
+    def test_sendfile(self):
+        with open(__file__, 'rb') as f:
+            f.seek(10)
+            expected = f.read(100)
+        con = self.connect()
+        self.assertEqual(self.get(con, 'FILE', '/'), (200, expected))
+        self.assertEqual(self.get(con, 'GET', '/'), (200, b'/ 127.0.0.1'))
+
+    def test_errors(self):
+        con = self.connect()
+        self.assertEqual(self.get(con, 'SPAM', '/')[0], 501)
+        con = self.connect()
+        with support.captured_stderr() as err:
+            self.assertRaises(http.client.RemoteDisconnected,
+                              self.get, con, 'CRASH', '/')
+        self.assertIn('ValueError: crash', err.getvalue())
+
+    def test_chunked_request_rejected(self):
+        con = self.connect()
+        status, body = self.get(con, 'POST', '/', iter([b'abc']))
+        self.assertEqual(status, 411)
+
+    def raw_request(self, request):
+        with socket.create_connection((self.HOST, self.PORT)) as sock:
+            sock.sendall(request)
+            with sock.makefile('rb') as f:
+                # The server closes the connection after the response.
+                return f.read()
+
+    def test_invalid_content_length(self):
+        for value in (b'-1', b'+3', b'abc', b'3 3', b'1' * 5000):
+            with self.subTest(value=value):
+                response = self.raw_request(
+                    b'POST / HTTP/1.1\r\nContent-Length: ' + value +
+                    b'\r\n\r\nabcGET / HTTP/1.1\r\n\r\n')
+                self.assertTrue(response.startswith(b'HTTP/1.1 400 '))
+                self.assertEqual(response.count(b'HTTP/1.1'), 1)
+        response = self.raw_request(
+            b'POST / HTTP/1.1\r\nContent-Length: 3\r\n'
+            b'Content-Length: 5\r\n\r\nabcdeGET / HTTP/1.1\r\n\r\n')
+        self.assertTrue(response.startswith(b'HTTP/1.1 400 '))
+        self.assertEqual(response.count(b'HTTP/1.1'), 1)
+        # Identical values are accepted
+        response = self.raw_request(
+            b'POST / HTTP/1.1\r\nContent-Length: 3\r\n'
+            b'Content-Length: 3\r\nConnection: close\r\n\r\nabc')
+        self.assertTrue(response.startswith(b'HTTP/1.1 200 '))
+        self.assertTrue(response.endswith(b'cba'))
+
+    def test_body_too_large(self):
+        with mock.patch.object(server.AsyncHTTPServer,
+                               'max_request_body_size', 10):
+            con = self.connect()
+            self.assertEqual(self.get(con, 'POST', '/', b'x' * 10),
+                             (200, b'x' * 10))
+            response = self.raw_request(
+                b'POST / HTTP/1.1\r\nContent-Length: 11\r\n'
+                b'Expect: 100-continue\r\n\r\n')
+            self.assertTrue(response.startswith(b'HTTP/1.1 413 '))
+
+    def test_expect_continue(self):
+        with socket.create_connection((self.HOST, self.PORT)) as sock:
+            sock.sendall(b'POST / HTTP/1.1\r\nContent-Length: 3\r\n'
+                         b'Expect: 100-continue\r\n\r\n')
+            self.assertEqual(sock.recv(100),
+                             b'HTTP/1.1 100 Continue\r\n\r\n')
+            sock.sendall(b'abc')
+            with sock.makefile('rb') as f:
+                response = http.client.HTTPResponse(sock)
+                response.fp = f
+                response.begin()
+                self.assertEqual(response.read(), b'cba')
+
+
 class RequestHandlerLoggingTestCase(BaseTestCase):
     class request_handler(BaseHTTPRequestHandler):
         protocol_version = 'HTTP/1.1'
@@ -586,6 +742,72 @@ def test_browser_cache_with_If_None_Match_header(self):
         response = self.request(self.base_url + '/test', headers=headers)
         self.check_status_and_reason(response, HTTPStatus.OK)
 
+    def test_sendfile(self):
+        with mock.patch.object(socket.socket, 'sendfile',
+                               autospec=True,
+                               side_effect=socket.socket.sendfile) as m:
+            response = self.request(self.base_url + '/test')
+            self.check_status_and_reason(response, HTTPStatus.OK, self.data)
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(m.call_args.args[2:], (0, len(self.data)))
+        self.assertEqual(response.getheader('accept-ranges'), 'bytes')
+
+    def test_range(self):
+        size = len(self.data)
+        tests = [
+            ('bytes=3-9', self.data[3:10], 'bytes 3-9/%d' % size),
+            ('bytes=3-', self.data[3:], 'bytes 3-%d/%d' % (size - 1, size)),
+            ('bytes=-5', self.data[-5:],
+             'bytes %d-%d/%d' % (size - 5, size - 1, size)),
+            ('bytes=0-1000', self.data, 'bytes 0-%d/%d' % (size - 1, size)),
+            ('bytes = 2 - 2', self.data[2:3], 'bytes 2-2/%d' % size),
+        ]
+        for value, data, content_range in tests:
+            with self.subTest(value):
+                response = self.request(self.base_url + '/test',
+                                        headers={'Range': value})
+                self.check_status_and_reason(
+                    response, HTTPStatus.PARTIAL_CONTENT, data)
+                self.assertEqual(response.getheader('content-range'),
+                                 content_range)
+                self.assertEqual(response.getheader('content-length'),
+                                 str(len(data)))
+
+        # Copying a range without sendfile()
+        with mock.patch.object(self.request_handler, '_can_sendfile',
+                               return_value=False):
+            response = self.request(self.base_url + '/test',
+                                    headers={'Range': 'bytes=3-9'})
+            self.check_status_and_reason(
+                response, HTTPStatus.PARTIAL_CONTENT, self.data[3:10])
+
+    def test_range_ignored(self):
+        for value in ('bytes=1-2,4-5', 'bytes=5-2', 'bytes=-', 'lines=1-2'):
+            with self.subTest(value):
+                response = self.request(self.base_url + '/test',
+                                        headers={'Range': value})
+                self.check_status_and_reason(response, HTTPStatus.OK,
+                                             self.data)
+        response = self.request(self.base_url + '/test',
+                                headers={'Range': 'bytes=3-9',
+                                         'If-Range': '"etag"'})
+        self.check_status_and_reason(response, HTTPStatus.OK, self.data)
+        response = self.request(self.base_url + '/test',
+                                headers={'Range': 'bytes=3-9',
+                                         'If-Range': self.last_modif_header})
+        self.check_status_and_reason(response, HTTPStatus.PARTIAL_CONTENT,
+                                     self.data[3:10])
+
+    def test_range_not_satisfiable(self):
+        for value in ('bytes=%d-' % len(self.data), 'bytes=-0'):
+            with self.subTest(value):
+                response = self.request(self.base_url + '/test',
+                                        headers={'Range': value})
+                self.check_status_and_reason(
+                    response, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.assertEqual(response.getheader('content-range'),
+                                 'bytes */%d' % len(self.data))
+
     def test_invalid_requests(self):
         response = self.request('/', method='FOO')
         self.check_status_and_reason(response, HTTPStatus.NOT_IMPLEMENTED)
@@ -103,6 +103,36 @@ def test_limit_int(self):
             with self.assertRaises(ValueError):
                 self.loads('1' * (maxdigits + 1))
 
+    def test_cache_keys(self):
+        s = ('[{"a": 1, "b": {"c": 2}}, {"a": 3, "b": {"c": 4}},'
+             ' {"a": 5, "d": 6}, {"a": 7}, {"a": 8, "a": 9}, {"a": 10, "a": 11},'
+             ' {}, {"a\\"b": 1, "\\u00e9\\u1234": 2},'
+             ' {"a\\"b": 3, "\\u00e9\\u1234": 4}, {"\\u0001": 5}]')
+        expected = self.loads(s)
+        decoder = self.json.JSONDecoder(cache_keys=True)
+        for i in range(3):
+            self.assertEqual(decoder.decode(s), expected)
+        self.assertEqual(self.loads(s, cache_keys=True,
+                                    object_pairs_hook=OrderedDict),
+                         self.loads(s, object_pairs_hook=OrderedDict))
+
+    def test_cache_keys_shared(self):
+        decoder = self.json.JSONDecoder(cache_keys=True)
+        a = decoder.decode('[{"key": 1}, {"key": 2}]')
+        b = decoder.decode('{"key": 3}')
+        keys = [next(iter(d)) for d in a + [b]]
+        self.assertIs(keys[0], keys[1])
+        self.assertIs(keys[0], keys[2])
+
+    def test_cache_keys_strict(self):
+        # A cached key does not match a string which is invalid in strict
+        # mode.
+        decoder = self.json.JSONDecoder(cache_keys=True)
+        self.assertEqual(decoder.decode('{"a": 1, "\\t": 2}'),
+                         {'a': 1, '\t': 2})
+        with self.assertRaises(self.JSONDecodeError):
+            decoder.decode('{"a": 1, "\t": 2}')
+
 
 class TestPyDecode(TestDecode, PyTest): pass
 class TestCDecode(TestDecode, CTest): pass
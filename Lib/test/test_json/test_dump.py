@@ -57,6 +57,38 @@ def __lt__(self, o):
         d[1337] = "true.dat"
         self.assertEqual(self.dumps(d, sort_keys=True), '{"1337": "true.dat"}')
 
+    def test_dump_large(self):
+        # Large documents are written in several chunks.
+        obj = [{'key': i, 'value': [str(i)] * 3} for i in range(20000)]
+        for indent in None, 2:
+            with self.subTest(indent=indent):
+                writes = []
+                class Writer:
+                    def write(self, chunk):
+                        writes.append(chunk)
+                self.json.dump(obj, Writer(), indent=indent)
+                self.assertGreater(len(writes), 1)
+                self.assertEqual(''.join(writes),
+                                 self.dumps(obj, indent=indent))
+
+    def test_dump_write_error(self):
+        class Writer:
+            def write(self, chunk):
+                1/0
+        with self.assertRaises(ZeroDivisionError):
+            self.json.dump(list(range(100000)), Writer())
+
+    def test_dump_subclass_iterencode(self):
+        # json.dump() uses an overridden iterencode().
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield '['
+                yield from super().iterencode(o, _one_shot)
+                yield ']'
+        sio = StringIO()
+        self.json.dump({'a': 1}, sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), '[{"a": 1}]')
+
 
 class TestPyDump(TestDump, PyTest): pass
 
@@ -62,6 +62,45 @@ def check(indent, expected):
         # indent=None is more compact
         check(None, '{"3": 1}')
 
+    def test_indent_nested(self):
+        h = {'a': [[], {}, [{'b': [1, [2]]}]], 'c': {'d': {}}}
+        expected = textwrap.dedent("""\
+        {
+        .."a": [
+        ....[],
+        ....{},
+        ....[
+        ......{
+        ........"b": [
+        ..........1,
+        ..........[
+        ............2
+        ..........]
+        ........]
+        ......}
+        ....]
+        ..],
+        .."c": {
+        ...."d": {}
+        ..}
+        }""").replace('..', '.')
+        self.assertEqual(self.dumps(h, indent='.'), expected)
+        sio = StringIO()
+        self.json.dump(h, sio, indent='.')
+        self.assertEqual(sio.getvalue(), expected)
+
+    def test_indent_skipkeys(self):
+        self.assertEqual(self.dumps({b'x': 1}, indent=2, skipkeys=True),
+                         '{\n  \n}')
+        self.assertEqual(self.dumps({b'x': 1, 'y': 2, b'z': 3},
+                                    indent=2, skipkeys=True),
+                         '{\n  "y": 2\n}')
+
+    def test_indent_level(self):
+        enc = self.json.JSONEncoder(indent=2)
+        self.assertEqual(''.join(enc.iterencode([1, {'a': 2}], True)),
+                         '[\n  1,\n  {\n    "a": 2\n  }\n]')
+
 
 class TestPyIndent(TestIndent, PyTest): pass
 class TestCIndent(TestIndent, CTest): pass
@@ -68,6 +68,39 @@ def test_bad_markers_argument_to_encoder(self):
             self.json.encoder.c_make_encoder(1, None, None, None, ': ', ', ',
                                              False, False, False)
 
+    def test_bad_indent_argument_to_encoder(self):
+        with self.assertRaisesRegex(
+            TypeError,
+            r'make_encoder\(\) argument 4 must be str or None, not int',
+        ):
+            self.json.encoder.c_make_encoder(None, None, None, 2, ': ', ', ',
+                                             False, False, False)
+
+    def test_indent(self):
+        enc = self.json.encoder.c_make_encoder(None, None,
+                                               self.json.encoder.encode_basestring,
+                                               '  ', ': ', ',',
+                                               False, False, False)
+        self.assertEqual(enc([1, {'a': 2}], 0),
+                         ('[\n  1,\n  {\n    "a": 2\n  }\n]',))
+        self.assertEqual(enc([1, {'a': 2}], 1),
+                         ('[\n    1,\n    {\n      "a": 2\n    }\n  ]',))
+
+    def test_write(self):
+        enc = self.json.encoder.c_make_encoder(None, None,
+                                               self.json.encoder.encode_basestring,
+                                               None, ': ', ', ',
+                                               False, False, False)
+        chunks = []
+        obj = [{'a': i} for i in range(50000)]
+        self.assertIsNone(enc(obj, 0, chunks.append))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunks))
+        self.assertEqual(''.join(chunks), enc(obj, 0)[0])
+        chunks.clear()
+        self.assertIsNone(enc('spam', 0, chunks.append))
+        self.assertEqual(chunks, ['"spam"'])
+
     def test_bad_bool_args(self):
         def test(name):
             self.json.encoder.JSONEncoder(**{name: BadBool()}).encode({'a': 1})
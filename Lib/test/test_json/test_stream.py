@@ -0,0 +1,159 @@
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+DOC = [
+    {'a': 1, 'b': [1.5, -2e10, 'xሴ\\"y', None, True, False], 'c': {}},
+    -1, 12345, 'spam', [], {}, -0.5, [[1, [2]], {'d': [3]}],
+]
+
+
+class TestStream:
+    def decode_pieces(self, pieces, **kw):
+        decoder = self.json.JSONStreamDecoder(**kw)
+        values = []
+        for piece in pieces:
+            decoder.feed(piece)
+            values.extend(decoder.read_values())
+        decoder.close()
+        values.extend(decoder.read_values())
+        return values
+
+    def split(self, s, size):
+        return [s[i:i + size] for i in range(0, len(s), size)]
+
+    def test_values(self):
+        s = '\n'.join(self.dumps(v) for v in DOC)
+        for size in 1, 2, 3, 7, len(s):
+            with self.subTest(size=size):
+                self.assertEqual(self.decode_pieces(self.split(s, size)), DOC)
+
+    def test_array(self):
+        s = self.dumps(DOC, indent=2)
+        for size in 1, 2, 3, 7, len(s):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    self.decode_pieces(self.split(s, size), array=True), DOC)
+        self.assertEqual(self.decode_pieces([' [ ] '], array=True), [])
+        self.assertEqual(self.decode_pieces(['[', '1', '2', ']'], array=True),
+                         [12])
+
+    def test_numbers_split(self):
+        # A number may be split after any of its characters.
+        numbers = [1.5, 2e3, -7, -0.25, 1E+2, 3e-4, 10, 0, -1.5e-10]
+        lines = '\n'.join(map(repr, numbers)) + '\n'
+        array = '[' + ', '.join(map(repr, numbers)) + ']'
+        for i in range(len(lines) + 1):
+            with self.subTest(i=i):
+                self.assertEqual(
+                    self.decode_pieces([lines[:i], lines[i:]]), numbers)
+        for i in range(len(array) + 1):
+            with self.subTest(i=i):
+                self.assertEqual(
+                    self.decode_pieces([array[:i], array[i:]], array=True),
+                    numbers)
+        for i in range(len(array) + 1):
+            for j in range(i, len(array) + 1):
+                pieces = [array[:i], array[i:j], array[j:]]
+                self.assertEqual(self.decode_pieces(pieces, array=True),
+                                 numbers, pieces)
+        self.assertEqual(self.decode_pieces(['[1.', '5, 2e', '3, -', '7]'],
+                                            array=True),
+                         [1.5, 2e3, -7])
+        self.assertEqual(self.decode_pieces(['1.', '5\n']), [1.5])
+        self.assertEqual(self.decode_pieces(['-', '1', ' 2', 'e', '+', '1']),
+                         [-1, 20.0])
+
+    def test_values_separators(self):
+        self.assertEqual(self.decode_pieces(['1 2', '3\n\n[]{}"a""b"\r\n']),
+                         [1, 23, [], {}, 'a', 'b'])
+        self.assertEqual(self.decode_pieces(['', ' \n ']), [])
+        self.assertEqual(self.decode_pieces(['tr', 'ue', 'nu', 'll']),
+                         [True, None])
+        self.assertEqual(self.decode_pieces(['-Infin', 'ity NaN']),
+                         [float('-inf'), self.json.decoder.NaN])
+
+    def test_incremental(self):
+        # Values are returned as soon as they are complete.
+        decoder = self.json.JSONStreamDecoder(array=True)
+        decoder.feed('[{"a": 1}, "b", 2')
+        self.assertEqual(list(decoder.read_values()), [{'a': 1}, 'b'])
+        decoder.feed('3, [')
+        self.assertEqual(list(decoder.read_values()), [23])
+        decoder.feed(']]')
+        self.assertEqual(list(decoder.read_values()), [[]])
+        decoder.close()
+        self.assertEqual(list(decoder.read_values()), [])
+        with self.assertRaises(ValueError):
+            decoder.feed('[]')
+
+    def test_bytes(self):
+        s = '\n'.join(self.dumps(v, ensure_ascii=False) for v in DOC)
+        for encoding in 'utf-8', 'utf-8-sig', 'utf-16', 'utf-32-be':
+            with self.subTest(encoding=encoding):
+                b = s.encode(encoding)
+                self.assertEqual(self.decode_pieces(self.split(b, 1)), DOC)
+        self.assertEqual(self.decode_pieces([b'1'], array=False), [1])
+        with self.assertRaises(TypeError):
+            self.json.JSONStreamDecoder().feed(1)
+
+    def test_hooks(self):
+        decoder = self.json.JSONStreamDecoder(object_pairs_hook=list,
+                                              parse_float=str)
+        decoder.feed('{"a": 1.5, "b": 2} [0.25]')
+        decoder.close()
+        self.assertEqual(list(decoder.read_values()),
+                         [[('a', '1.5'), ('b', 2)], ['0.25']])
+
+    def test_errors(self):
+        for s, array, msg, pos in [
+            ('', True, 'Expecting value', 0),
+            ('{}', True, "Expecting '['", 0),
+            ('[', True, 'Expecting value', 1),
+            ('[1, 2', True, "Expecting ',' delimiter", 5),
+            ('[1 2]', True, "Expecting ',' delimiter", 3),
+            ('[1,]', True, 'Expecting value', 3),
+            ('[1] 2', True, 'Extra data', 4),
+            ('{"a": 1', False, "Expecting ',' delimiter", 7),
+            ('1 x', False, 'Expecting value', 2),
+            ('"abc', False, 'Unterminated string starting at', 0),
+        ]:
+            with self.subTest(s=s):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.decode_pieces([s], array=array)
+                self.assertEqual(cm.exception.msg, msg)
+                self.assertEqual(cm.exception.pos, pos)
+
+    def test_errors_before_close(self):
+        # Errors are reported without waiting for the end of the input.
+        decoder = self.json.JSONStreamDecoder()
+        decoder.feed('1 {"a": x} ' + ' ' * 20)
+        values = decoder.read_values()
+        self.assertEqual(next(values), 1)
+        with self.assertRaises(self.JSONDecodeError):
+            next(values)
+
+    def test_iterload(self):
+        s = '\n'.join(self.dumps(v) for v in DOC)
+        self.assertEqual(list(self.json.iterload(StringIO(s))), DOC)
+        self.assertEqual(list(self.json.iterload(BytesIO(s.encode()))), DOC)
+        s = self.dumps(DOC)
+        self.assertEqual(list(self.json.iterload(StringIO(s), array=True)),
+                         DOC)
+        self.assertEqual(
+            list(self.json.iterload(StringIO('{"a": 1.5}'),
+                                    object_hook=lambda d: d['a'],
+                                    parse_float=str)),
+            ['1.5'])
+
+    def test_iterload_large(self):
+        items = [{'key': i, 'value': 'x' * (i % 100)} for i in range(20000)]
+        s = self.dumps(items)
+        self.assertGreater(len(s), 1024 * 1024)
+        it = self.json.iterload(StringIO(s), array=True)
+        self.assertEqual(next(it), items[0])
+        self.assertEqual(list(it), items[1:])
+
+
+class TestPyStream(TestStream, PyTest): pass
+class TestCStream(TestStream, CTest): pass
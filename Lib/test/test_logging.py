@@ -853,6 +853,72 @@ def test_can_represent_stream_with_int_name(self):
         h = logging.StreamHandler(StreamWithIntName())
         self.assertEqual(repr(h), '<StreamHandler 2 (NOTSET)>')
 
+    def test_handle_batch(self):
+        class Stream(io.StringIO):
+            writes = flushes = 0
+            def write(self, data):
+                self.writes += 1
+                return super().write(data)
+            def flush(self):
+                self.flushes += 1
+        stream = Stream()
+        h = logging.StreamHandler(stream)
+        h.setFormatter(logging.Formatter('%(levelname)s:%(message)s'))
+        h.addFilter(lambda record: record.msg != 'skip')
+        records = [logging.makeLogRecord({'msg': msg, 'levelname': 'INFO'})
+                   for msg in ('a', 'skip', 'b', 'c')]
+        emitted = h.handle_batch(records)
+        self.assertEqual([r.msg for r in emitted], ['a', 'b', 'c'])
+        self.assertEqual(stream.getvalue(), 'INFO:a\nINFO:b\nINFO:c\n')
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(stream.flushes, 1)
+        self.assertEqual(h.handle_batch(records[1:2]), [])
+        self.assertEqual(stream.writes, 1)
+
+    def test_handle_batch_error_handling(self):
+        h = TestStreamHandler(BadStream())
+        records = [logging.makeLogRecord({'msg': 'a'}),
+                   logging.makeLogRecord({'msg': 'b'})]
+        h.handle_batch(records)
+        self.assertIs(h.error_record, records[-1])
+
+        # A record which cannot be formatted doesn't prevent writing the
+        # others.
+        h = TestStreamHandler(io.StringIO())
+        bad = logging.makeLogRecord({'msg': '%d', 'args': ('x',)})
+        h.handle_batch([records[0], bad, records[1]])
+        self.assertIs(h.error_record, bad)
+        self.assertEqual(h.stream.getvalue(), 'a\nb\n')
+
+    def test_handle_batch_overridden_emit(self):
+        # Subclasses overriding emit() get it called for each record.
+        class Handler(logging.StreamHandler):
+            def emit(self, record):
+                super().emit(record)
+                emitted.append(record.msg)
+        emitted = []
+        h = Handler(io.StringIO())
+        h.handle_batch([logging.makeLogRecord({'msg': 'a'}),
+                        logging.makeLogRecord({'msg': 'b'})])
+        self.assertEqual(emitted, ['a', 'b'])
+        self.assertEqual(h.stream.getvalue(), 'a\nb\n')
+
+    def test_handle_batch_overridden_handle(self):
+        # Subclasses overriding handle() get it called for each record.
+        class Handler(logging.StreamHandler):
+            def handle(self, record):
+                handled.append(record.msg)
+                if record.msg != 'skip':
+                    return super().handle(record)
+        handled = []
+        h = Handler(io.StringIO())
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('a', 'skip', 'b')]
+        emitted = h.handle_batch(records)
+        self.assertEqual(handled, ['a', 'skip', 'b'])
+        self.assertEqual([r.msg for r in emitted], ['a', 'b'])
+        self.assertEqual(h.stream.getvalue(), 'a\nb\n')
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -4147,6 +4213,131 @@ def test_queue_listener_with_multiple_handlers(self):
         listener.stop()
         self.assertEqual(self.stream.getvalue().strip(), "que -> ERROR: error")
 
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch(self):
+        batches = []
+        class BatchHandler(TestHandler):
+            def emit_batch(self, records):
+                batches.append([record.msg for record in records])
+                super().emit_batch(records)
+
+        handler = BatchHandler(support.Matcher())
+        plain = TestHandler(support.Matcher())
+        for i in range(5):
+            self.que_logger.warning(str(i))
+        listener = logging.handlers.QueueListener(self.queue, handler, plain,
+                                                  batch_size=3)
+        listener.start()
+        listener.stop()
+        self.assertEqual(batches, [['0', '1', '2'], ['3', '4']])
+        self.assertEqual([r['msg'] for r in handler.buffer], list('01234'))
+        self.assertEqual([r['msg'] for r in plain.buffer], list('01234'))
+        self.assertEqual(self.queue.unfinished_tasks, 0)
+
+        # With respect_handler_level set
+        batches.clear()
+        handler = BatchHandler(support.Matcher())
+        handler.setLevel(logging.ERROR)
+        self.que_logger.warning('5')
+        self.que_logger.error('6')
+        listener = logging.handlers.QueueListener(
+            self.queue, handler, batch_size=10, respect_handler_level=True)
+        listener.start()
+        listener.stop()
+        self.assertEqual(batches, [['6']])
+
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch_timeout(self):
+        batches = []
+        class BatchHandler(TestHandler):
+            def emit_batch(self, records):
+                batches.append([record.msg for record in records])
+        handler = BatchHandler(support.Matcher())
+        listener = logging.handlers.QueueListener(
+            self.queue, handler, batch_size=100,
+            batch_timeout=support.SHORT_TIMEOUT)
+        listener.start()
+        try:
+            for i in range(3):
+                self.que_logger.warning(str(i))
+        finally:
+            # The sentinel ends the batch.
+            listener.stop()
+        self.assertEqual(batches, [['0', '1', '2']])
+
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch_dequeue(self):
+        # Records are always fetched through dequeue().
+        calls = []
+        class Listener(logging.handlers.QueueListener):
+            def dequeue(self, block, timeout=None):
+                calls.append((block, timeout))
+                return super().dequeue(block, timeout)
+        handler = TestHandler(support.Matcher())
+        for batch_timeout in 0, support.SHORT_TIMEOUT:
+            with self.subTest(batch_timeout=batch_timeout):
+                calls.clear()
+                self.que_logger.warning('0')
+                self.que_logger.warning('1')
+                listener = Listener(self.queue, handler, batch_size=10,
+                                    batch_timeout=batch_timeout)
+                listener.start()
+                listener.stop()
+                self.assertEqual(calls[0], (True, None))
+                # The second record is part of the batch of the first one.
+                block, timeout = calls[1]
+                if batch_timeout:
+                    self.assertTrue(block)
+                    self.assertLessEqual(timeout, batch_timeout)
+                else:
+                    self.assertEqual((block, timeout), (False, None))
+
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch_old_dequeue(self):
+        # dequeue() overridden without the timeout argument is polled.
+        calls = []
+        class Listener(logging.handlers.QueueListener):
+            def dequeue(self, block):
+                calls.append(block)
+                return self.queue.get(block)
+        handler = TestHandler(support.Matcher())
+        self.que_logger.warning('0')
+        self.que_logger.warning('1')
+        listener = Listener(self.queue, handler, batch_size=10,
+                            batch_timeout=support.SHORT_TIMEOUT)
+        listener.start()
+        listener.stop()
+        self.assertEqual(calls[:2], [True, False])
+        self.assertEqual([r['msg'] for r in handler.buffer], ['0', '1'])
+
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch_overridden_handle(self):
+        # A listener overriding handle() gets it called for each record.
+        handled = []
+        class Listener(logging.handlers.QueueListener):
+            def handle(self, record):
+                handled.append(record.msg)
+                super().handle(record)
+        handler = TestHandler(support.Matcher())
+        for i in range(3):
+            self.que_logger.warning(str(i))
+        listener = Listener(self.queue, handler, batch_size=10)
+        listener.start()
+        listener.stop()
+        self.assertEqual(handled, ['0', '1', '2'])
+        self.assertEqual([r['msg'] for r in handler.buffer], ['0', '1', '2'])
+
+    def test_queue_listener_batch_validation(self):
+        QueueListener = logging.handlers.QueueListener
+        self.assertRaises(ValueError, QueueListener, self.queue, batch_size=0)
+        self.assertRaises(ValueError, QueueListener, self.queue,
+                          batch_timeout=-1)
+
 if hasattr(logging.handlers, 'QueueListener'):
     import multiprocessing
     from unittest.mock import patch
@@ -5923,6 +6114,23 @@ def test_emit_after_closing_in_write_mode(self):
         with open(self.fn) as fp:
             self.assertEqual(fp.read().strip(), '1')
 
+    def test_handle_batch(self):
+        os.unlink(self.fn)
+        fh = logging.FileHandler(self.fn, encoding='utf-8', delay=True)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        fh.handle_batch([self.next_rec(), self.next_rec(), self.next_rec()])
+        fh.close()
+        with open(self.fn, encoding='utf-8') as fp:
+            self.assertEqual(fp.read(), '1\n2\n3\n')
+
+    def test_handle_batch_rotating(self):
+        # Rotating handlers still check for rollover before each record.
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=1, maxBytes=1)
+        rh.handle_batch([self.next_rec(), self.next_rec()])
+        rh.close()
+        self.assertLogFile(self.fn + ".1")
+
 class RotatingFileHandlerTest(BaseFileTest):
     @unittest.skipIf(support.is_wasi, "WASI does not have /dev/null.")
     def test_should_not_rollover(self):
@@ -173,6 +173,11 @@ def test_ThreadingTCPServer(self):
                         socketserver.StreamRequestHandler,
                         self.stream_examine)
 
+    def test_ThreadPoolTCPServer(self):
+        self.run_server(socketserver.ThreadPoolTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
     @requires_forking
     def test_ForkingTCPServer(self):
         with simple_subprocess(self):
@@ -210,6 +215,11 @@ def test_ThreadingUDPServer(self):
                         socketserver.DatagramRequestHandler,
                         self.dgram_examine)
 
+    def test_ThreadPoolUDPServer(self):
+        self.run_server(socketserver.ThreadPoolUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
     @requires_forking
     def test_ForkingUDPServer(self):
         with simple_subprocess(self):
@@ -314,6 +324,10 @@ def test_threading_not_handled(self):
 
             self.assertIs(cm.exc_type, SystemExit)
 
+    def test_thread_pool_handled(self):
+        ThreadPoolErrorTestServer(ValueError)
+        self.check_result(handled=True)
+
     @requires_forking
     def test_forking_handled(self):
         ForkingErrorTestServer(ValueError)
@@ -371,6 +385,11 @@ def wait_done(self):
         self.done.wait()
 
 
+class ThreadPoolErrorTestServer(socketserver.ThreadPoolMixIn,
+        ThreadingErrorTestServer):
+    pass
+
+
 if HAVE_FORKING:
     class ForkingErrorTestServer(socketserver.ForkingMixIn, BaseErrorTestServer):
         pass
@@ -502,6 +521,30 @@ class MyServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
         self.assertLess(len(server._threads), 10)
         server.server_close()
 
+    def test_thread_pool(self):
+        handled = []
+        class MyServer(socketserver.ThreadPoolMixIn, socketserver.TCPServer):
+            max_workers = 2
+            max_queued_requests = 1
+
+            def finish_request(self, request, client_address):
+                handled.append(threading.current_thread())
+
+        server = MyServer((HOST, 0), socketserver.StreamRequestHandler)
+        workers = None
+        for n in range(10):
+            with socket.create_connection(server.server_address):
+                server.handle_request()
+            if workers is None:
+                workers = server._workers[:]
+        server.server_close()
+        self.assertIsNone(server._workers)
+        self.assertEqual(len(workers), 2)
+        self.assertEqual(len(handled), 10)
+        self.assertLessEqual(set(handled), set(workers))
+        for worker in workers:
+            self.assertFalse(worker.is_alive())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import base64
 import os
 import email
+import socket
 import urllib.parse
 import urllib.request
 import http.server
@@ -665,6 +666,146 @@ def test_issue16464(self):
         self.assertEqual(b"1234567890", request.data)
         self.assertEqual("10", request.get_header("Content-length"))
 
+
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    """Handler for an HTTP/1.1 server keeping connections alive."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        if self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in (b"hello ", b"world"):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        body = b"x" * 1000 if self.path == "/large" else b"hello world"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class PooledHTTPHandlerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0),
+                                                     KeepAliveHandler)
+        self.httpd.connections = 0
+        self.addCleanup(self.httpd.server_close)
+        thread = threading.Thread(target=self.httpd.serve_forever,
+                                  kwargs={"poll_interval": 0.01})
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.httpd.shutdown)
+        self.url = "http://127.0.0.1:%d" % self.httpd.server_port
+
+        self.handler = urllib.request.PooledHTTPHandler()
+        self.addCleanup(self.handler.close)
+        self.opener = urllib.request.build_opener(
+            urllib.request.ProxyHandler({}), self.handler)
+
+    def test_connection_reused(self):
+        for path in ("/", "/chunked", "/", "/chunked"):
+            with self.opener.open(self.url + path) as f:
+                self.assertEqual(f.read(), b"hello world")
+        with self.opener.open(self.url + "/", data=b"spam") as f:
+            self.assertEqual(f.read(), b"spam")
+        self.assertEqual(self.httpd.connections, 1)
+
+    def test_partially_read_response_not_reused(self):
+        with self.opener.open(self.url + "/large") as f:
+            self.assertEqual(f.read(10), b"x" * 10)
+        with self.opener.open(self.url + "/") as f:
+            self.assertEqual(f.read(), b"hello world")
+        self.assertEqual(self.httpd.connections, 2)
+
+    def test_concurrent_responses(self):
+        f1 = self.opener.open(self.url + "/")
+        f2 = self.opener.open(self.url + "/chunked")
+        self.assertEqual(f2.read(), b"hello world")
+        self.assertEqual(f1.read(), b"hello world")
+        f1.close()
+        f2.close()
+        self.assertEqual(self.httpd.connections, 2)
+        for _ in range(3):
+            with self.opener.open(self.url + "/") as f:
+                f.read()
+        self.assertEqual(self.httpd.connections, 2)
+
+    def test_maxsize(self):
+        handler = urllib.request.PooledHTTPHandler(maxsize=1)
+        self.addCleanup(handler.close)
+        opener = urllib.request.build_opener(
+            urllib.request.ProxyHandler({}), handler)
+        f1 = opener.open(self.url + "/")
+        f2 = opener.open(self.url + "/")
+        f1.read()
+        f2.read()
+        f1.close()
+        f2.close()
+        for _ in range(2):
+            with opener.open(self.url + "/") as f:
+                f.read()
+        self.assertEqual(self.httpd.connections, 2)
+
+    def test_idle_timeout(self):
+        handler = urllib.request.PooledHTTPHandler(idle_timeout=0)
+        self.addCleanup(handler.close)
+        opener = urllib.request.build_opener(
+            urllib.request.ProxyHandler({}), handler)
+        for _ in range(2):
+            with opener.open(self.url + "/") as f:
+                f.read()
+        self.assertEqual(self.httpd.connections, 2)
+
+    def test_stale_connection_retried(self):
+        with self.opener.open(self.url + "/") as f:
+            f.read()
+        # Simulate the server closing the idle connection.
+        for conns in self.handler._pool._idle.values():
+            for expiry, conn in conns:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+        with self.opener.open(self.url + "/") as f:
+            self.assertEqual(f.read(), b"hello world")
+        self.assertEqual(self.httpd.connections, 2)
+
+    def test_stale_connection_not_retried(self):
+        # A POST request may have reached the server: it is not sent again.
+        with self.opener.open(self.url + "/") as f:
+            f.read()
+        for conns in self.handler._pool._idle.values():
+            for expiry, conn in conns:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+        with self.assertRaises((urllib.error.URLError, ConnectionError)):
+            self.opener.open(self.url + "/", data=b"spam")
+        self.assertEqual(self.httpd.connections, 1)
+        # The next request uses a new connection.
+        with self.opener.open(self.url + "/", data=b"spam") as f:
+            self.assertEqual(f.read(), b"spam")
+        self.assertEqual(self.httpd.connections, 2)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            urllib.request.PooledHTTPHandler(maxsize=0)
+
+
 def setUpModule():
     thread_info = threading_helper.threading_setup()
     unittest.addModuleCleanup(threading_helper.threading_cleanup, *thread_info)
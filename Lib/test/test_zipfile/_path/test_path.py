@@ -103,6 +103,21 @@ def test_iterdir_and_types(self, alpharep):
         (i,) = h.iterdir()
         assert i.is_file()
 
+    @pass_alpharep
+    def test_iterdir_children_index(self, alpharep):
+        root = zipfile.Path(alpharep)
+        names = [path.at for path in root.iterdir()]
+        if isinstance(root.root, zipfile._path.FastLookup):
+            # The children of every directory are indexed once.
+            root.root.namelist = None
+        assert [path.at for path in root.iterdir()] == names
+        assert [path.at for path in (root / 'b').iterdir()] == [
+            'b/c.txt',
+            'b/f.txt',
+            'b/d/',
+        ]
+        assert list((root / 'missing/').iterdir()) == []
+
     @pass_alpharep
     def test_is_file_missing(self, alpharep):
         root = zipfile.Path(alpharep)
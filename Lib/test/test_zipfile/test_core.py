@@ -1319,6 +1319,74 @@ def test_zipwritefile_attrs(self):
             self.assertIs(fid.writable(), True)
             self.assertIs(fid.seekable(), False)
 
+    def test_parallel_write(self):
+        self.addCleanup(unlink, TESTFN)
+        with open(TESTFN, 'wb') as f:
+            f.write(b'file data\n' * 1000)
+        names = []
+        with zipfile.ZipFile(TESTFN2, 'w', self.compression,
+                             workers=2) as zipf:
+            for i in range(20):
+                names.append('str%d' % i)
+                zipf.writestr(names[-1], b'data%d\n' % i * (i * 50))
+                if i % 5 == 0:
+                    names.append('file%d' % i)
+                    zipf.write(TESTFN, names[-1])
+            zipf.mkdir('dir')
+            names.append('dir/')
+            names.append('after')
+            zipf.writestr('after', bytearray(b'after mkdir'))
+            # Reading waits for the pending members.
+            self.assertEqual(zipf.read('after'), b'after mkdir')
+            names.append('last')
+            zipf.writestr('last', 'last member')
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.namelist(), names)
+            for i in range(20):
+                self.assertEqual(zipf.read('str%d' % i),
+                                 b'data%d\n' % i * (i * 50))
+            self.assertEqual(zipf.read('file5'), b'file data\n' * 1000)
+            info = zipf.getinfo('str3')
+            self.assertEqual(info.compress_type, self.compression)
+            self.assertEqual(info.file_size, 900)
+            self.assertEqual(zipf.read('last'), b'last member')
+
+    def test_parallel_write_error(self):
+        with zipfile.ZipFile(io.BytesIO(), 'w', self.compression,
+                             workers=1) as zipf:
+            zipf.writestr('a', b'a')
+            zinfo = zipfile.ZipInfo('missing')
+            zipf._submit_member(zinfo, TESTFN + '-missing', None)
+            zipf.writestr('b', b'b')
+            with self.assertRaises(FileNotFoundError):
+                zipf.read('a')
+            self.assertEqual(zipf.namelist(), ['a'])
+            self.assertEqual(zipf.read('a'), b'a')
+        self.assertEqual(zipf.namelist(), ['a', 'b'])
+        with self.assertRaises(ValueError):
+            zipfile.ZipFile(io.BytesIO(), 'w', workers=0)
+
+    def test_parallel_write_checks(self):
+        # Members are checked when they are submitted, like without workers.
+        with zipfile.ZipFile(io.BytesIO(), 'w', self.compression,
+                             workers=2) as zipf:
+            zipf.writestr('a', b'a')
+            with self.assertWarns(UserWarning):
+                zipf.writestr('a', b'b')
+        with zipfile.ZipFile(io.BytesIO(), 'w', self.compression,
+                             allowZip64=False, workers=2) as zipf:
+            with mock.patch.object(zipfile, 'ZIP64_LIMIT', 100):
+                with self.assertRaises(zipfile.LargeZipFile):
+                    zipf.writestr('big', b'x' * 200)
+            self.assertEqual(zipf.namelist(), [])
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, 'w') as zipf:
+            zipf.writestr('a', b'a')
+        with zipfile.ZipFile(data, 'r', workers=2) as zipf:
+            with self.assertRaises(ValueError):
+                zipf.writestr('b', b'b')
+
 class StoredWriterTests(AbstractWriterTests, unittest.TestCase):
     compression = zipfile.ZIP_STORED
 
@@ -1616,6 +1684,35 @@ def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(FakePath(extdir))
 
+    def test_extract_all_parallel(self):
+        with temp_dir() as extdir:
+            self.make_test_file()
+            self.addCleanup(unlink, TESTFN2)
+            with zipfile.ZipFile(TESTFN2, "a") as zipfp:
+                zipfp.mkdir('emptydir')
+                for i in range(50):
+                    zipfp.writestr('many/%d/file' % (i % 7), b'%d' % i)
+            with zipfile.ZipFile(TESTFN2, "r", workers=3) as zipfp:
+                zipfp.extractall(extdir)
+                zipfp.extractall(extdir, ['emptydir/'])
+            for fpath, fdata in SMALL_TEST_DATA:
+                self.check_file(os.path.join(extdir, fpath), fdata.encode())
+            self.assertTrue(os.path.isdir(os.path.join(extdir, 'emptydir')))
+            self.assertEqual(len(os.listdir(os.path.join(extdir, 'many'))), 7)
+            # The last member of each name wins.
+            for i in range(43, 50):
+                self.check_file(os.path.join(extdir, 'many', '%d' % (i % 7),
+                                             'file'), b'%d' % i)
+
+    def test_extract_all_parallel_error(self):
+        with temp_dir() as extdir:
+            self.make_test_file()
+            self.addCleanup(unlink, TESTFN2)
+            with zipfile.ZipFile(TESTFN2, "r", workers=2) as zipfp:
+                names = zipfp.namelist()
+                with self.assertRaises(KeyError):
+                    zipfp.extractall(extdir, names[:1] + ['missing'])
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -2778,6 +2875,21 @@ def test_write(self):
                     with zipf.open('twos') as zopen:
                         self.assertEqual(zopen.read(), b'222')
 
+    def test_parallel_writestr(self):
+        for wrapper in (lambda f: f), Tellable, Unseekable:
+            with self.subTest(wrapper=wrapper):
+                f = io.BytesIO()
+                f.write(b'abc')
+                bf = io.BufferedWriter(f)
+                with zipfile.ZipFile(wrapper(bf), 'w', zipfile.ZIP_STORED,
+                                     workers=2) as zipfp:
+                    zipfp.writestr('ones', b'111')
+                    zipfp.writestr('twos', b'222')
+                self.assertEqual(f.getvalue()[:5], b'abcPK')
+                with zipfile.ZipFile(f, mode='r') as zipf:
+                    self.assertEqual(zipf.read('ones'), b'111')
+                    self.assertEqual(zipf.read('twos'), b'222')
+
     def test_open_write(self):
         for wrapper in (lambda f: f), Tellable, Unseekable:
             with self.subTest(wrapper=wrapper):
@@ -59,6 +59,15 @@ def module_path_to_dotted_name(path):
 pyc_ext = '.pyc'
 
 
+def unlink_directory_cache(zipName):
+    cache_path = zipimport._get_directory_cache_path(zipName)
+    os_helper.unlink(cache_path)
+    try:
+        os.rmdir(os.path.dirname(cache_path))
+    except OSError:
+        pass
+
+
 class ImportHooksBaseTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -109,6 +118,7 @@ def makeZip(self, files, zipName=TEMP_ZIP, **kw):
         # defined by files in the zip file zipName.  If the
         # key 'stuff' exists in kw it is prepended to the archive.
         self.addCleanup(os_helper.unlink, zipName)
+        self.addCleanup(unlink_directory_cache, zipName)
 
         with ZipFile(zipName, "w") as z:
             for name, (mtime, data) in files.items():
@@ -810,6 +820,64 @@ def testZip64CruftAndComment(self):
         files = self.getZip64Files()
         self.doTest(".py", files, "f65536", comment=b"c" * ((1 << 16) - 1))
 
+    @support.swap_attr(sys, 'dont_write_bytecode', False)
+    @support.swap_attr(zipimport, '_DIRECTORY_CACHE_MIN_ENTRIES', 3)
+    def testDirectoryCache(self):
+        files = {"f%d.py" % n: (NOW, "x = %d" % n) for n in range(3)}
+        self.makeZip(files)
+        cache_path = zipimport._get_directory_cache_path(TEMP_ZIP)
+        self.assertTrue(cache_path.endswith('.zipdir'))
+        sys.path.insert(0, TEMP_ZIP)
+        self.assertEqual(importlib.import_module("f1").x, 1)
+        self.assertTrue(os.path.exists(cache_path))
+
+        # The archive is not read again while it is unchanged.
+        zipimport._zip_directory_cache.clear()
+        sys.path_importer_cache.clear()
+        with unittest.mock.patch.object(zipimport, '_read_directory') as m:
+            self.assertEqual(importlib.import_module("f2").x, 2)
+        m.assert_not_called()
+
+        # Changing the archive invalidates the cache.
+        with ZipFile(TEMP_ZIP, "a") as z:
+            z.writestr("f3.py", "x = 3")
+        zipimport._zip_directory_cache.clear()
+        sys.path_importer_cache.clear()
+        self.assertEqual(importlib.import_module("f3").x, 3)
+        zipimport._zip_directory_cache.clear()
+        with unittest.mock.patch.object(zipimport, '_read_directory') as m:
+            zi = zipimport.zipimporter(TEMP_ZIP)
+            self.assertEqual(set(zi._get_files()), {"f0.py", "f1.py",
+                                                    "f2.py", "f3.py"})
+        m.assert_not_called()
+
+        # A corrupted cache is ignored and rewritten.
+        with open(cache_path, "r+b") as f:
+            f.seek(10)
+            f.write(b"\xff" * 10)
+        zipimport._zip_directory_cache.clear()
+        zi = zipimport.zipimporter(TEMP_ZIP)
+        self.assertEqual(len(zi._get_files()), 4)
+        zipimport._zip_directory_cache.clear()
+        with unittest.mock.patch.object(zipimport, '_read_directory') as m:
+            zi = zipimport.zipimporter(TEMP_ZIP)
+        m.assert_not_called()
+
+    @support.swap_attr(zipimport, '_DIRECTORY_CACHE_MIN_ENTRIES', 3)
+    def testDirectoryCacheNotWritten(self):
+        files = {"f%d.py" % n: (NOW, "x = %d" % n) for n in range(3)}
+        self.makeZip(files)
+        cache_path = zipimport._get_directory_cache_path(TEMP_ZIP)
+        with support.swap_attr(sys, 'dont_write_bytecode', True):
+            zipimport.zipimporter(TEMP_ZIP)
+        self.assertFalse(os.path.exists(cache_path))
+        zipimport._zip_directory_cache.clear()
+        with support.swap_attr(sys, 'dont_write_bytecode', False):
+            with support.swap_attr(zipimport,
+                                   '_DIRECTORY_CACHE_MIN_ENTRIES', 4):
+                zipimport.zipimporter(TEMP_ZIP)
+        self.assertFalse(os.path.exists(cache_path))
+
 
 @support.requires_zlib()
 class CompressedZipImportTestCase(UncompressedZipImportTestCase):
@@ -94,6 +94,7 @@
 import sys
 import time
 import tempfile
+import threading
 import contextlib
 import warnings
 
@@ -122,8 +123,8 @@
     'HTTPPasswordMgrWithPriorAuth', 'AbstractBasicAuthHandler',
     'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler', 'AbstractDigestAuthHandler',
     'HTTPDigestAuthHandler', 'ProxyDigestAuthHandler', 'HTTPHandler',
-    'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
-    'UnknownHandler', 'HTTPErrorProcessor',
+    'PooledHTTPHandler', 'FileHandler', 'FTPHandler', 'CacheFTPHandler',
+    'DataHandler', 'UnknownHandler', 'HTTPErrorProcessor',
     # Functions
     'urlopen', 'install_opener', 'build_opener',
     'pathname2url', 'url2pathname', 'getproxies',
@@ -1223,8 +1224,15 @@ def http_error_407(self, req, fp, code, msg, headers):
         self.reset_retry_count()
         return retry
 
+# Methods of the requests which the pooled handlers send again if a reused
+# connection was closed by the server.
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
 class AbstractHTTPHandler(BaseHandler):
 
+    # Pool of idle persistent connections, see PooledHTTPHandler.
+    _pool = None
+
     def __init__(self, debuglevel=None):
         self._debuglevel = debuglevel if debuglevel is not None else http.client.HTTPConnection.debuglevel
 
@@ -1283,64 +1291,193 @@ def do_open(self, http_class, req, **http_conn_args):
         if not host:
             raise URLError('no host given')
 
-        # will parse host:port
-        h = http_class(host, timeout=req.timeout, **http_conn_args)
-        h.set_debuglevel(self._debuglevel)
-
         headers = dict(req.unredirected_hdrs)
         headers.update({k: v for k, v in req.headers.items()
                         if k not in headers})
 
-        # TODO(jhylton): Should this be redesigned to handle
-        # persistent connections?
-
-        # We want to make an HTTP/1.1 request, but the addinfourl
-        # class isn't prepared to deal with a persistent connection.
-        # It will try to read all remaining data from the socket,
-        # which will block while the server waits for the next request.
-        # So make sure the connection gets closed after the (only)
-        # request.
-        headers["Connection"] = "close"
+        if self._pool is None:
+            # We want to make an HTTP/1.1 request, but the addinfourl
+            # class isn't prepared to deal with a persistent connection.
+            # It will try to read all remaining data from the socket,
+            # which will block while the server waits for the next request.
+            # So make sure the connection gets closed after the (only)
+            # request.  Pooled handlers keep the connection open instead
+            # and take it back once the response has been read.
+            headers["Connection"] = "close"
         headers = {name.title(): val for name, val in headers.items()}
 
+        tunnel_headers = {}
         if req._tunnel_host:
-            tunnel_headers = {}
             proxy_auth_hdr = "Proxy-Authorization"
             if proxy_auth_hdr in headers:
                 tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
                 # Proxy-Authorization should not be sent to origin
                 # server.
                 del headers[proxy_auth_hdr]
+
+        if self._pool is not None:
+            r = self._do_open_pooled(http_class, req, headers,
+                                     tunnel_headers, http_conn_args)
+        else:
+            h = self._new_connection(http_class, req, tunnel_headers,
+                                     http_conn_args)
+            r = self._send_request(h, req, headers)
+
+            # If the server does not send us a 'Connection: close' header,
+            # HTTPConnection assumes the socket should be left open.
+            # Manually mark the socket to be closed when this response
+            # object goes away.
+            if h.sock:
+                h.sock.close()
+                h.sock = None
+
+        r.url = req.get_full_url()
+        # This line replaces the .msg attribute of the HTTPResponse
+        # with .headers, because urllib clients expect the response to
+        # have the reason in .msg.  It would be good to mark this
+        # attribute is deprecated and get then to use info() or
+        # .headers.
+        r.msg = r.reason
+        return r
+
+    def _new_connection(self, http_class, req, tunnel_headers,
+                        http_conn_args):
+        # will parse host:port
+        h = http_class(req.host, timeout=req.timeout, **http_conn_args)
+        h.set_debuglevel(self._debuglevel)
+        if req._tunnel_host:
             h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+        return h
 
+    def _send_request(self, h, req, headers):
         try:
             try:
                 h.request(req.get_method(), req.selector, req.data, headers,
                           encode_chunked=req.has_header('Transfer-encoding'))
             except OSError as err: # timeout error
                 raise URLError(err)
-            r = h.getresponse()
+            return h.getresponse()
         except:
             h.close()
             raise
 
-        # If the server does not send us a 'Connection: close' header,
-        # HTTPConnection assumes the socket should be left open. Manually
-        # mark the socket to be closed when this response object goes away.
-        if h.sock:
-            h.sock.close()
-            h.sock = None
+    def _do_open_pooled(self, http_class, req, headers, tunnel_headers,
+                        http_conn_args):
+        pool = self._pool
+        key = (http_class, req.host, req.timeout, req._tunnel_host)
+        # An idempotent request whose body can be sent again is retried
+        # once on a fresh connection if an idle connection turns out to have
+        # been closed by the server in the meantime.  The server may have
+        # received the request before closing the connection, so other
+        # requests are not sent twice.
+        retry = (req.get_method() in _IDEMPOTENT_METHODS and
+                 (req.data is None or isinstance(req.data, bytes)))
+        while True:
+            h = pool.get(key)
+            if h is None:
+                h = self._new_connection(http_class, req, tunnel_headers,
+                                         http_conn_args)
+                h.response_class = _PooledHTTPResponse
+                retry = False
+            try:
+                r = self._send_request(h, req, headers)
+            except (URLError, http.client.RemoteDisconnected) as err:
+                if isinstance(err, URLError):
+                    err = err.reason
+                if retry and isinstance(err, ConnectionError):
+                    retry = False
+                    continue
+                raise
+            break
 
-        r.url = req.get_full_url()
-        # This line replaces the .msg attribute of the HTTPResponse
-        # with .headers, because urllib clients expect the response to
-        # have the reason in .msg.  It would be good to mark this
-        # attribute is deprecated and get then to use info() or
-        # .headers.
-        r.msg = r.reason
+        if not r.will_close:
+            # Hand the connection back to the pool once the response
+            # has been completely read.
+            r._release = lambda reusable: pool.put(key, h, reusable)
         return r
 
 
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    """HTTPResponse that returns its connection to a pool when done."""
+
+    _release = None
+    _trailer_read = False
+
+    def _read_and_discard_trailer(self):
+        super()._read_and_discard_trailer()
+        self._trailer_read = True
+
+    def _close_conn(self):
+        super()._close_conn()
+        release, self._release = self._release, None
+        if release is not None:
+            # The connection can only carry another request if the whole
+            # body has been consumed; a response closed early leaves
+            # unread data on the socket.
+            release(self.length == 0 or self._trailer_read)
+
+
+class _HTTPConnectionPool:
+    """Thread-safe store of idle persistent HTTP connections.
+
+    Connections are kept per key (connection class, host, timeout and
+    tunnel host).  At most maxsize idle connections are kept for each key
+    and connections which have been idle for more than idle_timeout
+    seconds are closed instead of being reused.
+    """
+
+    def __init__(self, maxsize, idle_timeout):
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0")
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # key -> list of (expiry time, connection), most recently used last
+        self._idle = {}
+
+    def get(self, key):
+        """Return an idle connection for key, or None."""
+        now = time.monotonic()
+        expired = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                while idle and idle[0][0] <= now:
+                    expired.append(idle.pop(0)[1])
+                if idle:
+                    conn = idle.pop()[1]
+                if not idle:
+                    del self._idle[key]
+        for c in expired:
+            c.close()
+        return conn
+
+    def put(self, key, conn, reusable=True):
+        """Return a connection to the pool after its response is done."""
+        if not reusable or conn.sock is None:
+            conn.close()
+            return
+        expiry = time.monotonic() + self.idle_timeout
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            idle.append((expiry, conn))
+            if len(idle) > self.maxsize:
+                conn = idle.pop(0)[1]
+            else:
+                conn = None
+        if conn is not None:
+            conn.close()
+
+    def clear(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for expiry, conn in conns:
+                conn.close()
+
+
 class HTTPHandler(AbstractHTTPHandler):
 
     def http_open(self, req):
@@ -1348,6 +1485,18 @@ def http_open(self, req):
 
     http_request = AbstractHTTPHandler.do_request_
 
+
+class PooledHTTPHandler(HTTPHandler):
+    """HTTPHandler which reuses persistent connections between requests."""
+
+    def __init__(self, debuglevel=None, *, maxsize=10, idle_timeout=60.0):
+        HTTPHandler.__init__(self, debuglevel)
+        self._pool = _HTTPConnectionPool(maxsize, idle_timeout)
+
+    def close(self):
+        self._pool.clear()
+
+
 if hasattr(http.client, 'HTTPSConnection'):
 
     class HTTPSHandler(AbstractHTTPHandler):
@@ -1368,7 +1517,18 @@ def https_open(self, req):
 
         https_request = AbstractHTTPHandler.do_request_
 
-    __all__.append('HTTPSHandler')
+    class PooledHTTPSHandler(HTTPSHandler):
+        """HTTPSHandler which reuses persistent connections between requests."""
+
+        def __init__(self, debuglevel=None, context=None, check_hostname=None,
+                     *, maxsize=10, idle_timeout=60.0):
+            HTTPSHandler.__init__(self, debuglevel, context, check_hostname)
+            self._pool = _HTTPConnectionPool(maxsize, idle_timeout)
+
+        def close(self):
+            self._pool.clear()
+
+    __all__.extend(['HTTPSHandler', 'PooledHTTPSHandler'])
 
 class HTTPCookieProcessor(BaseHandler):
     def __init__(self, cookiejar=None):
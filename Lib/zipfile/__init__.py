@@ -4,8 +4,10 @@
 XXX references to utf-8 need further investigation.
 """
 import binascii
+import collections
 import importlib.util
 import io
+import itertools
 import os
 import shutil
 import stat
@@ -1285,6 +1287,48 @@ def close(self):
             self._zipfile._writing = False
 
 
+# Compressed members up to this size are kept in memory until written.
+_SPOOL_SIZE = 16 * 1024 * 1024
+
+def _compress_member(zinfo, filename, data):
+    """Compress the contents of filename, or data if filename is None, for
+    writing zinfo later.  Return a file object holding the compressed data.
+
+    Run in the worker threads of a ZipFile created with workers.
+    """
+    import tempfile
+    compressor = _get_compressor(zinfo.compress_type, zinfo.compress_level)
+    buf = tempfile.SpooledTemporaryFile(_SPOOL_SIZE)
+    crc = file_size = 0
+    try:
+        src = open(filename, "rb") if filename is not None else None
+        try:
+            while True:
+                if src is not None:
+                    chunk = src.read(shutil.COPY_BUFSIZE)
+                else:
+                    chunk, data = data, b''
+                if not chunk:
+                    break
+                file_size += len(chunk)
+                crc = crc32(chunk, crc)
+                if compressor:
+                    chunk = compressor.compress(chunk)
+                buf.write(chunk)
+        finally:
+            if src is not None:
+                src.close()
+        if compressor:
+            buf.write(compressor.flush())
+        zinfo.compress_size = buf.tell()
+        zinfo.file_size = file_size
+        zinfo.CRC = crc
+        buf.seek(0)
+    except:
+        buf.close()
+        raise
+    return buf
+
 
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
@@ -1306,6 +1350,9 @@ class ZipFile:
                    When using ZIP_STORED or ZIP_LZMA this keyword has no effect.
                    When using ZIP_DEFLATED integers 0 through 9 are accepted.
                    When using ZIP_BZIP2 integers 1 through 9 are accepted.
+    workers: None (default) or the number of threads used to compress the
+             members added with write() and writestr(), and to extract the
+             members in extractall(), concurrently.
 
     """
 
@@ -1313,11 +1360,14 @@ class ZipFile:
     _windows_illegal_name_trans_table = None
 
     def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None):
+                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None,
+                 workers=None):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
             raise ValueError("ZipFile requires mode 'r', 'w', 'x', or 'a'")
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be greater than 0")
 
         _check_compression(compression)
 
@@ -1333,6 +1383,9 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
         self._comment = b''
         self._strict_timestamps = strict_timestamps
         self.metadata_encoding = metadata_encoding
+        self._workers = workers
+        self._executor = None
+        self._pending = collections.deque()
 
         # Check that we don't try to write with nonconforming codecs
         if self.metadata_encoding and mode != 'r':
@@ -1613,6 +1666,8 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
         if not self.fp:
             raise ValueError(
                 "Attempt to use ZIP archive that was already closed")
+        if self._pending:
+            self._write_pending()
 
         # Make sure we have an info object
         if isinstance(name, ZipInfo):
@@ -1763,7 +1818,28 @@ def extractall(self, path=None, members=None, pwd=None):
         else:
             path = os.fspath(path)
 
-        for zipinfo in members:
+        if self._workers is None:
+            for zipinfo in members:
+                self._extract_member(zipinfo, path, pwd)
+            return
+
+        if self._pending:
+            self._write_pending()
+        # Members sharing a name are extracted serially after the others,
+        # so that the last one wins like without workers.
+        names = [member.filename if isinstance(member, ZipInfo) else member
+                 for member in members]
+        counts = collections.Counter(names)
+        duplicates = [member for member, name in zip(members, names)
+                      if counts[name] > 1]
+        if duplicates:
+            members = [member for member, name in zip(members, names)
+                       if counts[name] == 1]
+        executor = self._get_executor()
+        for _ in executor.map(self._extract_member, members,
+                              itertools.repeat(path), itertools.repeat(pwd)):
+            pass
+        for zipinfo in duplicates:
             self._extract_member(zipinfo, path, pwd)
 
     @classmethod
@@ -1832,7 +1908,9 @@ def _extract_member(self, member, targetpath, pwd):
 
     def _writecheck(self, zinfo):
         """Check for errors before writing a file to the archive."""
-        if zinfo.filename in self.NameToInfo:
+        if (zinfo.filename in self.NameToInfo or
+                any(pending.filename == zinfo.filename
+                    for pending, future in self._pending)):
             import warnings
             warnings.warn('Duplicate name: %r' % zinfo.filename, stacklevel=3)
         if self.mode not in ('w', 'x', 'a'):
@@ -1843,7 +1921,7 @@ def _writecheck(self, zinfo):
         _check_compression(zinfo.compress_type)
         if not self._allowZip64:
             requires_zip64 = None
-            if len(self.filelist) >= ZIP_FILECOUNT_LIMIT:
+            if len(self.filelist) + len(self._pending) >= ZIP_FILECOUNT_LIMIT:
                 requires_zip64 = "Files count"
             elif zinfo.file_size > ZIP64_LIMIT:
                 requires_zip64 = "Filesize"
@@ -1883,6 +1961,9 @@ def write(self, filename, arcname=None,
             else:
                 zinfo.compress_level = self.compresslevel
 
+            if self._workers is not None:
+                self._submit_member(zinfo, filename, None)
+                return
             with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
                 shutil.copyfileobj(src, dest, 1024*8)
 
@@ -1923,10 +2004,78 @@ def writestr(self, zinfo_or_arcname, data,
             zinfo.compress_level = compresslevel
 
         zinfo.file_size = len(data)            # Uncompressed size
+        if self._workers is not None and not zinfo.is_dir():
+            self._submit_member(zinfo, None, data)
+            return
         with self._lock:
             with self.open(zinfo, mode='w') as dest:
                 dest.write(data)
 
+    def _get_executor(self):
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(self._workers,
+                                                thread_name_prefix='zipfile')
+        return self._executor
+
+    def _submit_member(self, zinfo, filename, data):
+        """Compress a member in a worker thread.  Members are written to the
+        archive in the order they were submitted."""
+        # The member is written after the pending ones, so its offset is at
+        # least the current end of the archive.
+        zinfo.header_offset = self.start_dir
+        self._writecheck(zinfo)
+        if data is not None and not isinstance(data, bytes):
+            data = bytes(data)
+        future = self._get_executor().submit(_compress_member,
+                                             zinfo, filename, data)
+        self._pending.append((zinfo, future))
+        # Limit the number of compressed members waiting to be written.
+        if len(self._pending) > 2 * self._workers:
+            self._write_pending(2 * self._workers)
+
+    def _write_pending(self, keep=0):
+        """Write the compressed members submitted by write() and writestr(),
+        leaving the last keep members pending."""
+        with self._lock:
+            while len(self._pending) > keep:
+                zinfo, future = self._pending.popleft()
+                buf = future.result()
+                try:
+                    self._write_compressed_member(zinfo, buf)
+                finally:
+                    buf.close()
+
+    def _write_compressed_member(self, zinfo, buf):
+        # The sizes and CRC are known, so the local file header is written
+        # only once and no data descriptor is needed.
+        zinfo.flag_bits = 0x00
+        if zinfo.compress_type == ZIP_LZMA:
+            # Compressed data includes an end-of-stream (EOS) marker
+            zinfo.flag_bits |= _MASK_COMPRESS_OPTION_1
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16  # permissions: ?rw-------
+
+        zip64 = (zinfo.file_size > ZIP64_LIMIT or
+                 zinfo.compress_size > ZIP64_LIMIT)
+        if not self._allowZip64 and zip64:
+            raise LargeZipFile("Filesize would require ZIP64 extensions")
+
+        if self._seekable:
+            self.fp.seek(self.start_dir)
+        zinfo.header_offset = self.fp.tell()
+
+        # The other checks were done by _submit_member().
+        if not self._allowZip64 and zinfo.header_offset > ZIP64_LIMIT:
+            raise LargeZipFile("Zipfile size would require ZIP64 extensions")
+        self._didModify = True
+
+        self.fp.write(zinfo.FileHeader(zip64))
+        shutil.copyfileobj(buf, self.fp)
+        self.start_dir = self.fp.tell()
+        self.filelist.append(zinfo)
+        self.NameToInfo[zinfo.filename] = zinfo
+
     def mkdir(self, zinfo_or_directory_name, mode=511):
         """Creates a directory inside the zip archive."""
         if isinstance(zinfo_or_directory_name, ZipInfo):
@@ -1947,6 +2096,8 @@ def mkdir(self, zinfo_or_directory_name, mode=511):
             raise TypeError("Expected type str or ZipInfo")
 
         with self._lock:
+            if self._pending:
+                self._write_pending()
             if self._seekable:
                 self.fp.seek(self.start_dir)
             zinfo.header_offset = self.fp.tell()  # Start of header bytes
@@ -1978,6 +2129,8 @@ def close(self):
                              "Close the writing handle before closing the zip.")
 
         try:
+            if self._pending:
+                self._write_pending()
             if self.mode in ('w', 'x', 'a') and self._didModify: # write ending records
                 with self._lock:
                     if self._seekable:
@@ -1986,6 +2139,13 @@ def close(self):
         finally:
             fp = self.fp
             self.fp = None
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+            while self._pending:
+                zinfo, future = self._pending.popleft()
+                if not future.cancelled() and future.exception() is None:
+                    future.result().close()
             self._fpclose(fp)
 
     def _write_end_record(self):
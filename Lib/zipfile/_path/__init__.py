@@ -108,6 +108,27 @@ def namelist(self):
     def _name_set(self):
         return set(self.namelist())
 
+    def _children(self, at):
+        """
+        Return the names of the entries directly in the directory at,
+        in namelist order.
+
+        >>> zf = CompleteDirs(io.BytesIO(), 'w')
+        >>> zf.writestr('a.txt', b'')
+        >>> zf.writestr('b/c.txt', b'')
+        >>> zf.writestr('b/d/e.txt', b'')
+        >>> zf._children('')
+        ['a.txt', 'b/']
+        >>> zf._children('b/')
+        ['b/c.txt', 'b/d/']
+        """
+        parent = at.rstrip(posixpath.sep)
+        return [
+            name
+            for name in self.namelist()
+            if posixpath.dirname(name.rstrip(posixpath.sep)) == parent
+        ]
+
     def resolve_dir(self, name):
         """
         If the name represents a directory, return that name
@@ -177,6 +198,16 @@ def _name_set(self):
         self.__lookup = super()._name_set()
         return self.__lookup
 
+    def _children(self, at):
+        with contextlib.suppress(AttributeError):
+            return self.__children.get(at.rstrip(posixpath.sep), [])
+        children = {}
+        for name in self.namelist():
+            parent = posixpath.dirname(name.rstrip(posixpath.sep))
+            children.setdefault(parent, []).append(name)
+        self.__children = children
+        return children.get(at.rstrip(posixpath.sep), [])
+
 
 def _extract_text_encoding(encoding=None, *args, **kwargs):
     # compute stack level so that the caller of the caller sees any warning.
@@ -382,8 +413,7 @@ def exists(self):
     def iterdir(self):
         if not self.is_dir():
             raise ValueError("Can't listdir a file")
-        subs = map(self._next, self.root.namelist())
-        return filter(self._is_child, subs)
+        return map(self._next, self.root._children(self.at))
 
     def match(self, path_pattern):
         return pathlib.PurePosixPath(self.at).match(path_pattern)
@@ -7,6 +7,10 @@
 - _zip_directory_cache: a dict, mapping archive paths to zip directory
   info dicts, as used in zipimporter._files.
 
+The parsed directory of archives with many entries is also cached on disk,
+in a file next to the cached bytecode of a source file named like the
+archive, and reused while the archive's mtime and size are unchanged.
+
 It is usually not needed to use the zipimport module explicitly; it is
 used by the builtin import mechanism for sys.path items that are paths
 to Zip archives.
@@ -49,6 +53,13 @@ class ZipImportError(ImportError):
 MAX_UINT32 = 0xffffffff
 ZIP64_EXTRA_TAG = 0x1
 
+# The parsed directory of archives with at least this many entries is
+# cached on disk, see _get_directory().
+_DIRECTORY_CACHE_MIN_ENTRIES = 1000
+_DIRECTORY_CACHE_SUFFIX = '.zipdir'
+# Bumped whenever the format of the toc entries changes.
+_DIRECTORY_CACHE_MAGIC = b'ZDC\x01'
+
 class zipimporter(_bootstrap_external._LoaderBasics):
     """zipimporter(archivepath) -> zipimporter object
 
@@ -95,7 +106,7 @@ def __init__(self, path):
                 break
 
         if path not in _zip_directory_cache:
-            _zip_directory_cache[path] = _read_directory(path)
+            _zip_directory_cache[path] = _get_directory(path)
         self.archive = path
         # a prefix directory following the ZIP file path.
         self.prefix = _bootstrap_external._path_join(*prefix[::-1])
@@ -276,7 +287,7 @@ def _get_files(self):
             files = _zip_directory_cache[self.archive]
         except KeyError:
             try:
-                files = _zip_directory_cache[self.archive] = _read_directory(self.archive)
+                files = _zip_directory_cache[self.archive] = _get_directory(self.archive)
             except ZipImportError:
                 files = {}
 
@@ -557,6 +568,81 @@ def _read_directory(archive):
     _bootstrap._verbose_message('zipimport: found {} names in {!r}', count, archive)
     return files
 
+
+# _get_directory(archive) -> files dict (new reference)
+#
+# Return the same dict as _read_directory(), read from the on-disk
+# directory cache of the archive if it is still valid.  Otherwise the
+# directory is read from the archive, and cached if it has at least
+# _DIRECTORY_CACHE_MIN_ENTRIES entries, unless sys.dont_write_bytecode is
+# set.  The cache is validated with the path, mtime and size of the archive.
+def _get_directory(archive):
+    try:
+        st = _bootstrap_external._path_stat(archive)
+        cache_path = _get_directory_cache_path(archive)
+    except (OSError, ValueError, NotImplementedError):
+        return _read_directory(archive)
+    key = (archive, st.st_mtime_ns, st.st_size)
+
+    try:
+        with _io.open_code(cache_path) as fp:
+            data = fp.read()
+    except OSError:
+        pass
+    else:
+        if data[:len(_DIRECTORY_CACHE_MAGIC)] == _DIRECTORY_CACHE_MAGIC:
+            try:
+                cached_key, files = marshal.loads(
+                    memoryview(data)[len(_DIRECTORY_CACHE_MAGIC):])
+            except (EOFError, ValueError, TypeError):
+                pass
+            else:
+                if cached_key == key and type(files) is dict:
+                    _bootstrap._verbose_message(
+                        'zipimport: found {} names in {!r}', len(files),
+                        cache_path)
+                    return files
+
+    files = _read_directory(archive)
+    if len(files) >= _DIRECTORY_CACHE_MIN_ENTRIES and not sys.dont_write_bytecode:
+        data = _DIRECTORY_CACHE_MAGIC + marshal.dumps((key, files))
+        _write_directory_cache(cache_path, data,
+                               _bootstrap_external._calc_mode(archive))
+    return files
+
+def _get_directory_cache_path(archive):
+    # Name the cache like the bytecode of a source file named after the
+    # archive, so that sys.pycache_prefix is honoured.
+    path = _bootstrap_external.cache_from_source(archive + '.py',
+                                                 optimization='')
+    suffix = _bootstrap_external.BYTECODE_SUFFIXES[0]
+    return path[:-len(suffix)] + _DIRECTORY_CACHE_SUFFIX
+
+def _write_directory_cache(cache_path, data, mode):
+    # Like SourceFileLoader.set_data(), failing to write the cache is not
+    # an error.
+    parent, filename = _bootstrap_external._path_split(cache_path)
+    path_parts = []
+    while parent and not _bootstrap_external._path_isdir(parent):
+        parent, part = _bootstrap_external._path_split(parent)
+        path_parts.append(part)
+    for part in reversed(path_parts):
+        parent = _bootstrap_external._path_join(parent, part)
+        try:
+            _bootstrap_external._os.mkdir(parent)
+        except FileExistsError:
+            continue
+        except OSError as exc:
+            _bootstrap._verbose_message('could not create {!r}: {!r}',
+                                        parent, exc)
+            return
+    try:
+        _bootstrap_external._write_atomic(cache_path, data, mode)
+        _bootstrap._verbose_message('created {!r}', cache_path)
+    except OSError as exc:
+        _bootstrap._verbose_message('could not create {!r}: {!r}',
+                                    cache_path, exc)
+
 # During bootstrap, we may need to load the encodings
 # package from a ZIP file. But the cp437 encoding is implemented
 # in Python in the encodings package.
@@ -0,0 +1,1054 @@
+/* C accelerator for the copy module.
+
+   This implements copy.deepcopy() with the same semantics and memo
+   protocol as the pure Python version in Lib/copy.py.  Lists, dicts and
+   tuples, as well as the atomic types, are copied directly as long as
+   their copier in copy._deepcopy_dispatch is the original one; all other
+   objects go through copy._deepcopy_dispatch, __deepcopy__(),
+   copyreg.dispatch_table and __reduce_ex__() like in the Python version.
+*/
+
+#ifndef Py_BUILD_CORE_BUILTIN
+#  define Py_BUILD_CORE_MODULE 1
+#endif
+
+#include "Python.h"
+#include "pycore_runtime.h"       // _Py_ID()
+
+/*[clinic input]
+module _copy
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=b34c1b75f49dbfff]*/
+
+#include "clinic/_copymodule.c.h"
+
+typedef struct {
+    /* Sentinel for memo.get() */
+    PyObject *nil;
+    PyObject *str_copy;
+    PyObject *str_deepcopy;
+    PyObject *str_deepcopy_dispatch;
+    PyObject *str_deepcopy_atomic;
+    PyObject *str_deepcopy_list;
+    PyObject *str_deepcopy_dict;
+    PyObject *str_deepcopy_tuple;
+    PyObject *str_dispatch_table;
+    PyObject *str_reconstruct;
+    PyObject *str_error;
+    PyObject *str_update;
+} copy_state;
+
+static inline copy_state *
+get_copy_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (copy_state *)state;
+}
+
+/* Indexes of the types copied directly, in the fast_checked and
+   fast_enabled bit sets of deepcopy_context. */
+enum {
+    FAST_ATOMIC_COUNT = 16,
+    FAST_LIST = FAST_ATOMIC_COUNT,
+    FAST_DICT,
+    FAST_TUPLE,
+};
+
+typedef struct {
+    copy_state *state;
+    PyObject *memo;
+    /* id(memo), the key of the keep alive list */
+    PyObject *memo_id;
+    /* True while the memo was created by this call and was not passed to
+       any Python code.  It then only holds the ids of live objects which
+       are not atomic, so it can't hold the id of an atomic object. */
+    int memo_private;
+    /* Objects of the copy module, looked up at each call so that they
+       can be replaced or reloaded. */
+    PyObject *deepcopy_dispatch;
+    PyObject *dispatch_table;
+    PyObject *reconstruct;
+    PyObject *error;
+    /* The original copiers, which the fast paths replace */
+    PyObject *deepcopy_atomic;
+    PyObject *deepcopy_list;
+    PyObject *deepcopy_dict;
+    PyObject *deepcopy_tuple;
+    /* Bit i is set in fast_checked once the copier of the type with index
+       i was looked up in deepcopy_dispatch, and in fast_enabled if it is
+       the original copier. */
+    unsigned int fast_checked;
+    unsigned int fast_enabled;
+} deepcopy_context;
+
+static PyObject *deepcopy_object(deepcopy_context *ctx, PyObject *x);
+
+static int
+context_init(deepcopy_context *ctx, PyObject *module, PyObject *memo)
+{
+    copy_state *st = get_copy_state(module);
+    PyObject *copy_module;
+
+    memset(ctx, 0, sizeof(*ctx));
+    ctx->state = st;
+    copy_module = PyImport_GetModule(st->str_copy);
+    if (copy_module == NULL) {
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+        copy_module = PyImport_Import(st->str_copy);
+        if (copy_module == NULL) {
+            return -1;
+        }
+    }
+    if (PyObject_GetOptionalAttr(copy_module, st->str_deepcopy_atomic,
+                                 &ctx->deepcopy_atomic) < 0 ||
+        PyObject_GetOptionalAttr(copy_module, st->str_deepcopy_list,
+                                 &ctx->deepcopy_list) < 0 ||
+        PyObject_GetOptionalAttr(copy_module, st->str_deepcopy_dict,
+                                 &ctx->deepcopy_dict) < 0 ||
+        PyObject_GetOptionalAttr(copy_module, st->str_deepcopy_tuple,
+                                 &ctx->deepcopy_tuple) < 0 ||
+        (ctx->deepcopy_dispatch = PyObject_GetAttr(
+            copy_module, st->str_deepcopy_dispatch)) == NULL ||
+        (ctx->dispatch_table = PyObject_GetAttr(
+            copy_module, st->str_dispatch_table)) == NULL ||
+        (ctx->reconstruct = PyObject_GetAttr(
+            copy_module, st->str_reconstruct)) == NULL ||
+        (ctx->error = PyObject_GetAttr(copy_module, st->str_error)) == NULL)
+    {
+        Py_DECREF(copy_module);
+        return -1;
+    }
+    Py_DECREF(copy_module);
+    if (!PyDict_Check(ctx->deepcopy_dispatch) ||
+        !PyDict_Check(ctx->dispatch_table))
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "copy dispatch tables must be dictionaries");
+        return -1;
+    }
+    if (memo == Py_None) {
+        ctx->memo = PyDict_New();
+        if (ctx->memo == NULL) {
+            return -1;
+        }
+        ctx->memo_private = 1;
+    }
+    else {
+        ctx->memo = Py_NewRef(memo);
+    }
+    return 0;
+}
+
+static void
+context_clear(deepcopy_context *ctx)
+{
+    Py_CLEAR(ctx->memo);
+    Py_CLEAR(ctx->memo_id);
+    Py_CLEAR(ctx->deepcopy_dispatch);
+    Py_CLEAR(ctx->dispatch_table);
+    Py_CLEAR(ctx->reconstruct);
+    Py_CLEAR(ctx->error);
+    Py_CLEAR(ctx->deepcopy_atomic);
+    Py_CLEAR(ctx->deepcopy_list);
+    Py_CLEAR(ctx->deepcopy_dict);
+    Py_CLEAR(ctx->deepcopy_tuple);
+}
+
+static PyObject *
+memo_for_python(deepcopy_context *ctx)
+{
+    /* Return the memo (borrowed) to pass it to Python code. */
+    ctx->memo_private = 0;
+    return ctx->memo;
+}
+
+/* Return the index of the types which can be copied directly, or -1.  The
+   atomic types are those of the copy._deepcopy_atomic copier. */
+static inline int
+fast_type_index(PyTypeObject *tp)
+{
+    if (tp == &PyUnicode_Type) return 0;
+    if (tp == &PyLong_Type) return 1;
+    if (tp == Py_TYPE(Py_None)) return 2;
+    if (tp == &PyFloat_Type) return 3;
+    if (tp == &PyBool_Type) return 4;
+    if (tp == &PyBytes_Type) return 5;
+    if (tp == &PyComplex_Type) return 6;
+    if (tp == &PyType_Type) return 7;
+    if (tp == &PyFunction_Type) return 8;
+    if (tp == &PyCFunction_Type) return 9;
+    if (tp == &PyCode_Type) return 10;
+    if (tp == &PyRange_Type) return 11;
+    if (tp == &PyProperty_Type) return 12;
+    if (tp == &_PyWeakref_RefType) return 13;
+    if (tp == &PyEllipsis_Type) return 14;
+    if (tp == Py_TYPE(Py_NotImplemented)) return 15;
+    if (tp == &PyList_Type) return FAST_LIST;
+    if (tp == &PyDict_Type) return FAST_DICT;
+    if (tp == &PyTuple_Type) return FAST_TUPLE;
+    return -1;
+}
+
+static int
+use_fast_path(deepcopy_context *ctx, PyTypeObject *tp, int index)
+{
+    /* Return 1 if the copier of tp in copy._deepcopy_dispatch is the
+       original one, 0 if not and -1 on error. */
+    unsigned int bit = 1u << index;
+
+    if (!(ctx->fast_checked & bit)) {
+        PyObject *copier, *original;
+        int res = PyDict_GetItemRef(ctx->deepcopy_dispatch, (PyObject *)tp,
+                                    &copier);
+        if (res < 0) {
+            return -1;
+        }
+        switch (index) {
+        case FAST_LIST:
+            original = ctx->deepcopy_list;
+            break;
+        case FAST_DICT:
+            original = ctx->deepcopy_dict;
+            break;
+        case FAST_TUPLE:
+            original = ctx->deepcopy_tuple;
+            break;
+        default:
+            original = ctx->deepcopy_atomic;
+        }
+        if (copier != NULL && copier == original) {
+            ctx->fast_enabled |= bit;
+        }
+        Py_XDECREF(copier);
+        ctx->fast_checked |= bit;
+    }
+    return (ctx->fast_enabled & bit) != 0;
+}
+
+static inline int
+is_atomic(deepcopy_context *ctx, PyObject *x)
+{
+    /* Return 1 if x is its own copy and needs no memo lookup, 0 if not
+       and -1 on error. */
+    if (!ctx->memo_private) {
+        return 0;
+    }
+    int index = fast_type_index(Py_TYPE(x));
+    if (index < 0 || index >= FAST_ATOMIC_COUNT) {
+        return 0;
+    }
+    return use_fast_path(ctx, Py_TYPE(x), index);
+}
+
+/* Memo operations.  The memo is usually a dict, but like in the Python
+   version, any object supporting get() and item assignment is accepted. */
+
+static int
+memo_get(deepcopy_context *ctx, PyObject *key, PyObject **result)
+{
+    /* memo.get(key): return 1 and set *result if found, 0 if not found,
+       -1 on error. */
+    if (PyDict_CheckExact(ctx->memo)) {
+        return PyDict_GetItemRef(ctx->memo, key, result);
+    }
+    *result = PyObject_CallMethodObjArgs(ctx->memo, &_Py_ID(get),
+                                         key, ctx->state->nil, NULL);
+    if (*result == NULL) {
+        return -1;
+    }
+    if (*result == ctx->state->nil) {
+        Py_CLEAR(*result);
+        return 0;
+    }
+    return 1;
+}
+
+static int
+memo_getitem(deepcopy_context *ctx, PyObject *key, PyObject **result)
+{
+    /* memo[key], treating KeyError as not found. */
+    if (PyDict_CheckExact(ctx->memo)) {
+        return PyDict_GetItemRef(ctx->memo, key, result);
+    }
+    *result = PyObject_GetItem(ctx->memo, key);
+    if (*result == NULL) {
+        if (PyErr_ExceptionMatches(PyExc_KeyError)) {
+            PyErr_Clear();
+            return 0;
+        }
+        return -1;
+    }
+    return 1;
+}
+
+static int
+memo_set(deepcopy_context *ctx, PyObject *key, PyObject *value)
+{
+    if (PyDict_CheckExact(ctx->memo)) {
+        return PyDict_SetItem(ctx->memo, key, value);
+    }
+    return PyObject_SetItem(ctx->memo, key, value);
+}
+
+static int
+memo_keep_alive(deepcopy_context *ctx, PyObject *x)
+{
+    /* Keep a reference to x in the memo, see copy._keep_alive(). */
+    PyObject *alive;
+    int res;
+
+    if (ctx->memo_id == NULL) {
+        ctx->memo_id = PyLong_FromVoidPtr(ctx->memo);
+        if (ctx->memo_id == NULL) {
+            return -1;
+        }
+    }
+    res = memo_getitem(ctx, ctx->memo_id, &alive);
+    if (res < 0) {
+        return -1;
+    }
+    if (res == 0) {
+        alive = PyList_New(1);
+        if (alive == NULL) {
+            return -1;
+        }
+        PyList_SET_ITEM(alive, 0, Py_NewRef(x));
+        res = memo_set(ctx, ctx->memo_id, alive);
+        Py_DECREF(alive);
+        return res;
+    }
+    if (PyList_CheckExact(alive)) {
+        res = PyList_Append(alive, x);
+    }
+    else {
+        PyObject *r = PyObject_CallMethodOneArg(alive, &_Py_ID(append), x);
+        res = r == NULL ? -1 : 0;
+        Py_XDECREF(r);
+    }
+    Py_DECREF(alive);
+    return res;
+}
+
+static inline PyObject *
+deepcopy_item(deepcopy_context *ctx, PyObject *x)
+{
+    switch (is_atomic(ctx, x)) {
+    case -1:
+        return NULL;
+    case 1:
+        return Py_NewRef(x);
+    }
+    return deepcopy_object(ctx, x);
+}
+
+static PyObject *
+deepcopy_list(deepcopy_context *ctx, PyObject *x, PyObject *key)
+{
+    PyObject *y = PyList_New(0);
+    if (y == NULL) {
+        return NULL;
+    }
+    if (memo_set(ctx, key, y) < 0) {
+        goto error;
+    }
+    /* The list can be mutated while its items are copied, so its size is
+       checked at each iteration like the list iterator does. */
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(x); i++) {
+        PyObject *item = Py_NewRef(PyList_GET_ITEM(x, i));
+        PyObject *copy = deepcopy_item(ctx, item);
+        Py_DECREF(item);
+        if (copy == NULL) {
+            goto error;
+        }
+        int res = PyList_Append(y, copy);
+        Py_DECREF(copy);
+        if (res < 0) {
+            goto error;
+        }
+    }
+    return y;
+
+error:
+    Py_DECREF(y);
+    return NULL;
+}
+
+static PyObject *
+deepcopy_dict(deepcopy_context *ctx, PyObject *x, PyObject *key)
+{
+    PyObject *k, *v;
+    Py_ssize_t pos = 0;
+    Py_ssize_t size = PyDict_GET_SIZE(x);
+    PyObject *y = PyDict_New();
+
+    if (y == NULL) {
+        return NULL;
+    }
+    if (memo_set(ctx, key, y) < 0) {
+        goto error;
+    }
+    while (PyDict_Next(x, &pos, &k, &v)) {
+        Py_INCREF(k);
+        Py_INCREF(v);
+        /* The value is copied first, like in y[deepcopy(k)] = deepcopy(v). */
+        PyObject *value_copy = deepcopy_item(ctx, v);
+        PyObject *key_copy = NULL;
+        if (value_copy != NULL) {
+            key_copy = deepcopy_item(ctx, k);
+        }
+        Py_DECREF(k);
+        Py_DECREF(v);
+        if (key_copy == NULL) {
+            Py_XDECREF(value_copy);
+            goto error;
+        }
+        int res = PyDict_SetItem(y, key_copy, value_copy);
+        Py_DECREF(key_copy);
+        Py_DECREF(value_copy);
+        if (res < 0) {
+            goto error;
+        }
+        if (PyDict_GET_SIZE(x) != size) {
+            PyErr_SetString(PyExc_RuntimeError,
+                            "dictionary changed size during iteration");
+            goto error;
+        }
+    }
+    return y;
+
+error:
+    Py_DECREF(y);
+    return NULL;
+}
+
+static PyObject *
+deepcopy_tuple(deepcopy_context *ctx, PyObject *x, PyObject *key)
+{
+    Py_ssize_t n = PyTuple_GET_SIZE(x);
+    Py_ssize_t i;
+    PyObject *y, *memo_y;
+    int changed = 0;
+
+    for (i = 0; i < n; i++) {
+        int res = is_atomic(ctx, PyTuple_GET_ITEM(x, i));
+        if (res < 0) {
+            return NULL;
+        }
+        if (!res) {
+            break;
+        }
+    }
+    if (i == n) {
+        /* A tuple of atomic objects is its own copy. */
+        return Py_NewRef(x);
+    }
+    y = PyTuple_New(n);
+    if (y == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t j = 0; j < i; j++) {
+        PyTuple_SET_ITEM(y, j, Py_NewRef(PyTuple_GET_ITEM(x, j)));
+    }
+    for (; i < n; i++) {
+        PyObject *item = PyTuple_GET_ITEM(x, i);
+        PyObject *copy = deepcopy_item(ctx, item);
+        if (copy == NULL) {
+            Py_DECREF(y);
+            return NULL;
+        }
+        changed |= copy != item;
+        PyTuple_SET_ITEM(y, i, copy);
+    }
+    /* The tuple is not put in the memo, but it can be there if it
+       contains recursive mutable structures. */
+    switch (memo_getitem(ctx, key, &memo_y)) {
+    case -1:
+        Py_DECREF(y);
+        return NULL;
+    case 1:
+        Py_DECREF(y);
+        return memo_y;
+    }
+    if (!changed) {
+        Py_DECREF(y);
+        return Py_NewRef(x);
+    }
+    return y;
+}
+
+static int
+unpack_pair(PyObject *item, PyObject **first, PyObject **second)
+{
+    /* first, second = item */
+    PyObject *it, *extra;
+
+    if (PyTuple_CheckExact(item) && PyTuple_GET_SIZE(item) == 2) {
+        *first = Py_NewRef(PyTuple_GET_ITEM(item, 0));
+        *second = Py_NewRef(PyTuple_GET_ITEM(item, 1));
+        return 0;
+    }
+    if (Py_TYPE(item)->tp_iter == NULL && !PySequence_Check(item)) {
+        PyErr_Format(PyExc_TypeError,
+                     "cannot unpack non-iterable %.200s object",
+                     Py_TYPE(item)->tp_name);
+        return -1;
+    }
+    it = PyObject_GetIter(item);
+    if (it == NULL) {
+        return -1;
+    }
+    *second = NULL;
+    *first = PyIter_Next(it);
+    if (*first != NULL) {
+        *second = PyIter_Next(it);
+    }
+    if (*second == NULL) {
+        if (!PyErr_Occurred()) {
+            PyErr_Format(PyExc_ValueError,
+                         "not enough values to unpack (expected 2, got %d)",
+                         *first == NULL ? 0 : 1);
+        }
+        goto error;
+    }
+    extra = PyIter_Next(it);
+    if (extra != NULL) {
+        Py_DECREF(extra);
+        PyErr_SetString(PyExc_ValueError,
+                        "too many values to unpack (expected 2)");
+        goto error;
+    }
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+    Py_DECREF(it);
+    return 0;
+
+error:
+    Py_DECREF(it);
+    Py_CLEAR(*first);
+    Py_CLEAR(*second);
+    return -1;
+}
+
+static int
+reconstruct_state(deepcopy_context *ctx, PyObject *y, PyObject *state)
+{
+    PyObject *setstate, *r;
+    PyObject *slotstate = Py_None;
+
+    if (PyObject_GetOptionalAttr(y, &_Py_ID(__setstate__), &setstate) < 0) {
+        return -1;
+    }
+    if (setstate != NULL) {
+        r = PyObject_CallOneArg(setstate, state);
+        Py_DECREF(setstate);
+        Py_XDECREF(r);
+        return r == NULL ? -1 : 0;
+    }
+    if (PyTuple_Check(state) && PyTuple_GET_SIZE(state) == 2) {
+        slotstate = PyTuple_GET_ITEM(state, 1);
+        state = PyTuple_GET_ITEM(state, 0);
+    }
+    if (state != Py_None) {
+        PyObject *dict = PyObject_GetAttr(y, &_Py_ID(__dict__));
+        if (dict == NULL) {
+            return -1;
+        }
+        r = PyObject_CallMethodOneArg(dict, ctx->state->str_update, state);
+        Py_DECREF(dict);
+        if (r == NULL) {
+            return -1;
+        }
+        Py_DECREF(r);
+    }
+    if (slotstate != Py_None) {
+        PyObject *items, *it, *item;
+        items = PyObject_CallMethodNoArgs(slotstate, &_Py_ID(items));
+        if (items == NULL) {
+            return -1;
+        }
+        it = PyObject_GetIter(items);
+        Py_DECREF(items);
+        if (it == NULL) {
+            return -1;
+        }
+        while ((item = PyIter_Next(it)) != NULL) {
+            PyObject *key, *value;
+            int res = unpack_pair(item, &key, &value);
+            Py_DECREF(item);
+            if (res < 0) {
+                break;
+            }
+            res = PyObject_SetAttr(y, key, value);
+            Py_DECREF(key);
+            Py_DECREF(value);
+            if (res < 0) {
+                break;
+            }
+        }
+        Py_DECREF(it);
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static int
+reconstruct_items(deepcopy_context *ctx, PyObject *y,
+                  PyObject *listiter, PyObject *dictiter)
+{
+    PyObject *it, *item;
+
+    if (listiter != Py_None) {
+        it = PyObject_GetIter(listiter);
+        if (it == NULL) {
+            return -1;
+        }
+        while ((item = PyIter_Next(it)) != NULL) {
+            PyObject *copy = deepcopy_item(ctx, item);
+            Py_DECREF(item);
+            if (copy == NULL) {
+                break;
+            }
+            PyObject *r = PyObject_CallMethodOneArg(y, &_Py_ID(append), copy);
+            Py_DECREF(copy);
+            if (r == NULL) {
+                break;
+            }
+            Py_DECREF(r);
+        }
+        Py_DECREF(it);
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+    }
+    if (dictiter != Py_None) {
+        it = PyObject_GetIter(dictiter);
+        if (it == NULL) {
+            return -1;
+        }
+        while ((item = PyIter_Next(it)) != NULL) {
+            PyObject *key, *value, *key_copy, *value_copy = NULL;
+            int res = unpack_pair(item, &key, &value);
+            Py_DECREF(item);
+            if (res < 0) {
+                break;
+            }
+            key_copy = deepcopy_item(ctx, key);
+            if (key_copy != NULL) {
+                value_copy = deepcopy_item(ctx, value);
+            }
+            Py_DECREF(key);
+            Py_DECREF(value);
+            if (value_copy == NULL) {
+                Py_XDECREF(key_copy);
+                break;
+            }
+            res = PyObject_SetItem(y, key_copy, value_copy);
+            Py_DECREF(key_copy);
+            Py_DECREF(value_copy);
+            if (res < 0) {
+                break;
+            }
+        }
+        Py_DECREF(it);
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *
+reconstruct(deepcopy_context *ctx, PyObject *x, PyObject *key, PyObject *rv)
+{
+    /* copy._reconstruct(x, memo, *rv) */
+    PyObject *func, *args, *state, *listiter, *dictiter;
+    PyObject *callargs, *y;
+    Py_ssize_t n;
+
+    if (PyTuple_CheckExact(rv)) {
+        Py_INCREF(rv);
+    }
+    else {
+        rv = PySequence_Tuple(rv);
+        if (rv == NULL) {
+            return NULL;
+        }
+    }
+    n = PyTuple_GET_SIZE(rv);
+    if (n < 2 || n > 5) {
+        /* Let the Python version report the wrong number of arguments. */
+        callargs = PyTuple_New(n + 2);
+        if (callargs == NULL) {
+            Py_DECREF(rv);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(callargs, 0, Py_NewRef(x));
+        PyTuple_SET_ITEM(callargs, 1, Py_NewRef(memo_for_python(ctx)));
+        for (Py_ssize_t i = 0; i < n; i++) {
+            PyTuple_SET_ITEM(callargs, i + 2,
+                             Py_NewRef(PyTuple_GET_ITEM(rv, i)));
+        }
+        Py_DECREF(rv);
+        y = PyObject_Call(ctx->reconstruct, callargs, NULL);
+        Py_DECREF(callargs);
+        return y;
+    }
+    func = PyTuple_GET_ITEM(rv, 0);
+    args = PyTuple_GET_ITEM(rv, 1);
+    state = n > 2 ? PyTuple_GET_ITEM(rv, 2) : Py_None;
+    listiter = n > 3 ? PyTuple_GET_ITEM(rv, 3) : Py_None;
+    dictiter = n > 4 ? PyTuple_GET_ITEM(rv, 4) : Py_None;
+
+    int truth = PyObject_IsTrue(args);
+    if (truth < 0) {
+        goto error;
+    }
+    if (truth) {
+        PyObject *it, *item;
+        PyObject *list = PyList_New(0);
+        if (list == NULL) {
+            goto error;
+        }
+        it = PyObject_GetIter(args);
+        if (it == NULL) {
+            Py_DECREF(list);
+            goto error;
+        }
+        while ((item = PyIter_Next(it)) != NULL) {
+            PyObject *copy = deepcopy_item(ctx, item);
+            Py_DECREF(item);
+            if (copy == NULL || PyList_Append(list, copy) < 0) {
+                Py_XDECREF(copy);
+                break;
+            }
+            Py_DECREF(copy);
+        }
+        Py_DECREF(it);
+        if (PyErr_Occurred()) {
+            Py_DECREF(list);
+            goto error;
+        }
+        callargs = PyList_AsTuple(list);
+        Py_DECREF(list);
+    }
+    else {
+        callargs = PySequence_Tuple(args);
+    }
+    if (callargs == NULL) {
+        goto error;
+    }
+    y = PyObject_Call(func, callargs, NULL);
+    Py_DECREF(callargs);
+    if (y == NULL) {
+        goto error;
+    }
+    if (memo_set(ctx, key, y) < 0) {
+        goto error_y;
+    }
+    if (state != Py_None) {
+        state = deepcopy_item(ctx, state);
+        if (state == NULL) {
+            goto error_y;
+        }
+        int res = reconstruct_state(ctx, y, state);
+        Py_DECREF(state);
+        if (res < 0) {
+            goto error_y;
+        }
+    }
+    if (reconstruct_items(ctx, y, listiter, dictiter) < 0) {
+        goto error_y;
+    }
+    Py_DECREF(rv);
+    return y;
+
+error_y:
+    Py_DECREF(y);
+error:
+    Py_DECREF(rv);
+    return NULL;
+}
+
+static PyObject *
+deepcopy_reduce(deepcopy_context *ctx, PyObject *x, PyObject *key)
+{
+    PyTypeObject *cls = Py_TYPE(x);
+    PyObject *reductor, *rv, *y;
+    int res;
+
+    res = PyDict_GetItemRef(ctx->dispatch_table, (PyObject *)cls, &reductor);
+    if (res < 0) {
+        return NULL;
+    }
+    if (reductor == Py_None) {
+        Py_CLEAR(reductor);
+    }
+    if (reductor != NULL) {
+        rv = PyObject_CallOneArg(reductor, x);
+        Py_DECREF(reductor);
+    }
+    else {
+        if (PyObject_GetOptionalAttr(x, &_Py_ID(__reduce_ex__),
+                                     &reductor) < 0)
+        {
+            return NULL;
+        }
+        if (reductor == Py_None) {
+            Py_CLEAR(reductor);
+        }
+        if (reductor != NULL) {
+            PyObject *proto = PyLong_FromLong(4);
+            if (proto == NULL) {
+                Py_DECREF(reductor);
+                return NULL;
+            }
+            rv = PyObject_CallOneArg(reductor, proto);
+            Py_DECREF(proto);
+            Py_DECREF(reductor);
+        }
+        else {
+            if (PyObject_GetOptionalAttr(x, &_Py_ID(__reduce__),
+                                         &reductor) < 0)
+            {
+                return NULL;
+            }
+            res = 0;
+            if (reductor != NULL) {
+                res = PyObject_IsTrue(reductor);
+                if (res < 0) {
+                    Py_DECREF(reductor);
+                    return NULL;
+                }
+            }
+            if (!res) {
+                Py_XDECREF(reductor);
+                PyErr_Format(ctx->error,
+                             "un(deep)copyable object of type %S", cls);
+                return NULL;
+            }
+            rv = PyObject_CallNoArgs(reductor);
+            Py_DECREF(reductor);
+        }
+    }
+    if (rv == NULL) {
+        return NULL;
+    }
+    if (PyUnicode_Check(rv)) {
+        y = Py_NewRef(x);
+    }
+    else {
+        y = reconstruct(ctx, x, key, rv);
+    }
+    Py_DECREF(rv);
+    return y;
+}
+
+static PyObject *
+deepcopy_dispatch(deepcopy_context *ctx, PyObject *x, PyObject *key)
+{
+    PyTypeObject *cls = Py_TYPE(x);
+    PyObject *copier, *y;
+    int res;
+
+    int index = fast_type_index(cls);
+    if (index >= 0) {
+        res = use_fast_path(ctx, cls, index);
+        if (res < 0) {
+            return NULL;
+        }
+        if (res) {
+            switch (index) {
+            case FAST_LIST:
+                return deepcopy_list(ctx, x, key);
+            case FAST_DICT:
+                return deepcopy_dict(ctx, x, key);
+            case FAST_TUPLE:
+                return deepcopy_tuple(ctx, x, key);
+            default:
+                return Py_NewRef(x);
+            }
+        }
+    }
+    res = PyDict_GetItemRef(ctx->deepcopy_dispatch, (PyObject *)cls, &copier);
+    if (res < 0) {
+        return NULL;
+    }
+    if (res > 0 && copier != Py_None) {
+        y = PyObject_CallFunctionObjArgs(copier, x, memo_for_python(ctx),
+                                         NULL);
+        Py_DECREF(copier);
+        return y;
+    }
+    Py_XDECREF(copier);
+    if (PyType_IsSubtype(cls, &PyType_Type)) {
+        return Py_NewRef(x);
+    }
+    if (PyObject_GetOptionalAttr(x, ctx->state->str_deepcopy, &copier) < 0) {
+        return NULL;
+    }
+    if (copier != NULL && copier != Py_None) {
+        y = PyObject_CallOneArg(copier, memo_for_python(ctx));
+        Py_DECREF(copier);
+        return y;
+    }
+    Py_XDECREF(copier);
+    return deepcopy_reduce(ctx, x, key);
+}
+
+static PyObject *
+deepcopy_object(deepcopy_context *ctx, PyObject *x)
+{
+    PyObject *key, *y;
+    int res;
+
+    key = PyLong_FromVoidPtr(x);
+    if (key == NULL) {
+        return NULL;
+    }
+    res = memo_get(ctx, key, &y);
+    if (res != 0) {
+        Py_DECREF(key);
+        return res < 0 ? NULL : y;
+    }
+    if (Py_EnterRecursiveCall(" while deep-copying an object")) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    y = deepcopy_dispatch(ctx, x, key);
+    Py_LeaveRecursiveCall();
+    /* If x is its own copy, don't memoize. */
+    if (y != NULL && y != x) {
+        if (memo_set(ctx, key, y) < 0 || memo_keep_alive(ctx, x) < 0) {
+            Py_CLEAR(y);
+        }
+    }
+    Py_DECREF(key);
+    return y;
+}
+
+/*[clinic input]
+_copy.deepcopy
+
+    x: object
+    memo: object = None
+
+Deep copy operation on arbitrary Python objects.
+
+See the copy module's __doc__ string for more info.
+[clinic start generated code]*/
+
+static PyObject *
+_copy_deepcopy_impl(PyObject *module, PyObject *x, PyObject *memo)
+/*[clinic end generated code: output=825a9c8dd4bfc002 input=40bc32185a149189]*/
+{
+    deepcopy_context ctx;
+    PyObject *y = NULL;
+
+    if (context_init(&ctx, module, memo) == 0) {
+        y = deepcopy_object(&ctx, x);
+    }
+    context_clear(&ctx);
+    return y;
+}
+
+static PyMethodDef copy_methods[] = {
+    _COPY_DEEPCOPY_METHODDEF
+    {NULL, NULL}
+};
+
+static int
+copy_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    copy_state *state = get_copy_state(module);
+    Py_VISIT(state->nil);
+    return 0;
+}
+
+static int
+copy_clear(PyObject *module)
+{
+    copy_state *state = get_copy_state(module);
+    Py_CLEAR(state->nil);
+    Py_CLEAR(state->str_copy);
+    Py_CLEAR(state->str_deepcopy);
+    Py_CLEAR(state->str_deepcopy_dispatch);
+    Py_CLEAR(state->str_deepcopy_atomic);
+    Py_CLEAR(state->str_deepcopy_list);
+    Py_CLEAR(state->str_deepcopy_dict);
+    Py_CLEAR(state->str_deepcopy_tuple);
+    Py_CLEAR(state->str_dispatch_table);
+    Py_CLEAR(state->str_reconstruct);
+    Py_CLEAR(state->str_error);
+    Py_CLEAR(state->str_update);
+    return 0;
+}
+
+static void
+copy_free(void *module)
+{
+    copy_clear((PyObject *)module);
+}
+
+static int
+copy_modexec(PyObject *m)
+{
+    copy_state *state = get_copy_state(m);
+    state->nil = PyObject_CallNoArgs((PyObject *)&PyBaseObject_Type);
+    if (state->nil == NULL) {
+        return -1;
+    }
+#define ADD_STR(NAME, VALUE)                                \
+    do {                                                    \
+        state->NAME = PyUnicode_InternFromString(VALUE);    \
+        if (state->NAME == NULL) {                          \
+            return -1;                                      \
+        }                                                   \
+    } while (0)
+
+    ADD_STR(str_copy, "copy");
+    ADD_STR(str_deepcopy, "__deepcopy__");
+    ADD_STR(str_deepcopy_dispatch, "_deepcopy_dispatch");
+    ADD_STR(str_deepcopy_atomic, "_deepcopy_atomic");
+    ADD_STR(str_deepcopy_list, "_deepcopy_list");
+    ADD_STR(str_deepcopy_dict, "_deepcopy_dict");
+    ADD_STR(str_deepcopy_tuple, "_deepcopy_tuple");
+    ADD_STR(str_dispatch_table, "dispatch_table");
+    ADD_STR(str_reconstruct, "_reconstruct");
+    ADD_STR(str_error, "Error");
+    ADD_STR(str_update, "update");
+#undef ADD_STR
+    return 0;
+}
+
+PyDoc_STRVAR(module_doc,
+"C implementation of deepcopy() for the copy module.");
+
+static PyModuleDef_Slot copy_slots[] = {
+    {Py_mod_exec, copy_modexec},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {0, NULL}
+};
+
+static struct PyModuleDef _copymodule = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_copy",
+    .m_size = sizeof(copy_state),
+    .m_doc = module_doc,
+    .m_methods = copy_methods,
+    .m_slots = copy_slots,
+    .m_traverse = copy_traverse,
+    .m_clear = copy_clear,
+    .m_free = copy_free,
+};
+
+PyMODINIT_FUNC
+PyInit__copy(void)
+{
+    return PyModuleDef_Init(&_copymodule);
+}
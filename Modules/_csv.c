@@ -20,10 +20,10 @@ module instead.
 
 /*[clinic input]
 module _csv
+class _csv.Reader "ReaderObj *" "clinic_state()->reader_type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=385118b71aa43706]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=076b6691199a1b2e]*/
 
-#include "clinic/_csv.c.h"
 #define NOT_SET ((Py_UCS4)-1)
 #define EOL ((Py_UCS4)-2)
 
@@ -133,6 +133,8 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     bool unquoted_field;        /* true if no quotes around the current field */
     unsigned long line_num;     /* Source-file line number */
+    PyObject *field_types;      /* tuple of column types used by read_batch(),
+                                   or NULL */
 } ReaderObj;
 
 typedef struct {
@@ -150,6 +152,8 @@ typedef struct {
     PyObject *error_obj;       /* cached error object */
 } WriterObj;
 
+#include "clinic/_csv.c.h"
+
 /*
  * DIALECT class
  */
@@ -643,11 +647,75 @@ _call_dialect(_csvstate *module_state, PyObject *dialect_inst, PyObject *kwargs)
 /*
  * READER
  */
+static PyObject *
+parse_field_number(ReaderObj *self, PyObject *type)
+{
+    /* Convert the current field to int or float without creating a
+       string.  Return NULL without an exception set if the field is not
+       in the simple formats handled here. */
+    const Py_UCS4 *field = self->field;
+    Py_ssize_t len = self->field_len;
+    char buf[64];
+
+    if (type == (PyObject *)&PyLong_Type) {
+        /* Up to 18 digits always fit in a long long. */
+        Py_ssize_t i = 0;
+        int negative = 0;
+        long long value = 0;
+        if (len > 0 && (field[0] == '-' || field[0] == '+')) {
+            negative = field[0] == '-';
+            i++;
+        }
+        if (i == len || len - i > 18) {
+            return NULL;
+        }
+        for (; i < len; i++) {
+            if (field[i] < '0' || field[i] > '9') {
+                return NULL;
+            }
+            value = value * 10 + (field[i] - '0');
+        }
+        return PyLong_FromLongLong(negative ? -value : value);
+    }
+    assert(type == (PyObject *)&PyFloat_Type);
+    if (len == 0 || len >= (Py_ssize_t)sizeof(buf)) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < len; i++) {
+        /* Leave whitespace and underscores to float() */
+        if (field[i] > 127 || field[i] == '_' ||
+            Py_ISSPACE((unsigned char)field[i]))
+        {
+            return NULL;
+        }
+        buf[i] = (char)field[i];
+    }
+    buf[len] = '\0';
+    char *end;
+    double value = PyOS_string_to_double(buf, &end, NULL);
+    if (end != buf + len) {
+        PyErr_Clear();
+        return NULL;
+    }
+    return PyFloat_FromDouble(value);
+}
+
 static int
 parse_save_field(ReaderObj *self)
 {
     int quoting = self->dialect->quoting;
-    PyObject *field;
+    PyObject *field = NULL;
+    PyObject *type = NULL;
+
+    if (self->field_types != NULL &&
+        PyList_GET_SIZE(self->fields) < PyTuple_GET_SIZE(self->field_types))
+    {
+        type = PyTuple_GET_ITEM(self->field_types,
+                                PyList_GET_SIZE(self->fields));
+        if (type == Py_None) {
+            type = NULL;
+        }
+    }
 
     if (self->unquoted_field &&
         self->field_len == 0 &&
@@ -656,15 +724,30 @@ parse_save_field(ReaderObj *self)
         field = Py_NewRef(Py_None);
     }
     else {
-        field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
-                                        (void *) self->field, self->field_len);
+        int to_float = (self->unquoted_field &&
+                        self->field_len != 0 &&
+                        (quoting == QUOTE_NONNUMERIC ||
+                         quoting == QUOTE_STRINGS));
+        if (!to_float && (type == (PyObject *)&PyLong_Type ||
+                          type == (PyObject *)&PyFloat_Type))
+        {
+            field = parse_field_number(self, type);
+            if (field == NULL && PyErr_Occurred()) {
+                return -1;
+            }
+            if (field != NULL) {
+                type = NULL;
+            }
+        }
         if (field == NULL) {
-            return -1;
+            field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                              (void *) self->field,
+                                              self->field_len);
+            if (field == NULL) {
+                return -1;
+            }
         }
-        if (self->unquoted_field &&
-            self->field_len != 0 &&
-            (quoting == QUOTE_NONNUMERIC || quoting == QUOTE_STRINGS))
-        {
+        if (to_float) {
             PyObject *tmp = PyNumber_Float(field);
             Py_DECREF(field);
             if (tmp == NULL) {
@@ -673,6 +756,22 @@ parse_save_field(ReaderObj *self)
             field = tmp;
         }
         self->field_len = 0;
+        if (type != NULL) {
+            PyObject *tmp;
+            if (type == (PyObject *)&PyLong_Type) {
+                tmp = PyNumber_Long(field);
+            }
+            else if (type == (PyObject *)&PyFloat_Type) {
+                tmp = PyNumber_Float(field);
+            }
+            else {
+                tmp = PyObject_CallOneArg(type, field);
+            }
+            Py_SETREF(field, tmp);
+            if (field == NULL) {
+                return -1;
+            }
+        }
     }
     if (PyList_Append(self->fields, field) < 0) {
         Py_DECREF(field);
@@ -996,6 +1095,7 @@ Reader_traverse(ReaderObj *self, visitproc visit, void *arg)
     Py_VISIT(self->dialect);
     Py_VISIT(self->input_iter);
     Py_VISIT(self->fields);
+    Py_VISIT(self->field_types);
     Py_VISIT(Py_TYPE(self));
     return 0;
 }
@@ -1006,6 +1106,7 @@ Reader_clear(ReaderObj *self)
     Py_CLEAR(self->dialect);
     Py_CLEAR(self->input_iter);
     Py_CLEAR(self->fields);
+    Py_CLEAR(self->field_types);
     return 0;
 }
 
@@ -1016,7 +1117,150 @@ PyDoc_STRVAR(Reader_Type_doc,
 "in CSV format.\n"
 );
 
+static PyObject *
+reader_transpose(_csvstate *module_state, PyObject *rows)
+{
+    /* Return the list of columns of rows, skipping empty rows */
+    Py_ssize_t nrows = PyList_GET_SIZE(rows);
+    Py_ssize_t ncols = -1;
+    Py_ssize_t i, j;
+    PyObject *columns;
+
+    for (i = 0; i < nrows; i++) {
+        Py_ssize_t len = PyList_GET_SIZE(PyList_GET_ITEM(rows, i));
+        if (len == 0) {
+            continue;
+        }
+        if (ncols < 0) {
+            ncols = len;
+        }
+        else if (len != ncols) {
+            PyErr_Format(module_state->error_obj,
+                         "expected %zd fields, got %zd", ncols, len);
+            return NULL;
+        }
+    }
+    if (ncols < 0) {
+        return PyList_New(0);
+    }
+    columns = PyList_New(ncols);
+    if (columns == NULL) {
+        return NULL;
+    }
+    for (j = 0; j < ncols; j++) {
+        PyObject *column = PyList_New(0);
+        if (column == NULL) {
+            Py_DECREF(columns);
+            return NULL;
+        }
+        PyList_SET_ITEM(columns, j, column);
+    }
+    for (i = 0; i < nrows; i++) {
+        PyObject *row = PyList_GET_ITEM(rows, i);
+        if (PyList_GET_SIZE(row) == 0) {
+            continue;
+        }
+        for (j = 0; j < ncols; j++) {
+            if (PyList_Append(PyList_GET_ITEM(columns, j),
+                              PyList_GET_ITEM(row, j)) < 0)
+            {
+                Py_DECREF(columns);
+                return NULL;
+            }
+        }
+    }
+    return columns;
+}
+
+/*[clinic input]
+_csv.Reader.read_batch
+
+    size: Py_ssize_t
+    *
+    types: object = None
+    columnar: bool = False
+
+Read up to size records and return them as a list of rows.
+
+The list is empty at the end of the input.
+
+types is a sequence of callables used to convert the fields of the
+corresponding columns, or None to keep them as strings.  int and float
+are converted without calling them.  If columnar is true, return a list
+of columns instead, skipping empty rows.
+
+If an error is raised, the records read by this call are lost.
+[clinic start generated code]*/
+
+static PyObject *
+_csv_Reader_read_batch_impl(ReaderObj *self, Py_ssize_t size,
+                            PyObject *types, int columnar)
+/*[clinic end generated code: output=6fddd927a29a8b1b input=c3fe277f8395ddef]*/
+{
+    PyObject *rows, *row;
+
+    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
+                                                   "Reader.read_batch");
+    if (module_state == NULL) {
+        return NULL;
+    }
+    if (size < 0) {
+        PyErr_SetString(PyExc_ValueError, "size must be non-negative");
+        return NULL;
+    }
+    if (self->field_types != NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "read_batch() called recursively");
+        return NULL;
+    }
+    if (types != Py_None) {
+        self->field_types = PySequence_Tuple(types);
+        if (self->field_types == NULL) {
+            return NULL;
+        }
+        for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(self->field_types); i++) {
+            PyObject *type = PyTuple_GET_ITEM(self->field_types, i);
+            if (type != Py_None && !PyCallable_Check(type)) {
+                PyErr_Format(PyExc_TypeError,
+                             "types must contain callables or None, "
+                             "not %.200s", Py_TYPE(type)->tp_name);
+                Py_CLEAR(self->field_types);
+                return NULL;
+            }
+        }
+    }
+    rows = PyList_New(0);
+    if (rows == NULL) {
+        goto error;
+    }
+    while (PyList_GET_SIZE(rows) < size) {
+        row = Reader_iternext(self);
+        if (row == NULL) {
+            if (PyErr_Occurred()) {
+                goto error;
+            }
+            break;
+        }
+        if (PyList_Append(rows, row) < 0) {
+            Py_DECREF(row);
+            goto error;
+        }
+        Py_DECREF(row);
+    }
+    Py_CLEAR(self->field_types);
+    if (columnar) {
+        Py_SETREF(rows, reader_transpose(module_state, rows));
+    }
+    return rows;
+
+error:
+    Py_CLEAR(self->field_types);
+    Py_XDECREF(rows);
+    return NULL;
+}
+
 static struct PyMethodDef Reader_methods[] = {
+    _CSV_READER_READ_BATCH_METHODDEF
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -1067,6 +1311,7 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->field_types = NULL;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
@@ -24,8 +24,16 @@ typedef struct _PyScannerObject {
     PyObject *parse_float;
     PyObject *parse_int;
     PyObject *parse_constant;
+    /* If cache_keys is true, the key strings of objects and the keys of
+       the objects with a given first key, kept between calls. */
+    PyObject *memo;
+    PyObject *shapes;
 } PyScannerObject;
 
+/* The key caches of a scanner are emptied when they grow beyond this
+   number of entries. */
+#define SCANNER_CACHE_SIZE 4096
+
 static PyMemberDef scanner_members[] = {
     {"strict", Py_T_BOOL, offsetof(PyScannerObject, strict), Py_READONLY, "strict"},
     {"object_hook", _Py_T_OBJECT, offsetof(PyScannerObject, object_hook), Py_READONLY, "object_hook"},
@@ -50,6 +58,22 @@ typedef struct _PyEncoderObject {
     PyCFunction fast_encode;
 } PyEncoderObject;
 
+/* The state of a single call of an encoder. */
+typedef struct {
+    _PyUnicodeWriter writer;
+    /* [newline_indent, separator, newline_indent, ...] for the nesting
+       levels seen so far, or NULL if not indenting; see
+       encoder_get_item_separator(). */
+    PyObject *indent_cache;
+    /* Callable the output is passed to in chunks, or NULL if the whole
+       output is accumulated in writer. */
+    PyObject *write;
+} EncoderState;
+
+/* When streaming, the output is passed to write() in chunks of at least
+   this many characters (except for the last one). */
+#define ENCODER_CHUNK_SIZE (64 * 1024)
+
 static PyMemberDef encoder_members[] = {
     {"markers", _Py_T_OBJECT, offsetof(PyEncoderObject, markers), Py_READONLY, "markers"},
     {"default", _Py_T_OBJECT, offsetof(PyEncoderObject, defaultfn), Py_READONLY, "default"},
@@ -85,11 +109,11 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyEncoderObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *seq, Py_ssize_t indent_level);
+encoder_listencode_list(PyEncoderObject *s, EncoderState *state, PyObject *seq, Py_ssize_t indent_level);
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *obj, Py_ssize_t indent_level);
+encoder_listencode_obj(PyEncoderObject *s, EncoderState *state, PyObject *obj, Py_ssize_t indent_level);
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *dct, Py_ssize_t indent_level);
+encoder_listencode_dict(PyEncoderObject *s, EncoderState *state, PyObject *dct, Py_ssize_t indent_level);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -630,6 +654,8 @@ scanner_traverse(PyScannerObject *self, visitproc visit, void *arg)
     Py_VISIT(self->parse_float);
     Py_VISIT(self->parse_int);
     Py_VISIT(self->parse_constant);
+    Py_VISIT(self->memo);
+    Py_VISIT(self->shapes);
     return 0;
 }
 
@@ -641,9 +667,87 @@ scanner_clear(PyScannerObject *self)
     Py_CLEAR(self->parse_float);
     Py_CLEAR(self->parse_int);
     Py_CLEAR(self->parse_constant);
+    Py_CLEAR(self->memo);
+    Py_CLEAR(self->shapes);
     return 0;
 }
 
+static int
+_match_key_unicode(PyObject *pystr, Py_ssize_t idx, PyObject *key,
+                   Py_ssize_t *next_idx_ptr)
+{
+    /* Return 1 if the JSON string starting at the index idx of pystr (just
+    after the opening quote) is the plain string key, and 0 otherwise.
+    key must not contain quotes, backslashes and control characters.
+    *next_idx_ptr is a return-by-reference index to the first character
+        after the closing quote.
+    */
+    Py_ssize_t len = PyUnicode_GET_LENGTH(key);
+    int kind = PyUnicode_KIND(pystr);
+    const void *str = PyUnicode_DATA(pystr);
+
+    if (idx + len >= PyUnicode_GET_LENGTH(pystr) ||
+        PyUnicode_READ(kind, str, idx + len) != '"')
+    {
+        return 0;
+    }
+    if (PyUnicode_KIND(key) == kind) {
+        if (memcmp((const char *)str + idx * kind, PyUnicode_DATA(key),
+                   len * kind) != 0)
+        {
+            return 0;
+        }
+    }
+    else {
+        int key_kind = PyUnicode_KIND(key);
+        const void *key_str = PyUnicode_DATA(key);
+        for (Py_ssize_t i = 0; i < len; i++) {
+            if (PyUnicode_READ(kind, str, idx + i) !=
+                PyUnicode_READ(key_kind, key_str, i))
+            {
+                return 0;
+            }
+        }
+    }
+    *next_idx_ptr = idx + len + 1;
+    return 1;
+}
+
+static int
+_record_shape(PyScannerObject *s, PyObject *first_key, PyObject *dct)
+{
+    /* Remember the keys of dct, so that the next object starting with
+    first_key can be presized and its keys matched without decoding
+    them.  Objects with keys which can not be matched are skipped. */
+    PyObject *keys = PyDict_Keys(dct);
+    if (keys == NULL) {
+        return -1;
+    }
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(keys); i++) {
+        PyObject *key = PyList_GET_ITEM(keys, i);
+        int kind = PyUnicode_KIND(key);
+        const void *str = PyUnicode_DATA(key);
+        for (Py_ssize_t j = 0; j < PyUnicode_GET_LENGTH(key); j++) {
+            Py_UCS4 c = PyUnicode_READ(kind, str, j);
+            if (c < 0x20 || c == '"' || c == '\\') {
+                Py_DECREF(keys);
+                return 0;
+            }
+        }
+    }
+    PyObject *shape = PyList_AsTuple(keys);
+    Py_DECREF(keys);
+    if (shape == NULL) {
+        return -1;
+    }
+    if (PyDict_GET_SIZE(s->shapes) >= SCANNER_CACHE_SIZE) {
+        PyDict_Clear(s->shapes);
+    }
+    int rv = PyDict_SetItem(s->shapes, first_key, shape);
+    Py_DECREF(shape);
+    return rv;
+}
+
 static PyObject *
 _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
 {
@@ -660,6 +764,10 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     PyObject *val = NULL;
     PyObject *rval = NULL;
     PyObject *key = NULL;
+    PyObject *first_key = NULL;
+    PyObject *shape = NULL;
+    Py_ssize_t nkeys = 0;
+    int shape_matched = 1;
     int has_pairs_hook = (s->object_pairs_hook != Py_None);
     Py_ssize_t next_idx;
     Py_ssize_t comma_idx;
@@ -668,11 +776,13 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     kind = PyUnicode_KIND(pystr);
     end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
 
+    /* With cache_keys, the dict is only created after reading the first
+       key, so that it can be presized for the shape starting with it. */
     if (has_pairs_hook)
         rval = PyList_New(0);
-    else
+    else if (s->shapes == NULL)
         rval = PyDict_New();
-    if (rval == NULL)
+    if (rval == NULL && s->shapes == NULL)
         return NULL;
 
     /* skip whitespace after { */
@@ -688,13 +798,40 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
                 raise_errmsg("Expecting property name enclosed in double quotes", pystr, idx);
                 goto bail;
             }
-            key = scanstring_unicode(pystr, idx + 1, s->strict, &next_idx);
-            if (key == NULL)
-                goto bail;
-            if (PyDict_SetDefaultRef(memo, key, key, &memokey) < 0) {
-                goto bail;
+            if (shape != NULL && nkeys < PyTuple_GET_SIZE(shape) &&
+                _match_key_unicode(pystr, idx + 1,
+                                   PyTuple_GET_ITEM(shape, nkeys), &next_idx))
+            {
+                key = Py_NewRef(PyTuple_GET_ITEM(shape, nkeys));
+            }
+            else {
+                shape_matched = 0;
+                key = scanstring_unicode(pystr, idx + 1, s->strict, &next_idx);
+                if (key == NULL)
+                    goto bail;
+                if (s->memo != NULL &&
+                    PyDict_GET_SIZE(s->memo) >= SCANNER_CACHE_SIZE)
+                {
+                    PyDict_Clear(s->memo);
+                }
+                if (PyDict_SetDefaultRef(memo, key, key, &memokey) < 0) {
+                    goto bail;
+                }
+                Py_SETREF(key, memokey);
+            }
+            if (nkeys++ == 0 && s->shapes != NULL) {
+                first_key = Py_NewRef(key);
+                if (PyDict_GetItemRef(s->shapes, key, &shape) < 0) {
+                    goto bail;
+                }
+                shape_matched = (shape != NULL);
+                if (rval == NULL) {
+                    rval = _PyDict_NewPresized(
+                        shape != NULL ? PyTuple_GET_SIZE(shape) : 0);
+                    if (rval == NULL)
+                        goto bail;
+                }
             }
-            Py_SETREF(key, memokey);
             idx = next_idx;
 
             /* skip whitespace between key and : delimiter, read :, skip whitespace */
@@ -756,6 +893,21 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
 
     *next_idx_ptr = idx + 1;
 
+    if (s->shapes != NULL && !has_pairs_hook) {
+        if (rval == NULL) {
+            /* empty object */
+            rval = PyDict_New();
+            if (rval == NULL)
+                goto bail;
+        }
+        else if (!shape_matched || nkeys != PyTuple_GET_SIZE(shape)) {
+            if (_record_shape(s, first_key, rval) < 0)
+                goto bail;
+        }
+    }
+    Py_XDECREF(first_key);
+    Py_XDECREF(shape);
+
     if (has_pairs_hook) {
         val = PyObject_CallOneArg(s->object_pairs_hook, rval);
         Py_DECREF(rval);
@@ -773,6 +925,8 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     Py_XDECREF(key);
     Py_XDECREF(val);
     Py_XDECREF(rval);
+    Py_XDECREF(first_key);
+    Py_XDECREF(shape);
     return NULL;
 }
 
@@ -1123,9 +1277,15 @@ scanner_call(PyScannerObject *self, PyObject *args, PyObject *kwds)
         return NULL;
     }
 
-    PyObject *memo = PyDict_New();
-    if (memo == NULL) {
-        return NULL;
+    PyObject *memo = self->memo;
+    if (memo != NULL) {
+        Py_INCREF(memo);
+    }
+    else {
+        memo = PyDict_New();
+        if (memo == NULL) {
+            return NULL;
+        }
     }
     rval = scan_once_unicode(self, memo, pystr, idx, &next_idx);
     Py_DECREF(memo);
@@ -1140,6 +1300,7 @@ scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     PyScannerObject *s;
     PyObject *ctx;
     PyObject *strict;
+    PyObject *cache_keys;
     static char *kwlist[] = {"context", NULL};
 
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "O:make_scanner", kwlist, &ctx))
@@ -1173,6 +1334,22 @@ scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->parse_constant = PyObject_GetAttrString(ctx, "parse_constant");
     if (s->parse_constant == NULL)
         goto bail;
+    if (PyObject_GetOptionalAttrString(ctx, "cache_keys", &cache_keys) < 0)
+        goto bail;
+    if (cache_keys != NULL) {
+        int rv = PyObject_IsTrue(cache_keys);
+        Py_DECREF(cache_keys);
+        if (rv < 0)
+            goto bail;
+        if (rv) {
+            s->memo = PyDict_New();
+            if (s->memo == NULL)
+                goto bail;
+            s->shapes = PyDict_New();
+            if (s->shapes == NULL)
+                goto bail;
+        }
+    }
 
     return (PyObject *)s;
 
@@ -1224,6 +1401,12 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
                      "not %.200s", Py_TYPE(markers)->tp_name);
         return NULL;
     }
+    if (indent != Py_None && !PyUnicode_Check(indent)) {
+        PyErr_Format(PyExc_TypeError,
+                     "make_encoder() argument 4 must be str or None, "
+                     "not %.200s", Py_TYPE(indent)->tp_name);
+        return NULL;
+    }
 
     s = (PyEncoderObject *)type->tp_alloc(type, 0);
     if (s == NULL)
@@ -1251,30 +1434,151 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     return (PyObject *)s;
 }
 
+static PyObject *
+encoder_create_indent_cache(PyEncoderObject *s, Py_ssize_t indent_level)
+{
+    /* Return a new indent cache, holding the newline indent of the
+       initial indentation level. */
+    PyObject *newline_indent = PyUnicode_FromOrdinal('\n');
+    if (newline_indent != NULL && indent_level > 0) {
+        PyUnicode_AppendAndDel(&newline_indent,
+                               PySequence_Repeat(s->indent, indent_level));
+    }
+    if (newline_indent == NULL) {
+        return NULL;
+    }
+    PyObject *indent_cache = PyList_New(1);
+    if (indent_cache == NULL) {
+        Py_DECREF(newline_indent);
+        return NULL;
+    }
+    PyList_SET_ITEM(indent_cache, 0, newline_indent);
+    return indent_cache;
+}
+
+static PyObject *
+encoder_get_item_separator(PyEncoderObject *s, EncoderState *state,
+                           Py_ssize_t indent_level)
+{
+    /* Return a borrowed reference to the item separator of the nesting
+       level indent_level (relative to the initial level), extending the
+       indent cache if this level was not seen before.  The newline indent
+       of the level is at index indent_level * 2 of the cache. */
+    PyObject *indent_cache = state->indent_cache;
+    assert(indent_level > 0);
+    if (indent_level * 2 > PyList_GET_SIZE(indent_cache)) {
+        assert(indent_level * 2 == PyList_GET_SIZE(indent_cache) + 1);
+        PyObject *newline_indent = PyUnicode_Concat(
+            PyList_GET_ITEM(indent_cache, indent_level * 2 - 2), s->indent);
+        if (newline_indent == NULL) {
+            return NULL;
+        }
+        PyObject *separator = PyUnicode_Concat(s->item_separator,
+                                               newline_indent);
+        if (separator == NULL ||
+            PyList_Append(indent_cache, separator) < 0 ||
+            PyList_Append(indent_cache, newline_indent) < 0)
+        {
+            Py_XDECREF(separator);
+            Py_DECREF(newline_indent);
+            return NULL;
+        }
+        Py_DECREF(separator);
+        Py_DECREF(newline_indent);
+    }
+    return PyList_GET_ITEM(indent_cache, indent_level * 2 - 1);
+}
+
+static int
+encoder_write_newline_indent(EncoderState *state, Py_ssize_t indent_level)
+{
+    assert(indent_level * 2 < PyList_GET_SIZE(state->indent_cache));
+    return _PyUnicodeWriter_WriteStr(
+        &state->writer, PyList_GET_ITEM(state->indent_cache, indent_level * 2));
+}
+
+static void
+encoder_init_writer(EncoderState *state)
+{
+    _PyUnicodeWriter_Init(&state->writer);
+    state->writer.overallocate = 1;
+    if (state->write != NULL) {
+        state->writer.min_length = ENCODER_CHUNK_SIZE;
+    }
+}
+
+static int
+encoder_flush(EncoderState *state)
+{
+    /* Pass the accumulated output to write() and start a new chunk */
+    PyObject *chunk, *res;
+
+    assert(state->write != NULL);
+    chunk = _PyUnicodeWriter_Finish(&state->writer);
+    encoder_init_writer(state);
+    if (chunk == NULL) {
+        return -1;
+    }
+    res = PyObject_CallOneArg(state->write, chunk);
+    Py_DECREF(chunk);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return 0;
+}
+
+static inline int
+encoder_maybe_flush(EncoderState *state)
+{
+    if (state->write != NULL && state->writer.pos >= ENCODER_CHUNK_SIZE) {
+        return encoder_flush(state);
+    }
+    return 0;
+}
+
 static PyObject *
 encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
 {
     /* Python callable interface to encode_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
+    static char *kwlist[] = {"obj", "_current_indent_level", "write", NULL};
     PyObject *obj, *result;
+    PyObject *write = Py_None;
     Py_ssize_t indent_level;
-    _PyUnicodeWriter writer;
+    EncoderState state;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-        &obj, &indent_level))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|O:_iterencode", kwlist,
+        &obj, &indent_level, &write))
         return NULL;
 
-    _PyUnicodeWriter_Init(&writer);
-    writer.overallocate = 1;
+    state.indent_cache = NULL;
+    state.write = write != Py_None ? write : NULL;
+    if (self->indent != Py_None) {
+        state.indent_cache = encoder_create_indent_cache(self, indent_level);
+        if (state.indent_cache == NULL) {
+            return NULL;
+        }
+    }
+    encoder_init_writer(&state);
 
-    if (encoder_listencode_obj(self, &writer, obj, indent_level)) {
-        _PyUnicodeWriter_Dealloc(&writer);
+    if (encoder_listencode_obj(self, &state, obj, 0)) {
+        _PyUnicodeWriter_Dealloc(&state.writer);
+        Py_XDECREF(state.indent_cache);
         return NULL;
     }
+    Py_XDECREF(state.indent_cache);
+
+    if (state.write != NULL) {
+        if (state.writer.pos > 0 && encoder_flush(&state) < 0) {
+            return NULL;
+        }
+        _PyUnicodeWriter_Dealloc(&state.writer);
+        Py_RETURN_NONE;
+    }
 
     result = PyTuple_New(1);
     if (result == NULL ||
-            PyTuple_SetItem(result, 0, _PyUnicodeWriter_Finish(&writer)) < 0) {
+            PyTuple_SetItem(result, 0, _PyUnicodeWriter_Finish(&state.writer)) < 0) {
         Py_XDECREF(result);
         return NULL;
     }
@@ -1357,10 +1661,11 @@ _steal_accumulate(_PyUnicodeWriter *writer, PyObject *stolen)
 }
 
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
+encoder_listencode_obj(PyEncoderObject *s, EncoderState *state,
                        PyObject *obj, Py_ssize_t indent_level)
 {
     /* Encode Python object obj to a JSON term */
+    _PyUnicodeWriter *writer = &state->writer;
     PyObject *newobj;
     int rv;
 
@@ -1394,14 +1699,14 @@ encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
     else if (PyList_Check(obj) || PyTuple_Check(obj)) {
         if (_Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_list(s, writer, obj, indent_level);
+        rv = encoder_listencode_list(s, state, obj, indent_level);
         _Py_LeaveRecursiveCall();
         return rv;
     }
     else if (PyDict_Check(obj)) {
         if (_Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_dict(s, writer, obj, indent_level);
+        rv = encoder_listencode_dict(s, state, obj, indent_level);
         _Py_LeaveRecursiveCall();
         return rv;
     }
@@ -1435,7 +1740,7 @@ encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
             Py_XDECREF(ident);
             return -1;
         }
-        rv = encoder_listencode_obj(s, writer, newobj, indent_level);
+        rv = encoder_listencode_obj(s, state, newobj, indent_level);
         _Py_LeaveRecursiveCall();
 
         Py_DECREF(newobj);
@@ -1455,9 +1760,11 @@ encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
 }
 
 static int
-encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *first,
-                         PyObject *key, PyObject *value, Py_ssize_t indent_level)
+encoder_encode_key_value(PyEncoderObject *s, EncoderState *state, bool *first,
+                         PyObject *key, PyObject *value,
+                         PyObject *item_separator, Py_ssize_t indent_level)
 {
+    _PyUnicodeWriter *writer = &state->writer;
     PyObject *keystr = NULL;
     PyObject *encoded;
 
@@ -1493,7 +1800,7 @@ encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *fir
         *first = false;
     }
     else {
-        if (_PyUnicodeWriter_WriteStr(writer, s->item_separator) < 0) {
+        if (_PyUnicodeWriter_WriteStr(writer, item_separator) < 0) {
             Py_DECREF(keystr);
             return -1;
         }
@@ -1511,17 +1818,19 @@ encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *fir
     if (_PyUnicodeWriter_WriteStr(writer, s->key_separator) < 0) {
         return -1;
     }
-    if (encoder_listencode_obj(s, writer, value, indent_level) < 0) {
+    if (encoder_listencode_obj(s, state, value, indent_level) < 0) {
         return -1;
     }
-    return 0;
+    return encoder_maybe_flush(state);
 }
 
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
+encoder_listencode_dict(PyEncoderObject *s, EncoderState *state,
                         PyObject *dct, Py_ssize_t indent_level)
 {
     /* Encode Python dict dct a JSON term */
+    _PyUnicodeWriter *writer = &state->writer;
+    PyObject *item_separator = s->item_separator;
     PyObject *ident = NULL;
     PyObject *items = NULL;
     PyObject *key, *value;
@@ -1550,13 +1859,13 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
         goto bail;
 
     if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
+        item_separator = encoder_get_item_separator(s, state, indent_level);
+        if (item_separator == NULL ||
+            encoder_write_newline_indent(state, indent_level) < 0)
+        {
+            goto bail;
+        }
     }
 
     if (s->sort_keys || !PyDict_CheckExact(dct)) {
@@ -1574,7 +1883,8 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
 
             key = PyTuple_GET_ITEM(item, 0);
             value = PyTuple_GET_ITEM(item, 1);
-            if (encoder_encode_key_value(s, writer, &first, key, value, indent_level) < 0)
+            if (encoder_encode_key_value(s, state, &first, key, value,
+                                         item_separator, indent_level) < 0)
                 goto bail;
         }
         Py_CLEAR(items);
@@ -1582,7 +1892,8 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
     } else {
         Py_ssize_t pos = 0;
         while (PyDict_Next(dct, &pos, &key, &value)) {
-            if (encoder_encode_key_value(s, writer, &first, key, value, indent_level) < 0)
+            if (encoder_encode_key_value(s, state, &first, key, value,
+                                         item_separator, indent_level) < 0)
                 goto bail;
         }
     }
@@ -1592,12 +1903,11 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
             goto bail;
         Py_CLEAR(ident);
     }
-    /* TODO DOES NOT RUN; dead code
     if (s->indent != Py_None) {
         indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
+        if (encoder_write_newline_indent(state, indent_level) < 0)
+            goto bail;
+    }
     if (_PyUnicodeWriter_WriteChar(writer, '}'))
         goto bail;
     return 0;
@@ -1609,9 +1919,11 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
 }
 
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
+encoder_listencode_list(PyEncoderObject *s, EncoderState *state,
                         PyObject *seq, Py_ssize_t indent_level)
 {
+    _PyUnicodeWriter *writer = &state->writer;
+    PyObject *item_separator = s->item_separator;
     PyObject *ident = NULL;
     PyObject *s_fast = NULL;
     Py_ssize_t i;
@@ -1644,21 +1956,23 @@ encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
     if (_PyUnicodeWriter_WriteChar(writer, '['))
         goto bail;
     if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
+        item_separator = encoder_get_item_separator(s, state, indent_level);
+        if (item_separator == NULL ||
+            encoder_write_newline_indent(state, indent_level) < 0)
+        {
+            goto bail;
+        }
     }
     for (i = 0; i < PySequence_Fast_GET_SIZE(s_fast); i++) {
         PyObject *obj = PySequence_Fast_GET_ITEM(s_fast, i);
         if (i) {
-            if (_PyUnicodeWriter_WriteStr(writer, s->item_separator))
+            if (_PyUnicodeWriter_WriteStr(writer, item_separator))
                 goto bail;
         }
-        if (encoder_listencode_obj(s, writer, obj, indent_level))
+        if (encoder_listencode_obj(s, state, obj, indent_level))
+            goto bail;
+        if (encoder_maybe_flush(state))
             goto bail;
     }
     if (ident != NULL) {
@@ -1667,12 +1981,11 @@ encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
         Py_CLEAR(ident);
     }
 
-    /* TODO: DOES NOT RUN
     if (s->indent != Py_None) {
         indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
+        if (encoder_write_newline_indent(state, indent_level) < 0)
+            goto bail;
+    }
     if (_PyUnicodeWriter_WriteChar(writer, ']'))
         goto bail;
     Py_DECREF(s_fast);
@@ -1721,7 +2034,7 @@ encoder_clear(PyEncoderObject *self)
     return 0;
 }
 
-PyDoc_STRVAR(encoder_doc, "_iterencode(obj, _current_indent_level) -> iterable");
+PyDoc_STRVAR(encoder_doc, "_iterencode(obj, _current_indent_level, write=None) -> iterable");
 
 static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_doc, (void *)encoder_doc},
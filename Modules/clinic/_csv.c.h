@@ -6,8 +6,102 @@ preserve
 #  include "pycore_gc.h"          // PyGC_Head
 #  include "pycore_runtime.h"     // _Py_ID()
 #endif
+#include "pycore_abstract.h"      // _PyNumber_Index()
 #include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
 
+PyDoc_STRVAR(_csv_Reader_read_batch__doc__,
+"read_batch($self, /, size, *, types=None, columnar=False)\n"
+"--\n"
+"\n"
+"Read up to size records and return them as a list of rows.\n"
+"\n"
+"The list is empty at the end of the input.\n"
+"\n"
+"types is a sequence of callables used to convert the fields of the\n"
+"corresponding columns, or None to keep them as strings.  int and float\n"
+"are converted without calling them.  If columnar is true, return a list\n"
+"of columns instead, skipping empty rows.\n"
+"\n"
+"If an error is raised, the records read by this call are lost.");
+
+#define _CSV_READER_READ_BATCH_METHODDEF    \
+    {"read_batch", _PyCFunction_CAST(_csv_Reader_read_batch), METH_FASTCALL|METH_KEYWORDS, _csv_Reader_read_batch__doc__},
+
+static PyObject *
+_csv_Reader_read_batch_impl(ReaderObj *self, Py_ssize_t size,
+                            PyObject *types, int columnar);
+
+static PyObject *
+_csv_Reader_read_batch(ReaderObj *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(size), &_Py_ID(types), &_Py_ID(columnar), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"size", "types", "columnar", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "read_batch",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    Py_ssize_t size;
+    PyObject *types = Py_None;
+    int columnar = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[0]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        size = ival;
+    }
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    if (args[1]) {
+        types = args[1];
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    columnar = PyObject_IsTrue(args[2]);
+    if (columnar < 0) {
+        goto exit;
+    }
+skip_optional_kwonly:
+    return_value = _csv_Reader_read_batch_impl(self, size, types, columnar);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(_csv_list_dialects__doc__,
 "list_dialects($module, /)\n"
 "--\n"
@@ -206,4 +300,4 @@ skip_optional_pos:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=9ec59717f5414d8b input=a9049054013a1b77]*/
+/*[clinic end generated code: output=5bf7cf59b5de3c12 input=a9049054013a1b77]*/
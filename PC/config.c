@@ -43,6 +43,7 @@ extern PyObject* PyInit_itertools(void);
 extern PyObject* PyInit__collections(void);
 extern PyObject* PyInit__heapq(void);
 extern PyObject* PyInit__bisect(void);
+extern PyObject* PyInit__copy(void);
 extern PyObject* PyInit__symtable(void);
 extern PyObject* PyInit_mmap(void);
 extern PyObject* PyInit__csv(void);
@@ -120,6 +121,7 @@ struct _inittab _PyImport_Inittab[] = {
     {"_weakref", PyInit__weakref},
     {"_random", PyInit__random},
     {"_bisect", PyInit__bisect},
+    {"_copy", PyInit__copy},
     {"_heapq", PyInit__heapq},
     {"_lsprof", PyInit__lsprof},
     {"itertools", PyInit_itertools},
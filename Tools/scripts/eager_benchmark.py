@@ -0,0 +1,87 @@
+"""Compare lazy and eager task creation in asyncio.TaskGroup and gather().
+
+Usage: python Tools/scripts/eager_benchmark.py [-n REQUESTS] [-H HIT_RATE]
+                                               [-R REPEAT]
+
+Each request handler looks up a key in a cache, and only on a cache miss
+awaits a simulated backend call (asyncio.sleep(0)), so most handlers
+complete without suspending.  REQUESTS handlers are run in batches of
+100 concurrent tasks, created by:
+
+  taskgroup   asyncio.TaskGroup() and TaskGroup(eager_start=True)
+  gather      asyncio.gather() and gather(eager_start=True)
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+BATCH = 100
+
+
+async def handler(cache, key):
+    try:
+        return cache[key]
+    except KeyError:
+        await asyncio.sleep(0)
+        return key
+
+
+async def bench_taskgroup(keys, cache, eager_start):
+    for i in range(0, len(keys), BATCH):
+        async with asyncio.TaskGroup(eager_start=eager_start) as tg:
+            for key in keys[i:i + BATCH]:
+                tg.create_task(handler(cache, key))
+
+
+async def bench_gather(keys, cache, eager_start):
+    for i in range(0, len(keys), BATCH):
+        await asyncio.gather(*(handler(cache, key)
+                               for key in keys[i:i + BATCH]),
+                             eager_start=eager_start)
+
+
+BENCHMARKS = {
+    'taskgroup': bench_taskgroup,
+    'gather': bench_gather,
+}
+
+
+def run(bench, keys, cache, eager_start, repeat):
+    best = float('inf')
+    with asyncio.Runner() as runner:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            runner.run(bench(keys, cache, eager_start))
+            best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--requests', type=int, default=100_000,
+                        help='number of requests (default: 100000)')
+    parser.add_argument('-H', '--hit-rate', type=float, default=0.9,
+                        help='ratio of requests served by the cache '
+                             '(default: 0.9)')
+    parser.add_argument('-R', '--repeat', type=int, default=3,
+                        help='number of runs of each workload, the best '
+                             'one is reported (default: 3)')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    keys = [(i, rnd.random() < args.hit_rate) for i in range(args.requests)]
+    cache = {key: key for key in keys if key[1]}
+
+    print(f"{args.requests} requests, cache hit rate {args.hit_rate:.0%}")
+    print(f"{'workload':<12} {'lazy':>10} {'eager':>10}")
+    for name, bench in BENCHMARKS.items():
+        lazy = run(bench, keys, cache, False, args.repeat)
+        eager = run(bench, keys, cache, True, args.repeat)
+        print(f"{name:<12} {lazy:>9.3f}s {eager:>9.3f}s "
+              f"({lazy / eager:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
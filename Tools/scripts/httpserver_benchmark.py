@@ -0,0 +1,138 @@
+"""Compare the throughput of ThreadingHTTPServer and AsyncHTTPServer.
+
+Usage: python Tools/scripts/httpserver_benchmark.py [-c CLIENTS] [-i IDLE]
+                                                    [-d SECONDS]
+
+Each server is started in a background thread.  IDLE persistent
+connections are opened and left idle (they hold one thread each on the
+threaded server), then CLIENTS threads send GET requests on persistent
+connections for SECONDS seconds.  The number of requests per second is
+reported for each server.
+"""
+
+import argparse
+import asyncio
+import http.client
+import http.server
+import socket
+import threading
+import time
+
+
+BODY = b'x' * 1024
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately by the threaded server;
+    # avoid measuring delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_threading_server():
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.request_queue_size = 1024
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.start()
+
+    def stop():
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+    return httpd.server_address, stop
+
+
+def start_async_server():
+    started = threading.Event()
+    state = {}
+
+    async def serve():
+        loop = asyncio.get_running_loop()
+        state['stop'] = stopped = loop.create_future()
+        state['loop'] = loop
+        async with http.server.AsyncHTTPServer(('127.0.0.1', 0),
+                                               Handler) as httpd:
+            state['address'] = httpd.server_address
+            started.set()
+            await stopped
+
+    thread = threading.Thread(target=asyncio.run, args=(serve(),))
+    thread.start()
+    started.wait()
+
+    def stop():
+        state['loop'].call_soon_threadsafe(state['stop'].set_result, None)
+        thread.join()
+    return state['address'], stop
+
+
+def open_idle_connections(address, count):
+    conns = []
+    for _ in range(count):
+        sock = socket.create_connection(address[:2])
+        sock.sendall(b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        response = http.client.HTTPResponse(sock)
+        response.begin()
+        response.read()
+        conns.append(sock)
+    return conns
+
+
+def run_clients(address, clients, duration):
+    counts = [0] * clients
+    deadline = time.perf_counter() + duration
+
+    def client(index):
+        conn = http.client.HTTPConnection(*address[:2])
+        while time.perf_counter() < deadline:
+            conn.request('GET', '/')
+            conn.getresponse().read()
+            counts[index] += 1
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(i,))
+               for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-c', '--clients', type=int, default=8,
+                        help='number of active clients (default: 8)')
+    parser.add_argument('-i', '--idle', type=int, default=500,
+                        help='number of idle connections (default: 500)')
+    parser.add_argument('-d', '--duration', type=float, default=3.0,
+                        help='duration of each run (default: 3.0)')
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients, {args.idle} idle connections")
+    for name, start in (('ThreadingHTTPServer', start_threading_server),
+                        ('AsyncHTTPServer', start_async_server)):
+        address, stop = start()
+        idle = open_idle_connections(address, args.idle)
+        threads = threading.active_count()
+        try:
+            rate = run_clients(address, args.clients, args.duration)
+        finally:
+            for sock in idle:
+                sock.close()
+            stop()
+        print(f"{name:<20} {rate:>10.0f} requests/s "
+              f"({threads} threads with idle connections open)")
+
+
+if __name__ == '__main__':
+    main()
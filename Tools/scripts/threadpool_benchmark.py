@@ -0,0 +1,71 @@
+"""Compare ThreadPoolExecutor and WorkStealingThreadPoolExecutor.
+
+Usage: python Tools/scripts/threadpool_benchmark.py [-p PRODUCERS]
+                                                    [-w WORKERS] [-n CALLS]
+                                                    [-r REPEAT]
+
+PRODUCERS threads each submit CALLS trivial calls to a shared executor
+with WORKERS worker threads, then wait for all their futures.  The number
+of calls submitted and completed per second is reported for each
+executor, as the best of REPEAT runs.
+"""
+
+import argparse
+import concurrent.futures
+import threading
+import time
+
+
+def noop():
+    pass
+
+
+def run(executor_type, producers, workers, calls):
+    barrier = threading.Barrier(producers + 1)
+
+    def produce(executor):
+        barrier.wait()
+        fs = [executor.submit(noop) for _ in range(calls)]
+        concurrent.futures.wait(fs)
+
+    with executor_type(max_workers=workers) as executor:
+        # Start the worker threads before timing.
+        concurrent.futures.wait([executor.submit(time.sleep, 0.01)
+                                 for _ in range(workers)])
+        threads = [threading.Thread(target=produce, args=(executor,))
+                   for _ in range(producers)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    return producers * calls / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-p', '--producers', type=int, default=8,
+                        help='number of submitting threads (default: 8)')
+    parser.add_argument('-w', '--workers', type=int, default=8,
+                        help='number of worker threads (default: 8)')
+    parser.add_argument('-n', '--calls', type=int, default=20000,
+                        help='calls submitted by each producer '
+                             '(default: 20000)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs (default: 3)')
+    args = parser.parse_args()
+
+    print(f"{args.producers} producers, {args.workers} workers, "
+          f"{args.calls} calls per producer")
+    for executor_type in (concurrent.futures.ThreadPoolExecutor,
+                          concurrent.futures.WorkStealingThreadPoolExecutor):
+        rate = max(run(executor_type, args.producers, args.workers,
+                       args.calls)
+                   for _ in range(args.repeat))
+        print(f"{executor_type.__name__:<32} {rate:>10.0f} calls/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Compare asyncio timeout-heavy workloads with the heap and the timer wheel.
+
+Usage: python Tools/scripts/timer_benchmark.py [-n TIMERS] [-r RESOLUTION]
+                                               [-R REPEAT]
+
+Each workload is run on an event loop scheduling callbacks in a binary
+heap, then in a timer wheel with the given resolution:
+
+  call_later   schedule TIMERS callbacks with random delays, then cancel
+               them all
+  expire       schedule TIMERS callbacks with short random delays and
+               wait until they are all called
+  timeout      run TIMERS tasks which each await 10 asyncio.timeout()
+               blocks which never expire
+  wait_for     run TIMERS tasks which each await 10 asyncio.wait_for()
+               calls which never time out
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+
+def bench_call_later(loop, count):
+    rnd = random.Random(0)
+    callback = lambda: None
+    handles = [loop.call_later(rnd.uniform(1, 3600), callback)
+               for _ in range(count)]
+    for handle in handles:
+        handle.cancel()
+    # Let the loop process the cancelled handles
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+def bench_expire(loop, count):
+    rnd = random.Random(0)
+    done = loop.create_future()
+    remaining = count
+
+    def callback():
+        nonlocal remaining
+        remaining -= 1
+        if not remaining:
+            done.set_result(None)
+
+    for _ in range(count):
+        loop.call_later(rnd.uniform(0, 0.2), callback)
+    loop.run_until_complete(done)
+
+
+async def request_timeout():
+    for _ in range(10):
+        async with asyncio.timeout(30):
+            await asyncio.sleep(0)
+
+
+async def request_wait_for():
+    for _ in range(10):
+        await asyncio.wait_for(asyncio.sleep(0), 30)
+
+
+def bench_tasks(loop, count, request):
+    async def main():
+        await asyncio.gather(*(request() for _ in range(count)))
+    loop.run_until_complete(main())
+
+
+BENCHMARKS = {
+    'call_later': bench_call_later,
+    'expire': bench_expire,
+    'timeout': lambda loop, count: bench_tasks(loop, count, request_timeout),
+    'wait_for': lambda loop, count: bench_tasks(loop, count,
+                                                request_wait_for),
+}
+
+
+def run(bench, count, resolution, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.set_timer_wheel(resolution)
+            t0 = time.perf_counter()
+            bench(loop, count)
+            best = min(best, time.perf_counter() - t0)
+        finally:
+            loop.close()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--timers', type=int, default=100_000,
+                        help='number of timers or tasks (default: 100000)')
+    parser.add_argument('-r', '--resolution', type=float, default=0.001,
+                        help='resolution of the timer wheel in seconds '
+                             '(default: 0.001)')
+    parser.add_argument('-R', '--repeat', type=int, default=3,
+                        help='number of runs of each workload, the best '
+                             'one is reported (default: 3)')
+    args = parser.parse_args()
+
+    print(f"{args.timers} timers, timer wheel resolution "
+          f"{args.resolution * 1e3:g} ms")
+    print(f"{'workload':<12} {'heap':>10} {'wheel':>10}")
+    for name, bench in BENCHMARKS.items():
+        heap = run(bench, args.timers, None, args.repeat)
+        wheel = run(bench, args.timers, args.resolution, args.repeat)
+        print(f"{name:<12} {heap:>9.3f}s {wheel:>9.3f}s "
+              f"({heap / wheel:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()